@@ -12,24 +12,24 @@ def main():
     parser =  argparse.ArgumentParser(
         description="""Detect entries that do not share links with any other entry in the group. 
         These are software with the same name, but be completely different software.
-        The grouped entries are fetched from a JSON file and the disconnected entries are written 
-        to another JSON file."""
+        The grouped entries are streamed from a JSONL (or legacy JSON) file and the disconnected entries are written 
+        to a JSONL file."""
     )
 
     parser.add_argument(
         "--grouped-entries-file", "-g",
-        help=("Path to the file containing grouped entries. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.json'."),
+        help=("Path to the file containing grouped entries. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.jsonl'."),
         type=str,
         dest="grouped_entries_file",
-        default="data/grouped.json",
+        default="data/grouped.jsonl",
     )
 
     parser.add_argument(
         "--disconnected-entries-file", "-d",
-        help=("Path to the file containing disconnected entries. This is the output of the process. Default is 'data/disconnected.json'."),
+        help=("Path to the file containing disconnected entries. This is the output of the process. Default is 'data/disconnected.jsonl'."),
         type=str,
         dest="disconnected_entries_file",
-        default="data/disconnected.json",
+        default="data/disconnected.jsonl",
     )
 
     args = parser.parse_args()
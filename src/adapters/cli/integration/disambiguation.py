@@ -18,7 +18,7 @@ async def main():
 
     parser.add_argument(
         "--blocks-file", "-g",
-        help=("Path to the file containing blocks of records. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.json'."),
+        help=("Path to the file containing blocks of records. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.jsonl'."),
         type=str,
         dest="blocks_file",
         #default="data/blocks.json",
@@ -26,7 +26,7 @@ async def main():
 
     parser.add_argument(
         "--conflict-blocks-file", "-d",
-        help=("Path to the file containing conflict blocks. This is the output of the 'conflict_detection' process. Default is 'data/disconnected.json'."),
+        help=("Path to the file containing conflict blocks. This is the output of the 'conflict_detection' process. Default is 'data/disconnected.jsonl'."),
         type=str,
         dest="conflict_blocks_file",
         #default="data/conflict_blocks.json",
@@ -34,7 +34,7 @@ async def main():
 
     parser.add_argument(
         "--disambiguated-blocks-file", "-n",
-        help=("Path to the file where the disambiguated grouped entries and all other groups will be written. Default is 'data/disambiguated_grouped.json'."),
+        help=("Path to the file where the disambiguated grouped entries and all other groups will be written. Default is 'data/disambiguated_grouped.jsonl'."),
         type=str,
         dest="disambiguated_blocks_file"
     )
@@ -9,26 +9,26 @@ async def main():
 
     parser.add_argument(
         "--blocks-file", "-g",
-        help=("Path to the file containing blocks of records. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.json'."),
+        help=("Path to the file containing blocks of records. Generated by the grouping and recovery step of the integration. Default is 'data/grouped.jsonl'."),
         type=str,
         dest="blocks_file",
-        default="data/blocks.json",
+        default="data/blocks.jsonl",
     )
 
     parser.add_argument(
         "--conflict-blocks-file", "-d",
-        help=("Path to the file containing conflict blocks. This is the output of the process. Default is 'data/conflict_blocks.json'."),
+        help=("Path to the file containing conflict blocks. This is the output of the process. Default is 'data/conflict_blocks.jsonl'."),
         type=str,
         dest="conflict_blocks_file",
-        default="data/conflict_blocks.json",
+        default="data/conflict_blocks.jsonl",
     )
 
     parser.add_argument(
         "--disambiguated-blocks-file", "-d",
-        help=("Path to the file containing disambiguated blocks. This is the output of the process. Default is 'data/disambiguated_blocks.json'."),
+        help=("Path to the file containing disambiguated blocks. This is the output of the process. Default is 'data/disambiguated_blocks.jsonl'."),
         type=str,
         dest="disambiguated_blocks_file",
-        default="data/disambiguated_blocks.json",
+        default="data/disambiguated_blocks.jsonl",
     )
 
     parser.add_argument(
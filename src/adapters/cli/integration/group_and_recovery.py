@@ -11,15 +11,15 @@ logger = logging.getLogger("rs-etl-pipeline")
 def main():
     parser = argparse.ArgumentParser(
         description="""Group entries based on shared repository links and shared name and non-repository links. Entries, that must have been previously standardized,
-        are fetched from the MongoDB database. The grouped entries are written to a JSON file."""
+        are fetched from the MongoDB database. The grouped entries are written to a JSONL file, one block per line."""
     )
 
     parser.add_argument(
         "--grouped-entries-file", "-g",
-        help=("Path to the file containing grouped entries. This file is the output of the whole process. Default is 'data/grouped.json'."),
+        help=("Path to the file containing grouped entries. This file is the output of the whole process. Default is 'data/grouped.jsonl'."),
         type=str,
         dest="grouped_entries_file",
-        default="data/grouped.json",
+        default="data/grouped.jsonl",
     )
 
     parser.add_argument(
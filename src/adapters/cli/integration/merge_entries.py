@@ -11,11 +11,15 @@ def print_summary(summary):
 
     print("✨ Merging completed! ✨")
     print('----------- Summary -------------')
-    print(f"Iterated over {summary['N']} blocks.")
+    print(f"Iterated over {summary['N']} blocks in {summary['elapsed']:.1f} s ({summary['N'] / max(summary['elapsed'], 1e-9):.1f} blocks/s).")
     print(f" |")
     print(f" |-- Processed {summary['n_processed']} blocks.")
     print(f" |    |")
-    print(f" |    '-- Inserted {summary['n_inserted_entries']} entries in db.")
+    print(f" |    '-- Saved {summary['n_inserted_entries']} entries in db.")
+    print(f" |         |")
+    print(f" |         |-- New: {summary['n_new_tools']}")
+    print(f" |         |-- Updated: {summary['n_updated_tools']}")
+    print(f" |         '-- Failed: {summary['n_failed']}")
     print(f" |   ")
     print(f" '-- Still {summary['N'] - summary['n_processed']} blocks pending.")
     print(f"     |")
@@ -32,11 +36,27 @@ def main():
 
     parser.add_argument(
         "--disambiguated-blocks-file", "-n",
-        help=("Path to the file where the disambiguated grouped entries and all other groups will be written. Default is 'data/disambiguated_grouped.json'."),
+        help=("Path to the file where the disambiguated grouped entries and all other groups will be written. Default is 'data/disambiguated_grouped.jsonl'."),
         type=str,
         dest="disambiguated_blocks_file"
     )
 
+    parser.add_argument(
+        "--batch-size", "-b",
+        help=("Number of blocks whose entries are fetched, merged and written to the database together. Default is 200."),
+        type=int,
+        default=200,
+        dest="batch_size"
+    )
+
+    parser.add_argument(
+        "--workers", "-w",
+        help=("Number of worker processes used to merge the entries. Default is 1 (no parallelism)."),
+        type=int,
+        default=1,
+        dest="workers"
+    )
+
     parser.add_argument(
         "--env-file", "-e",
         help=("File containing environment variables to be set before running "),
@@ -53,7 +73,7 @@ def main():
 
     logger.info(f"Disambiguated blocks file: {args.disambiguated_blocks_file}")
     logger.info("Merging entries...")
-    summary = merge_and_save_blocks(args.disambiguated_blocks_file)
+    summary = merge_and_save_blocks(args.disambiguated_blocks_file, batch_size=args.batch_size, workers=args.workers)
     print_summary(summary)
     logger.info("Merging finished!")
 
@@ -16,6 +16,7 @@ possible sources : [
 Example of usage:
 python src/adapters/cli/transformation/transformation.py -e .env -s bioconda_recipes github
 python src/adapters/cli/transformation/transformation.py -e .env -s all
+python src/adapters/cli/transformation/transformation.py -e .env -s all --workers 8
 """
 import argparse
 import logging
@@ -60,6 +61,28 @@ def main():
         dest="sources"
     )
 
+    parser.add_argument(
+        "--no-bulk-write",
+        help=("Save each standardized entry individually instead of upserting each page of entries with a single bulk write."),
+        action="store_false",
+        dest="bulk_write"
+    )
+
+    parser.add_argument(
+        "--workers", "-w",
+        help=("Number of worker processes used to standardize the raw entries. Default is 1 (no parallelism)."),
+        type=int,
+        default=1,
+        dest="workers"
+    )
+
+    parser.add_argument(
+        "--incremental", "-i",
+        help=("Only transform raw entries that are new or changed since the last incremental run of each source, and report the entries whose raw entry was deleted. Run without this option after changing the standardizers."),
+        action="store_true",
+        dest="incremental"
+    )
+
     args = parser.parse_args()
 
     # Load the environment variables ------------------------------------------
@@ -86,7 +109,7 @@ def main():
 
     logger.info("Transforming raw data...")
 
-    transform_sources(sources=sources)
+    transform_sources(sources=sources, bulk_write=args.bulk_write, workers=args.workers, incremental=args.incremental)
 
     # Finish ------------------------------------------------------------------
     logger.info("Transformation finished!")
@@ -0,0 +1,236 @@
+import os
+import re
+import json
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from src.application.services import serialization
+
+WHITESPACE = re.compile(r"\s*")
+
+# Longest fragment of a literal, number or escape that can be cut at the end of the buffer (e.g. "\u00e")
+MAX_CUT_TOKEN = 6
+
+
+def is_truncated(error: json.JSONDecodeError) -> bool:
+    '''
+    Whether a decoding error can be caused by the end of the buffer (and fixed by reading more), rather than
+    by malformed JSON: it is in the last few characters, or in a string that runs until the end of the buffer.
+    '''
+    return error.pos >= len(error.doc) - MAX_CUT_TOKEN or error.msg.startswith("Unterminated string")
+
+
+def iter_json_object_items(path: str, chunk_size: int = 1 << 20) -> Iterator[Tuple[str, Any]]:
+    '''
+    Yields the (key, value) items of the JSON object in a file (e.g. the grouped entries), one at a time,
+    without loading the whole object. Only the item being parsed is kept in memory.
+    '''
+    decoder = json.JSONDecoder()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = ""
+        position = 0
+        eof = False
+
+        def fill():
+            # Reads at least as much as is already buffered, so that big values are re-parsed a few times at most
+            nonlocal buffer, position, eof
+            chunk = f.read(max(chunk_size, len(buffer) - position))
+            if not chunk:
+                eof = True
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        def next_char():
+            nonlocal position
+            while True:
+                position = WHITESPACE.match(buffer, position).end()
+                if position < len(buffer):
+                    return buffer[position]
+                if eof:
+                    raise ValueError(f"Unexpected end of file in {path}")
+                fill()
+
+        def expect(char):
+            nonlocal position
+            found = next_char()
+            if found != char:
+                raise ValueError(f"Expected '{char}' but found '{found}' in {path}")
+            position += 1
+
+        def decode():
+            nonlocal position
+            next_char()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    # only a value cut at the end of the buffer can be completed by reading more
+                    if eof or not is_truncated(e):
+                        raise
+                    fill()
+                    continue
+                if end == len(buffer) and not eof:
+                    # a number may continue in the next chunk
+                    fill()
+                    continue
+                position = end
+                return value
+
+        fill()
+        expect("{")
+        if next_char() == "}":
+            return
+        while True:
+            key = decode()
+            if not isinstance(key, str):
+                raise ValueError(f"Object keys must be strings in {path}")
+            expect(":")
+            yield key, decode()
+            if next_char() == "}":
+                return
+            expect(",")
+
+
+# ------------------------------------------------------------------
+# Block files: one {key: block} record per line (JSONL), as the blocks,
+# conflict blocks and disambiguated blocks files of the integration.
+# Files with another extension hold a single JSON object (legacy format).
+# ------------------------------------------------------------------
+
+# Key of the lines that mark a record as removed (see disambiguation.record_store)
+REMOVED = "__removed__"
+
+
+def is_jsonl(path: str) -> bool:
+    return path.endswith(".jsonl")
+
+
+def index_path(path: str) -> str:
+    return path + ".idx"
+
+
+def write_blocks(path: str, blocks: Iterable[Tuple[str, Any]], index: bool = False) -> int:
+    '''
+    Writes (key, block) pairs incrementally, one at a time, serialized as extended JSON (ObjectIds, dates; see serialization).
+    JSONL files get one {key: block} line per block, and other files a JSON object with one block per line.
+    - index: also write the offset index of a JSONL file (see BlockFile).
+
+    Returns the number of blocks written.
+    '''
+    offsets = {}
+    count = 0
+    offset = 0
+    with open(path, 'wb') as f:
+        if not is_jsonl(path):
+            f.write(b"{")
+        for key, block in blocks:
+            if is_jsonl(path):
+                line = serialization.dumpb({key: block}) + b"\n"
+                offsets[key] = [offset, len(line)]
+                offset += len(line)
+            else:
+                line = (b"," if count else b"") + b"\n" + serialization.dumpb(key) + b": " + serialization.dumpb(block)
+            f.write(line)
+            count += 1
+        if not is_jsonl(path):
+            f.write(b"\n}\n")
+
+    if index and is_jsonl(path):
+        save_block_index(path, offsets)
+    return count
+
+
+def save_block_index(path: str, offsets: Dict[str, list]):
+    stat = os.stat(path)
+    with open(index_path(path), 'wb') as f:
+        serialization.dump({"size": stat.st_size, "mtime": stat.st_mtime, "offsets": offsets}, f)
+
+
+def scan_block_offsets(path: str) -> Dict[str, list]:
+    '''
+    Offset and length of the last line of each key in a JSONL block file, in order of first appearance.
+    Removed keys are left out and incomplete or invalid lines are skipped.
+    '''
+    offsets = {}
+    with open(path, 'rb') as f:
+        offset = 0
+        for line in f:
+            length = len(line)
+            if line.endswith(b'\n') and line.strip():
+                try:
+                    record = serialization.loads(line)
+                except serialization.JSONDecodeError:
+                    record = {}
+                if not isinstance(record, dict):
+                    record = {}
+                for key, value in record.items():
+                    if key == REMOVED:
+                        offsets.pop(value, None)
+                    else:
+                        offsets[key] = [offset, length]
+            offset += length
+    return offsets
+
+
+class BlockFile:
+    '''
+    Lazy, read-only access to a JSONL block file.
+
+    An offset index (key -> offset and length of its last line) gives random access to the blocks by key.
+    It is read from the index file written along the blocks (see `write_blocks`) if it is up to date, and
+    otherwise built with a scan that keeps only the offsets in memory. Iterating yields (key, block) pairs,
+    parsing one line at a time, with the last version of each key (files can be append-only logs).
+    '''
+
+    def __init__(self, path: str, save_index: bool = False):
+        self.path = path
+        self.offsets = self._load_index()
+        if self.offsets is None:
+            self.offsets = scan_block_offsets(path)
+            if save_index:
+                save_block_index(path, self.offsets)
+
+    def _load_index(self):
+        try:
+            with open(index_path(self.path), 'rb') as f:
+                index = serialization.load(f)
+        except (OSError, ValueError):
+            return None
+        stat = os.stat(self.path)
+        if index.get("size") != stat.st_size or index.get("mtime") != stat.st_mtime:
+            return None
+        return index["offsets"]
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, key):
+        return key in self.offsets
+
+    def keys(self):
+        return self.offsets.keys()
+
+    def _read(self, f, key):
+        offset, length = self.offsets[key]
+        f.seek(offset)
+        return serialization.loads(f.read(length))[key]
+
+    def __getitem__(self, key):
+        with open(self.path, 'rb') as f:
+            return self._read(f, key)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        with open(self.path, 'rb') as f:
+            for key in list(self.offsets):
+                yield key, self._read(f, key)
+
+    def __iter__(self):
+        return iter(self.offsets)
+
+
+def iter_blocks(path: str) -> Iterator[Tuple[str, Any]]:
+    '''
+    Yields the (key, block) pairs of a block file lazily, whatever its format (JSONL or JSON object).
+    '''
+    if is_jsonl(path):
+        return BlockFile(path).items()
+    return iter_json_object_items(path)
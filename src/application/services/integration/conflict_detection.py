@@ -1,31 +1,10 @@
+import time
+import heapq
 import tiktoken
-from urllib.parse import urlparse
 import logging
+from collections import Counter
 
-def normalize_url(url):
-    """Normalize a URL by removing the protocol, trailing slash, and handling Bioconductor package URLs."""
-    if not url:
-        return None
-
-    parsed_url = urlparse(url)
-    netloc = parsed_url.netloc.lower()
-    path = parsed_url.path.rstrip('/')  # Remove trailing slash
-
-    # Remove '.html' from the end of Bioconductor URLs
-    if path.endswith('.html'):
-        path = path[:-5]
-
-    # Handle Bioconductor package URLs
-    if 'bioconductor.org' in netloc:
-        parts = path.split('/')
-        # Identify package name (last meaningful part)
-        for part in reversed(parts):
-            if part and part not in ('release', 'bioc', 'html', 'packages'):
-                return f"bioconductor.org/packages/{part}"
-
-    # Generic normalization: remove protocol, keep domain + path
-    return f"{netloc}{path}"
-
+from src.application.services.integration.url_normalization import instance_links
 
 def process_description(description):
     """Concatenates description items into a single string."""
@@ -102,98 +81,131 @@ def get_galaxy_related_same_name(entries):
     return [e for e in entries if is_galaxy_related(e) and e["name"].strip().lower() == common_name]
 
 
+# Sources whose entries are not taken into account when detecting conflicts
+SKIPPED_SOURCES = {"opeb_metrics", "bioconda"}
+
+# Blocks slower than this (seconds) are logged, along with the slowest blocks at the end
+SLOW_BLOCK_SECONDS = 1.0
+SLOWEST_BLOCKS_REPORTED = 5
+
+
+def instance_details(instance):
+    """
+    Summary of an instance used in the conflict blocks, and its normalized links (stored in the grouped blocks).
+    Returns None for instances of skipped sources.
+    """
+    sources = instance["data"].get("source", [])
+    if any(s.lower() in SKIPPED_SOURCES for s in sources):
+        return None
+
+    repo_links, webpage_links = instance_links(instance)
+    entry = {
+        "name": instance["data"]["name"],
+        "types": instance["data"].get("type", []),
+        "source": instance["data"].get("source", []),
+        "description": process_description(instance["data"].get("description", [])),
+        "repository": list(repo_links),
+        "webpage": list(webpage_links),
+        "id": instance["_id"]
+    }
+    return entry, repo_links | webpage_links
+
+
+def find_block_conflict(instances, use_name_match_for_no_links=True):
+    """
+    Conflict of a block: {"disconnected": [...], "remaining": [...]}, or None if it has no disconnected entries.
+
+    An entry is connected if it shares a link with another entry of the block. Links are counted in an
+    inverted index (link -> number of entries with it), so this is a lookup per link instead of a comparison
+    with every other entry.
+    """
+    details = []
+    links = []
+    for instance in instances:
+        summary = instance_details(instance)
+        if summary:
+            details.append(summary[0])
+            links.append(summary[1])
+
+    if len(details) <= 1:
+        return None
+
+    if all_entries_same_name_and_galaxy_related(details):
+        return None
+
+    link_members = Counter(link for entry_links in links for link in entry_links)
+
+    disconnected = []
+    remaining = []
+
+    for entry, entry_links in zip(details, links):
+        if not entry_links:
+            if use_name_match_for_no_links or is_galaxy_related(entry):
+                remaining.append(entry)
+            else:
+                disconnected.append(entry)
+        elif any(link_members[link] > 1 for link in entry_links):
+            remaining.append(entry)
+        else:
+            disconnected.append(entry)
+
+    # Promote galaxy-related entries with common name to 'remaining'
+    galaxy_group = get_galaxy_related_same_name(details)
+
+    if galaxy_group:
+        galaxy_ids = {e["id"] for e in galaxy_group}
+        # Remove them from disconnected if they were incorrectly flagged
+        disconnected = [e for e in disconnected if e["id"] not in galaxy_ids]
+
+        # Avoid duplicates in remaining
+        existing_ids = {e["id"] for e in remaining}
+        for g in galaxy_group:
+            if g["id"] not in existing_ids:
+                remaining.append(g)
+
+    if not disconnected:
+        return None
+
+    return {
+        "disconnected": disconnected,
+        "remaining": remaining
+    }
+
+
 def find_disconnected_entries(data, use_name_match_for_no_links=True):
     """
     Identify conflicts based on link similarity and optionally use a heuristic
     that assumes no-link entries with the same name are the same software.
     
     Args:
-        data (dict): grouped_entries or blocks dictionary
+        data (dict or iterable): grouped_entries or blocks dictionary, or (key, block) pairs
+            (e.g. streamed from the grouped entries file, see block_stream)
         use_name_match_for_no_links (bool): if True, treat no-link entries as 'remaining'
     
     Returns:
         dict: conflict_blocks with 'disconnected' and 'remaining' entries
     """
     disconnected_keys = {}
+    timings = []
 
-    for key, value in data.items():
+    for key, value in (data.items() if isinstance(data, dict) else data):
         instances = value.get("instances", [])
 
-        instance_links = []
-        instance_details = []
+        start = time.perf_counter()
+        conflict = find_block_conflict(instances, use_name_match_for_no_links)
+        elapsed = time.perf_counter() - start
 
-        for instance in instances:
-            sources = instance["data"].get("source", [])
-    
-            # 🚫 Skip open_metrics entries
-            if any(s.lower() == "opeb_metrics" for s in sources):
-                #logging.debug(f"Skipping entry {instance['_id']} due to source 'open_metrics'")
-                continue
-
-            if any(s.lower() == "bioconda" for s in sources):
-                #logging.debug(f"Skipping entry {instance['_id']} due to source 'open_metrics'")
-                continue
-
-            repo_links = {normalize_url(repo["url"]) for repo in instance["data"].get("repository", []) if repo.get("url")}
-            webpage_links = {normalize_url(url) for url in instance["data"].get("webpage", []) if url}
-            combined_links = repo_links | webpage_links
-
-            entry = {
-                "name": instance["data"]["name"],
-                "types": instance["data"].get("type", []),
-                "source": instance["data"].get("source", []),
-                "description": process_description(instance["data"].get("description", [])),
-                "repository": list(repo_links),
-                "webpage": list(webpage_links),
-                "id": instance["_id"]
-            }
-
-            instance_details.append(entry)
-            instance_links.append(combined_links)
-
-        if len(instance_details) <= 1:
-            continue
-
-        if all_entries_same_name_and_galaxy_related(instance_details):
-            logging.debug(f"Skipping conflict for {key} — all Galaxy-related entries with same name.")
-            continue
-
-
-        disconnected = []
-        remaining = []
-
-        for i, (details, links_a) in enumerate(zip(instance_details, instance_links)):
-            if not links_a:
-                if use_name_match_for_no_links or is_galaxy_related(details):
-                    remaining.append(details)
-                else:
-                    disconnected.append(details)
-            else:
-                shared = any(links_a & links_b for j, links_b in enumerate(instance_links) if i != j)
-                if not shared:
-                    disconnected.append(details)
-                else:
-                    remaining.append(details)
-
-        # Promote galaxy-related entries with common name to 'remaining'
-        galaxy_group = get_galaxy_related_same_name(instance_details)
-
-        if galaxy_group:
-            galaxy_ids = {e["id"] for e in galaxy_group}
-            # Remove them from disconnected if they were incorrectly flagged
-            disconnected = [e for e in disconnected if e["id"] not in galaxy_ids]
-
-            # Avoid duplicates in remaining
-            existing_ids = {e["id"] for e in remaining}
-            for g in galaxy_group:
-                if g["id"] not in existing_ids:
-                    remaining.append(g)
-
-        if disconnected:
-            disconnected_keys[key] = {
-                "disconnected": disconnected,
-                "remaining": remaining
-            }
+        if elapsed > SLOW_BLOCK_SECONDS:
+            logging.info(f"Slow block {key}: {len(instances)} instances in {elapsed:.2f}s")
+        heapq.heappush(timings, (elapsed, key, len(instances)))
+        if len(timings) > SLOWEST_BLOCKS_REPORTED:
+            heapq.heappop(timings)
+
+        if conflict:
+            disconnected_keys[key] = conflict
+
+    for elapsed, key, size in sorted(timings, reverse=True):
+        logging.info(f"Block {key}: {size} instances in {elapsed * 1000:.1f}ms")
 
     return disconnected_keys
 
@@ -0,0 +1,223 @@
+import re
+import time
+import asyncio
+import logging
+import requests
+from playwright.async_api import async_playwright
+
+from src.application.services.integration.disambiguation.config import (
+    BROWSER_MAX_PAGES,
+    BROWSER_PAGE_MAX_USES,
+    BROWSER_BLOCKED_RESOURCES,
+    BROWSER_TIMEOUT,
+    BROWSER_RETRY_DELAY,
+    MAX_PAGE_BYTES,
+)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.5993.90 Safari/537.36"
+
+# Pages with less visible text than this (without scripts and styles) are rendered in the browser
+MIN_STATIC_TEXT_LENGTH = 200
+
+JAVASCRIPT_MARKERS = re.compile(
+    r"<noscript[^>]*>[^<]*(enable|requires?)[^<]*javascript|<div id=\"(root|app|__next)\"></div>",
+    re.IGNORECASE
+)
+NON_VISIBLE = re.compile(r"<(script|style|noscript|template)[^>]*>.*?</\1>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+
+
+def needs_javascript(html: str) -> bool:
+    '''
+    Whether a page fetched with plain HTTP has to be rendered in a browser to get its content:
+    it asks for JavaScript, is an empty app shell or has hardly any visible text.
+    '''
+    if JAVASCRIPT_MARKERS.search(html):
+        return True
+    text = " ".join(NON_VISIBLE.sub(" ", html).split())
+    return len(text) < MIN_STATIC_TEXT_LENGTH
+
+
+def fetch_static_html(url: str, timeout=10, max_bytes=MAX_PAGE_BYTES):
+    '''
+    Fetches a page with plain HTTP, streaming at most `max_bytes` of it.
+    Returns its HTML, or None if the request fails or is not HTML.
+    '''
+    try:
+        with requests.get(url, headers={"User-Agent": USER_AGENT}, timeout=timeout, stream=True) as response:
+            if response.status_code != 200 or "html" not in response.headers.get("Content-Type", ""):
+                logging.info(f"Static fetch of {url} returned {response.status_code} ({response.headers.get('Content-Type')})")
+                return None
+
+            content = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                content.extend(chunk)
+                if len(content) >= max_bytes:
+                    logging.info(f"Page {url} truncated to {max_bytes} bytes")
+                    del content[max_bytes:]
+                    break
+            # without a charset in the headers, requests assumes ISO-8859-1 for text/html
+            encoding = response.encoding if "charset" in response.headers.get("Content-Type", "") else "utf-8"
+            return content.decode(encoding, errors="replace")
+    except Exception as e:
+        logging.info(f"Static fetch failed for {url}: {e}")
+        return None
+
+
+class BrowserPool:
+    '''
+    Long-lived headless Chromium shared by all the page fetches of a run.
+
+    - The browser is launched on first use, with a single context whose requests for blocked resource
+      types (images, fonts, media) are aborted.
+    - At most `max_pages` pages are open at a time. Pages are reused and closed after `max_page_uses`
+      navigations (or after an error), so memory does not grow along the run.
+    - If the browser cannot be launched, launching is not tried again for `retry_delay` seconds, so that
+      pages fall back to plain HTTP right away instead of paying for a failed launch each.
+    '''
+
+    def __init__(self, max_pages=BROWSER_MAX_PAGES, max_page_uses=BROWSER_PAGE_MAX_USES,
+                 blocked_resources=BROWSER_BLOCKED_RESOURCES, timeout=BROWSER_TIMEOUT, retry_delay=BROWSER_RETRY_DELAY):
+        self.max_page_uses = max_page_uses
+        self.blocked_resources = set(blocked_resources)
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.launch_error = None
+        self.launch_failed_at = None
+        self.semaphore = asyncio.Semaphore(max_pages)
+        self.start_lock = asyncio.Lock()
+        self.idle_pages = []
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.stats = {"http": 0, "browser": 0, "recycled_pages": 0}
+
+    async def start(self):
+        async with self.start_lock:
+            if self.context is not None:
+                return
+            if self.launch_failed_at is not None and time.monotonic() - self.launch_failed_at < self.retry_delay:
+                raise RuntimeError(f"Browser not available: {self.launch_error}")
+            try:
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.launch(headless=True, args=[
+                    "--proxy-bypass-list=<-loopback>",
+                    "--dns-prefetch-disable"
+                ])
+                context = await self.browser.new_context(user_agent=USER_AGENT)
+                await context.route("**/*", self._route)
+                self.context = context
+                self.launch_failed_at = None
+            except Exception as e:
+                logging.warning(f"Could not launch the browser, retrying in {self.retry_delay} s: {e}")
+                self.launch_error = e
+                self.launch_failed_at = time.monotonic()
+                await self.close()
+                raise
+
+    async def _route(self, route):
+        if route.request.resource_type in self.blocked_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _acquire_page(self):
+        if self.idle_pages:
+            return self.idle_pages.pop()
+        return await self.context.new_page(), 0
+
+    async def _release_page(self, page, uses, reusable):
+        if reusable and uses < self.max_page_uses:
+            self.idle_pages.append((page, uses))
+            return
+        self.stats["recycled_pages"] += 1
+        try:
+            await page.close()
+        except Exception as e:
+            logging.debug(f"Could not close page: {e}")
+
+    async def render(self, url: str):
+        '''
+        Loads a page in the browser and returns its rendered HTML, or None if it does not answer with 200.
+        '''
+        await self.start()
+        async with self.semaphore:
+            page, uses = await self._acquire_page()
+            reusable = False
+            try:
+                response = await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
+                reusable = True
+                if response and response.status != 200:
+                    logging.warning(f"Non-200 status: {response.status} for {url}")
+                    return None
+                self.stats["browser"] += 1
+                return await page.content()
+            finally:
+                await self._release_page(page, uses + 1, reusable)
+
+    async def fetch(self, url: str, extract=None):
+        '''
+        Fetches a page in tiers. The page is fetched with plain HTTP first, and only rendered in the browser if
+        that fails, the page needs JavaScript or nothing is extracted from it. If the browser is not available,
+        the static HTML is used.
+        - extract: function applied to the HTML (e.g. to get its text). By default, the HTML is returned.
+
+        Returns (result, tier), where tier is "http", "browser" or None if the page could not be fetched.
+        '''
+        extract = extract or (lambda html: html)
+
+        html = await asyncio.to_thread(fetch_static_html, url)
+        if html and not needs_javascript(html):
+            result = await asyncio.to_thread(extract, html)
+            if result:
+                self.stats["http"] += 1
+                return result, "http"
+
+        try:
+            rendered = await self.render(url)
+        except Exception as e:
+            logging.warning(f"Playwright failed for {url}: {e}")
+            rendered = None
+
+        if rendered:
+            return await asyncio.to_thread(extract, rendered), "browser"
+        if html:
+            self.stats["http"] += 1
+            return await asyncio.to_thread(extract, html), "http"
+        return None, None
+
+    async def close(self):
+        for page, _ in self.idle_pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self.idle_pages = []
+        if self.browser is not None:
+            await self.browser.close()
+        if self.playwright is not None:
+            await self.playwright.stop()
+        self.playwright = self.browser = self.context = None
+
+
+_pools = {}
+
+
+def get_browser_pool():
+    '''
+    Returns the browser pool of the running event loop.
+    '''
+    loop = asyncio.get_running_loop()
+    if loop not in _pools:
+        _pools.clear()  # pools of finished runs (other event loops) are not needed anymore
+        _pools[loop] = BrowserPool()
+    return _pools[loop]
+
+
+async def close_browser_pool():
+    '''
+    Closes the browser of the running event loop, if it was launched, and logs how pages were fetched.
+    '''
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        logging.info(f"Pages fetched: {pool.stats['http']} with plain HTTP, {pool.stats['browser']} with the browser")
+        await pool.close()
@@ -1,4 +1,5 @@
 import os 
+import json
 import logging
 from dotenv import load_dotenv
 # -------------------------------
@@ -20,6 +21,61 @@ MAX_TOTAL_TOKENS = 130000
 HF_API_URL = "https://api-inference.huggingface.co/models" 
 HF_API_KEY = os.environ.get("HUGGINGFACE_API_KEY")
 
+# Requests per minute sent to each LLM provider, shared by all the concurrent disambiguations
+PROVIDER_REQUESTS_PER_MINUTE = {
+    "openrouter": int(os.environ.get("OPENROUTER_REQUESTS_PER_MINUTE", REQUESTS_PER_MINUTE)),
+    "huggingface": int(os.environ.get("HUGGINGFACE_REQUESTS_PER_MINUTE", REQUESTS_PER_MINUTE)),
+}
+
+# Models of the agreement panel used to disambiguate pairs. All of them are queried at the same time and
+# their verdicts must agree. "client" is "huggingface" (with a "provider") or "openrouter".
+# It can be replaced with a JSON list in the AGREEMENT_MODELS environment variable.
+AGREEMENT_MODELS = json.loads(os.environ.get("AGREEMENT_MODELS", "null")) or [
+    {"name": "llama_4", "client": "huggingface", "model": "meta-llama/Llama-4-Scout-17B-16E-Instruct", "provider": "together"},
+    {"name": "mixtral", "client": "openrouter", "model": "mistralai/mixtral-8x7b-instruct"},
+]
+
+# On-disk cache of the answers of the models, so identical prompts are not sent again. Empty to disable it.
+VERDICT_CACHE_PATH = os.environ.get("VERDICT_CACHE_PATH", "scripts/data/verdict_cache.sqlite")
+
+# Link enrichment: on-disk cache of enriched links (empty to disable it), time to live of its entries in seconds,
+# and links enriched at a time (in total and per host)
+LINK_CACHE_PATH = os.environ.get("LINK_CACHE_PATH", "scripts/data/link_cache.sqlite")
+LINK_CACHE_TTL = int(os.environ.get("LINK_CACHE_TTL", 7 * 24 * 3600))
+MAX_CONCURRENT_LINKS = int(os.environ.get("MAX_CONCURRENT_LINKS", 8))
+MAX_CONCURRENT_LINKS_PER_HOST = int(os.environ.get("MAX_CONCURRENT_LINKS_PER_HOST", 2))
+# Finished enrichments kept in memory for the rest of the run when they are not in the link cache (e.g. links
+# without content, or no cache); the least recently used are dropped
+MAX_UNCACHED_LINKS_KEPT = int(os.environ.get("MAX_UNCACHED_LINKS_KEPT", 1000))
+
+# Headless browser used to fetch pages that need JavaScript: pages open at a time, navigations before a page is
+# recycled, resource types not loaded and navigation timeout in milliseconds
+BROWSER_MAX_PAGES = int(os.environ.get("BROWSER_MAX_PAGES", 4))
+BROWSER_PAGE_MAX_USES = int(os.environ.get("BROWSER_PAGE_MAX_USES", 20))
+BROWSER_BLOCKED_RESOURCES = ("image", "font", "media")
+BROWSER_TIMEOUT = int(os.environ.get("BROWSER_TIMEOUT", 30000))
+# Seconds before launching the browser again after a failed launch (pages are fetched with plain HTTP meanwhile)
+BROWSER_RETRY_DELAY = float(os.environ.get("BROWSER_RETRY_DELAY", 300))
+
+# Pages fetched with plain HTTP are truncated to this size (bytes)
+MAX_PAGE_BYTES = int(os.environ.get("MAX_PAGE_BYTES", 2 * 1024 * 1024))
+
+# Pretools entries and publications kept in memory by the disambiguation, and conflict blocks whose entries
+# are fetched together
+ENTRY_CACHE_SIZE = int(os.environ.get("ENTRY_CACHE_SIZE", 20000))
+PREFETCH_BLOCKS = int(os.environ.get("PREFETCH_BLOCKS", 32))
+
+# Token counts of prompt contents memoized by the prompt builder (least recently used are dropped)
+TOKEN_COUNT_CACHE_SIZE = int(os.environ.get("TOKEN_COUNT_CACHE_SIZE", 50000))
+
+# The JSONL record files (blocks, conflict blocks, disambiguated blocks) are append-only logs. They are compacted
+# when they have at least this many stale lines, and more stale lines than records.
+COMPACTION_MIN_STALE_RECORDS = int(os.environ.get("COMPACTION_MIN_STALE_RECORDS", 1000))
+
+# Concurrency of the disambiguation: conflict blocks and pairs (LLM calls) in flight at a time
+MAX_CONCURRENT_BLOCKS = int(os.environ.get("DISAMBIGUATION_MAX_CONCURRENT_BLOCKS", 4))
+MAX_CONCURRENT_PAIRS = int(os.environ.get("DISAMBIGUATION_MAX_CONCURRENT_PAIRS", 8))
+
 # Github API
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
 GITHUB_API_BASE = "https://api.github.com"
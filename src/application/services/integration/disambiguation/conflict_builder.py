@@ -1,27 +1,41 @@
 from src.application.services.integration.disambiguation.prompts import get_tokenizer
-from src.application.services.integration.disambiguation.enrich_links import enrich_link
+from src.application.services.integration.disambiguation.link_enrichment import get_link_enricher
 # -------------------------------
 # Chunking big text
 # -------------------------------
+# Tokens looked back from the end of a chunk to find the start of a word
+MAX_BOUNDARY_LOOKBACK = 64
+
+
+def word_boundary(enc, tokens, start: int, end: int) -> int:
+    '''
+    Position of the last token in (start, end] that starts a word, so that words are not split between chunks.
+    If there is none close to `end`, `end` is returned.
+    '''
+    for i in range(end, max(start, end - MAX_BOUNDARY_LOOKBACK), -1):
+        if enc.decode_single_token_bytes(tokens[i])[:1].isspace():
+            return i
+    return end
+
+
 def chunk_text(text: str, max_tokens: int = 8000, model: str = "gpt-4"):
+    '''
+    Splits a text (with its whitespace collapsed) into chunks of at most `max_tokens` tokens.
+    The text is encoded once and the token array is sliced at word boundaries.
+    '''
     enc = get_tokenizer(model)
-    words = text.split()
+    tokens = enc.encode(" ".join(text.split()))
     chunks = []
-    current_chunk = []
-    current_token_count = 0
-
-    for word in words:
-        token_len = len(enc.encode(word + " "))
-        if current_token_count + token_len > max_tokens:
-            chunks.append(" ".join(current_chunk))
-            current_chunk = [word]
-            current_token_count = token_len
-        else:
-            current_chunk.append(word)
-            current_token_count += token_len
-
-    if current_chunk:
-        chunks.append(" ".join(current_chunk))
+    start = 0
+
+    while start < len(tokens):
+        end = start + max_tokens
+        if end < len(tokens):
+            end = word_boundary(enc, tokens, start, end)
+        chunk = enc.decode(tokens[start:end]).strip()
+        if chunk:
+            chunks.append(chunk)
+        start = end
 
     return chunks
 
@@ -39,15 +53,11 @@ async def build_full_conflict(conflict, max_tokens=8000, model="gpt-4"):
 
     async def enrich_and_collect_content(url_list):
         contents = {}
-        seen = set()
-
-        for url in url_list:
-            if url in seen or not url:
-                continue
-            seen.add(url)
 
-            enriched = await enrich_link(url)
+        # Links are enriched concurrently and only once per run (see LinkEnricher)
+        enriched_links = await get_link_enricher().enrich_many(url_list)
 
+        for url, enriched in enriched_links.items():
             contents[url] = {}
 
             if enriched and enriched.get("content"):
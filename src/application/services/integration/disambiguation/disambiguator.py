@@ -4,22 +4,28 @@ from src.application.services.integration.disambiguation.prompts import build_pr
 from src.application.services.integration.disambiguation.proxy import decision_agreement_proxy
 from src.application.services.integration.disambiguation.results import build_disambiguated_record, build_disambiguated_record_manual, build_no_conflict_record
 from src.application.services.integration.disambiguation.issues import create_github_issue, generate_github_issue, generate_context
-from src.application.services.integration.disambiguation.utils import replace_with_full_entries, filter_relevant_fields, build_instances_keys_dict, load_dict_from_jsonl, add_jsonl_record
-import json 
+from src.application.services.integration.disambiguation.utils import replace_with_full_entries, filter_relevant_fields, load_dict_from_jsonl, add_jsonl_record, repair_jsonl_tail
+from src.application.services.integration.disambiguation.config import MAX_CONCURRENT_BLOCKS, MAX_CONCURRENT_PAIRS, PREFETCH_BLOCKS
+from src.application.services.integration.disambiguation.entry_loader import get_entry_loader
+from src.application.services.integration.disambiguation.verdict_cache import verdict_cache_stats
+from src.application.services.integration.disambiguation.browser_pool import close_browser_pool
+from src.application.services import serialization
 import logging 
 import os
 import copy
+import asyncio
+from collections import deque
 from pprint import pprint
 
 
 def log_error(conflict):
     with open('data/error_conflicts.json', 'a') as f:
-        f.write(json.dumps(conflict, indent=4))
+        f.write(serialization.dumps(conflict, indent=True))
 
 
 def log_result(result):
     with open('data/results.json', 'a') as f:
-        f.write(json.dumps(result, indent=4))
+        f.write(serialization.dumps(result, indent=True))
     logging.info("Result logged")
 
 
@@ -29,117 +35,195 @@ def write_to_results_file(result, results_file):
         os.makedirs(os.path.dirname(results_file), exist_ok=True)
         
         with open(results_file, "a") as f:
-            json.dump(result, f)
-            f.write("\n")
+            f.write(serialization.dumps(result) + "\n")
     except Exception as e:
         logging.error(f"Error writing to results file: {e}")
 
 def load_solved_conflict_keys(jsonl_path):
-    solved_keys = set()
     if not os.path.exists(jsonl_path):
-        return solved_keys
-    with open(jsonl_path, 'r') as f:
-        for line in f:
-            if line.strip():
-                try:
-                    entry = json.loads(line)
-                    key = next(iter(entry))
-                    solved_keys.add(key)
-                except Exception as e:
-                    logging.warning(f"Could not parse line: {line[:100]}...\n{e}")
-    return solved_keys
-
-
-async def process_conflict(key, conflict, instances_dict):
+        return set()
+    return set(load_dict_from_jsonl(jsonl_path))
+
+
+async def disambiguate_pair(key, conflict_pair, pair_semaphore):
+    """
+    Enrich a pair of the conflict block and run the models on it.
+    At most MAX_CONCURRENT_PAIRS pairs are processed at a time, across all the blocks.
+    """
+    async with pair_semaphore:
+        # Prepare minimal, enriched entry for disambiguation
+        full_conflict = filter_relevant_fields(conflict_pair)
+        full_conflict = await build_full_conflict(full_conflict)
+
+        # Generate prompt and run model (the model clients are blocking, so they run in a thread)
+        messages = build_prompt(full_conflict["disconnected"], full_conflict["remaining"])
+        result = await asyncio.to_thread(decision_agreement_proxy, messages)
+
+    # Log the result
+    add_jsonl_record("scripts/data/results_proxy.jsonl", { key: result })
+
+    return full_conflict, result
+
+
+async def process_conflict(key, conflict, pair_semaphore=None):
     """
     Process a single conflict block: build pairs, disambiguate them, and return
     a disambiguated_blocks record for this block.
+    The pairs of the block are disambiguated concurrently. The block is sent to manual review at the
+    first pair (in order) the models disagree on, so the pairs after it are cancelled once it is known.
     """
-    print("Processing conflict:")
-    pprint(conflict)
+    print(f"Processing conflict: {key}")
+    pair_semaphore = pair_semaphore or asyncio.Semaphore(MAX_CONCURRENT_PAIRS)
+
     # Replace summary info with full entries
-    conflict_full = replace_with_full_entries(conflict, instances_dict)
+    conflict_full = await asyncio.to_thread(replace_with_full_entries, conflict)
 
     # Build disambiguation pairs
     conflict_pairs, _ = build_pairs(copy.deepcopy(conflict_full), key, more_than_two_pairs=0)
 
-    pair_results = []
-    n = 0
-    for conflict_pair in conflict_pairs:
-        n+= 1
-        # Prepare minimal, enriched entry for disambiguation
-        full_conflict = filter_relevant_fields(conflict_pair)
-        full_conflict = await build_full_conflict(full_conflict)
+    tasks = {
+        asyncio.ensure_future(disambiguate_pair(key, conflict_pair, pair_semaphore)): n
+        for n, conflict_pair in enumerate(conflict_pairs, start=1)
+    }
+    pair_outcomes = {}
+    disagreement = None  # first pair without agreement
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                n = tasks[task]
+                pair_outcomes[n] = task.result()
+                if pair_outcomes[n][1].get("verdict") == "disagreement" and (disagreement is None or n < disagreement):
+                    disagreement = n
+            if disagreement is not None:
+                # only the pairs before the disagreement can change the outcome
+                for task in pending:
+                    if tasks[task] > disagreement:
+                        task.cancel()
+                pending = {task for task in pending if tasks[task] < disagreement}
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if disagreement is not None:
+        # Human fallback
+        # TODO: more than one pair may need disambiguation, so we need a way to differentiate them 
+        full_conflict, result = pair_outcomes[disagreement]
+        context = generate_context(key, full_conflict)
+        body = generate_github_issue(context)
+        title = f"Manual resolution needed for {key}"
+        labels = ['conflict', 'automated']
+        #create_issue(title, body, labels)
+        key = f"{key}_pair_{disagreement}"
+        response = await asyncio.to_thread(create_github_issue, title, body, labels)
+        return build_disambiguated_record_manual(key, conflict, response["html_url"])
 
-        # Generate prompt and run model
-        messages = build_prompt(full_conflict["disconnected"], full_conflict["remaining"])
-    
-        
-        result = decision_agreement_proxy(messages)
-
-        # Log the result
-        add_jsonl_record("scripts/data/results_proxy.jsonl", { key: result })
-
-        if result.get("verdict") != "disagreement":
-            pair_results.append({
-                "remaining_id": full_conflict["remaining"][0]["id"],
-                "disconnected_id": full_conflict["disconnected"][0]["id"],
-                "same_as_remaining": result["verdict"].lower() == "same",
-                "confidence": result.get("confidence", None)
-            })
-        else:
-            # Human fallback
-            # TODO: more than one pair may need disambiguation, so we need a way to differentiate them 
-            context = generate_context(key, full_conflict)
-            body = generate_github_issue(context)
-            title = f"Manual resolution needed for {key}"
-            labels = ['conflict', 'automated']
-            #create_issue(title, body, labels)
-            key = f"{key}_pair_{n}"
-            response = create_github_issue(title, body, labels)
-            return build_disambiguated_record_manual(key, conflict, response["html_url"])
-        
+    pair_results = []
+    for n in sorted(pair_outcomes):
+        full_conflict, result = pair_outcomes[n]
+        pair_results.append({
+            "remaining_id": full_conflict["remaining"][0]["id"],
+            "disconnected_id": full_conflict["disconnected"][0]["id"],
+            "same_as_remaining": result["verdict"].lower() == "same",
+            "confidence": result.get("confidence", None)
+        })
 
     # Build final record
     return build_disambiguated_record(key, conflict, pair_results)
 
 
-
-
-async def disambiguate_blocks(conflict_blocks, blocks, disambiguated_blocks_path):
+async def disambiguate_blocks(conflict_blocks, blocks, disambiguated_blocks_path, max_blocks=None, max_pairs=None, keys=None):
     '''
     Disambiguated blocks can be empty at the beginning.
     The function will fill it with the disambiguated entries.
+    Only the blocks in `keys` are processed, if given (e.g. the work queue of a round). By default, all `blocks`.
+
+    Up to `max_blocks` conflict blocks and `max_pairs` pairs (LLM calls) are processed at a time.
+    Defaults to MAX_CONCURRENT_BLOCKS and MAX_CONCURRENT_PAIRS in config.py.
+    Records are appended to the disambiguated blocks file in the order of `blocks`, as soon as
+    each block and all the previous ones are done, so an interrupted run resumes from the last record.
+    The records already in the file are kept in memory by its record store, so that they are not read
+    again in every round (only the lines appended since the last round are).
+    `blocks` can be any mapping with the blocks by key, e.g. a BlockFile.
+    The entries and publications of the next PREFETCH_BLOCKS conflict blocks are fetched together.
     '''
-    disambiguated_blocks = load_dict_from_jsonl(disambiguated_blocks_path)
-    instances_dict = build_instances_keys_dict()
-    for key in blocks:
-        if key not in disambiguated_blocks:
-            print(f"Processing block: {key}")
+    max_blocks = max_blocks or MAX_CONCURRENT_BLOCKS
+    pair_semaphore = asyncio.Semaphore(max_pairs or MAX_CONCURRENT_PAIRS)
+
+    repair_jsonl_tail(disambiguated_blocks_path)
+    disambiguated_blocks = load_dict_from_jsonl(disambiguated_blocks_path) if os.path.exists(disambiguated_blocks_path) else {}
+
+    # Conflict blocks still to disambiguate, in order, and how many of them have been prefetched
+    keys = list(blocks if keys is None else keys)
+    to_disambiguate = [key for key in keys if key in conflict_blocks and key not in disambiguated_blocks]
+    prefetched = 0
+    started = 0
+
+    async def prefetch_next_blocks():
+        nonlocal prefetched
+        if started >= prefetched:
+            batch = [conflict_blocks[key] for key in to_disambiguate[prefetched:prefetched + PREFETCH_BLOCKS]]
+            prefetched += len(batch)
+            await asyncio.to_thread(get_entry_loader().prefetch_conflicts, batch)
+
+    async def disambiguate_block(key):
+        try:
+            return await process_conflict(key, conflict_blocks[key], pair_semaphore=pair_semaphore)
+        except Exception as e:
+            print(f"Error processing conflict {key}")
+            logging.error(f"Error processing conflict {key}: {e}")
+            raise e
+
+    def save_record(record):
+        add_jsonl_record(disambiguated_blocks_path, record)
+
+    # Records of the blocks, in the order of `blocks`. Conflict blocks are tasks until they are done.
+    pending = deque()
+    running = set()
+
+    def save_ready_records():
+        while pending and (not asyncio.isfuture(pending[0]) or pending[0].done()):
+            head = pending.popleft()
+            save_record(head.result() if asyncio.isfuture(head) else head)
+
+    try:
+        for key in keys:
+            if key in disambiguated_blocks:
+                print(f"Record {key} already exists in disambiguated blocks, skipping...")
+                continue
+
             if key in conflict_blocks:
                 print(f"{key} is a conflict block")
-                if key not in disambiguated_blocks:
-                    print(f"{key} not in disambiguated blocks")
-                    try:
-                        record = await process_conflict(key, conflict_blocks[key], instances_dict)
-                        disambiguated_blocks.update(record)
-                    except Exception as e:
-                        print(f"Error processing conflict {key}")
-                        logging.error(f"Error processing conflict {key}: {e}")
-                        raise e
-                        
-                    
+                await prefetch_next_blocks()
+                started += 1
+                task = asyncio.ensure_future(disambiguate_block(key))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                pending.append(task)
             else:
-                record = build_no_conflict_record(key, blocks[key])
-                disambiguated_blocks.update(record)
                 print(f"{key} is not a conflict block")
+                pending.append(build_no_conflict_record(key, blocks[key]))
 
-            add_jsonl_record(disambiguated_blocks_path, record)
+            save_ready_records()
+            if len(running) >= max_blocks:
+                await asyncio.wait(set(running), return_when=asyncio.FIRST_COMPLETED)
+                save_ready_records()
 
-        else:
-            print(f"Record {key} already exists in disambiguated blocks, skipping...")
+        while pending:
+            if asyncio.isfuture(pending[0]):
+                await asyncio.wait([pending[0]])
+            save_ready_records()
 
-    return disambiguated_blocks
+    finally:
+        # On error, do not leave blocks running in the background
+        for task in running:
+            task.cancel()
 
+        await close_browser_pool()
 
+        cache_stats = verdict_cache_stats()
+        if cache_stats:
+            logging.info(f"Verdict cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
 
+    return load_dict_from_jsonl(disambiguated_blocks_path) if os.path.exists(disambiguated_blocks_path) else {}
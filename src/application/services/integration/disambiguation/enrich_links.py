@@ -1,13 +1,13 @@
+import asyncio
 import requests
 import urllib.parse
 import os
 import logging
 import json
 import re
-from readability import Document
 from bs4 import BeautifulSoup
-#from playwright.sync_api import sync_playwright
-from playwright.async_api import async_playwright
+from src.application.services.integration.disambiguation.browser_pool import get_browser_pool
+from src.application.services.integration.disambiguation.html_text import html_to_markdown
 from src.application.services.integration.disambiguation.config import (
     GITHUB_TOKEN,
     GITHUB_API_BASE,
@@ -166,18 +166,28 @@ def get_gitlab_repo_readme(readme_url: str, repo_url: str) -> str:
 # -------------------------------
 # Web Scraping & Parsing
 # -------------------------------
-async def get_link_content(link):
+def content_url(link):
     decoded_link = urllib.parse.unquote(link)
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.5993.90 Safari/537.36"
-    }
 
     if "galaxy.bi.uni-freiburg.de/tool_runner" in decoded_link:
         decoded_link = decoded_link.replace("galaxy.bi.uni-freiburg.de/tool_runner", "usegalaxy.eu/root")
 
-    result = await extract_with_playwright(decoded_link)
-    return result
-    
+    return decoded_link
+
+
+async def get_link_content(link):
+    html, _ = await get_browser_pool().fetch(content_url(link))
+    return html
+
+
+async def get_link_text(link):
+    '''
+    Main text of a page and the tier that served it: "http" (static HTML) or "browser" (rendered page).
+    '''
+    text, tier = await get_browser_pool().fetch(content_url(link), extract=extract_main_text_from_html)
+    logging.info(f"Text of {link} extracted from {tier or 'nowhere'}")
+    return text, tier
+
 
 def normalize_linebreaks(text: str) -> str:
     # Replace any escaped "\n" with real newlines
@@ -192,54 +202,7 @@ def normalize_linebreaks(text: str) -> str:
     return text.strip()
 
 def extract_main_text_from_html(html: str) -> str:
-    doc = Document(html)
-    summary_html = doc.summary()
-    soup = BeautifulSoup(summary_html, 'html.parser')
-
-    # Convert links to [text](url)
-    for a in soup.find_all('a', href=True):
-        text = a.get_text(strip=True)
-        href = a['href']
-        if text:
-            a.replace_with(f"[{text}]({href})")
-        else:
-            a.replace_with(f"<{href}>")
-
-    # Convert <strong>/<b> to **bold**
-    for tag in soup.find_all(['strong', 'b']):
-        text = tag.get_text(strip=True)
-        tag.replace_with(f"**{text}**")
-
-    # Convert <em>/<i> to _italic_
-    for tag in soup.find_all(['em', 'i']):
-        text = tag.get_text(strip=True)
-        tag.replace_with(f"_{text}_")
-
-    # Convert headers to Markdown (#, ##, etc.)
-    for i in range(1, 7):
-        for header in soup.find_all(f'h{i}'):
-            text = header.get_text(strip=True)
-            header.replace_with(f"\n{'#' * i} {text}\n")
-
-    # Flatten lists as bullets
-    for li in soup.find_all('li'):
-        text = li.get_text(strip=True)
-        li.replace_with(f"* {text}")
-
-    # Remove scripts/styles/irrelevant
-    for tag in soup(['script', 'style', 'footer', 'nav']):
-        tag.decompose()
-
-    # Clean paragraphs and line breaks
-    text = soup.get_text(separator='\n', strip=True)
-
-    # Normalize line breaks
-    text = normalize_linebreaks(text)
-
-    with open(f"content_clean.html", "w", encoding="utf-8") as f:
-        f.write(text)
-    
-    return text
+    return normalize_linebreaks(html_to_markdown(html))
 
 
 def extract_sourceforge_project_info(html: str) -> dict:
@@ -369,32 +332,7 @@ def get_bitbucket_readme(user, repo, metadata):
 
 async def extract_with_playwright(url: str) -> str:
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True, args=[
-                "--proxy-bypass-list=<-loopback>",
-                "--dns-prefetch-disable"
-            ])
-            context = await browser.new_context()
-            page = await context.new_page()
-            await page.set_extra_http_headers({
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)..."
-            })
-
-            response = await page.goto(url, wait_until="domcontentloaded")
-            if response and response.status != 200:
-                logging.warning(f"Non-200 status: {response.status} for {url}")
-                await browser.close()
-                return None
-
-            content = await page.content()
-            # save content in a file
-            with open(f"content.html", "w", encoding="utf-8") as f:
-                f.write(content)
-
-            await browser.close()
-
-            return content
-
+        return await get_browser_pool().render(url)
     except Exception as e:
         logging.warning(f"Playwright failed for {url}: {e}")
         return None
@@ -430,7 +368,8 @@ def get_redirect(url):
     
 async def enrich_link(link):
     new_link = {'url': link}
-    link = get_redirect(link)
+    # The HTTP helpers are blocking, so they run in a thread to let other links be enriched meanwhile
+    link = await asyncio.to_thread(get_redirect, link)
 
     if link:
         processed = False
@@ -440,8 +379,8 @@ async def enrich_link(link):
                 parts = link.split('/')
                 if len(parts) >= 5:
                     owner, repo_name = parts[3], parts[4]
-                    new_link['repo_metadata'] = request_github_metadata(owner, repo_name)
-                    new_link['readme_content'] = request_github_readme(owner, repo_name)
+                    new_link['repo_metadata'] = await asyncio.to_thread(request_github_metadata, owner, repo_name)
+                    new_link['readme_content'] = await asyncio.to_thread(request_github_readme, owner, repo_name)
                     processed = True
             except Exception as e:
                 logging.warning(f"Error processing GitHub link {link}: {e}")
@@ -450,13 +389,13 @@ async def enrich_link(link):
         elif "gitlab.com" in link:
             pattern = r"https?://gitlab\.com/([^/]+/[^/]+)"
             match = re.search(pattern, link)
-            metadata = get_gitlab_repo_metadata(link)
+            metadata = await asyncio.to_thread(get_gitlab_repo_metadata, link)
             new_link['repo_metadata'] = metadata
 
             if metadata:
                 readme_url = metadata.get('readme_url')
                 if readme_url:
-                    new_link['readme_content'] = get_gitlab_repo_readme(readme_url, link)
+                    new_link['readme_content'] = await asyncio.to_thread(get_gitlab_repo_readme, readme_url, link)
                     processed = True
 
 
@@ -466,7 +405,7 @@ async def enrich_link(link):
             
             package_name = link.split("pypi.org/project/")[1]
             package_name = package_name.split("/")[0]
-            metadata = get_pypi_project_info(package_name)
+            metadata = await asyncio.to_thread(get_pypi_project_info, package_name)
             new_link['project_metadata'] = metadata
             processed = True
         
@@ -488,10 +427,10 @@ async def enrich_link(link):
             try:
                 match = re.match(r"https?://bitbucket.org/([^/]+)/([^/]+)", link)
                 user, repo = match.groups() if match else (None, None)
-                metadata = get_bitbucket_metadata(user, repo)
+                metadata = await asyncio.to_thread(get_bitbucket_metadata, user, repo)
                 new_link['repo_metadata'] = metadata
                 if metadata and 'main_branch' in metadata:
-                    new_link['readme_content'] = get_bitbucket_readme(user, repo, metadata)
+                    new_link['readme_content'] = await asyncio.to_thread(get_bitbucket_readme, user, repo, metadata)
                 processed = True
        
             except Exception as e:
@@ -503,10 +442,10 @@ async def enrich_link(link):
 
         if not processed:
             logging.info(f"Extracting generic content from {link}")
-            content = await get_link_content(link)
-            if content:
-                text = extract_main_text_from_html(content)
-                new_link['content'] = text 
+            text, tier = await get_link_text(link)
+            if text:
+                new_link['content'] = text
+                new_link['content_tier'] = tier
 
     #logging.info(f"Enriched link:")
     #logging.info(json.dumps(new_link, indent=2))
@@ -0,0 +1,130 @@
+import logging
+import threading
+from collections import OrderedDict
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from src.application.services.integration.disambiguation.config import ENTRY_CACHE_SIZE
+
+PRETOOLS = "pretoolsDev"
+PUBLICATIONS = "publicationsMetadataDev"
+
+
+def id_variants(document_id):
+    '''
+    Values an id can have in the database. Publication ids are ObjectIds, but they are often passed as strings.
+    '''
+    if isinstance(document_id, ObjectId):
+        return [document_id]
+    try:
+        return [document_id, ObjectId(document_id)]
+    except (InvalidId, TypeError):
+        return [document_id]
+
+
+class EntryLoader:
+    '''
+    Batch loader of the pretools entries and publications needed by the disambiguation.
+
+    Ids are fetched with one `$in` query per collection (see `prefetch` and `prefetch_conflicts`) and served
+    from a bounded LRU map, so conflict blocks do not need a round trip per entry and publication.
+    Ids not found in the database are cached too (as None). It can be shared by several threads.
+    '''
+
+    def __init__(self, db_adapter=None, max_size=ENTRY_CACHE_SIZE):
+        self.db_adapter = db_adapter
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+        self.stats = {"queries": 0, "hits": 0, "misses": 0}
+
+    def _adapter(self):
+        if self.db_adapter is None:
+            from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
+            self.db_adapter = mongo_adapter
+        return self.db_adapter
+
+    def _store(self, collection, document_id, document):
+        self.cache[(collection, str(document_id))] = document
+        self.cache.move_to_end((collection, str(document_id)))
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
+
+    def prefetch(self, collection, ids):
+        '''
+        Loads the ids of a collection that are not cached yet, in a single query.
+        Returns the loaded documents: id -> document (None if not found).
+        '''
+        with self.lock:
+            missing = list(dict.fromkeys(str(i) for i in ids if i is not None and (collection, str(i)) not in self.cache))
+        if not missing:
+            return {}
+
+        query_ids = [variant for document_id in missing for variant in id_variants(document_id)]
+        documents = self._adapter().fetch_entries(collection, {"_id": {"$in": query_ids}})
+
+        with self.lock:
+            self.stats["queries"] += 1
+            found = {str(document["_id"]): document for document in documents}
+            for document_id in missing:
+                self._store(collection, document_id, found.get(document_id))
+        logging.debug(f"Prefetched {len(found)}/{len(missing)} documents from {collection}")
+        return {document_id: found.get(document_id) for document_id in missing}
+
+    def get_many(self, collection, ids):
+        '''
+        Documents of a collection (None if not found), in the order of `ids`. Ids not cached are loaded in one query.
+        '''
+        ids = [str(i) for i in ids]
+        with self.lock:
+            cached = {i: self.cache[(collection, i)] for i in ids if (collection, i) in self.cache}
+            for i in cached:
+                self.cache.move_to_end((collection, i))
+            self.stats["hits"] += len(cached)
+            self.stats["misses"] += len(set(ids) - set(cached))
+
+        missing = [i for i in ids if i not in cached]
+        if missing:
+            loaded = self.prefetch(collection, missing)
+            with self.lock:
+                # ids loaded meanwhile by another thread are taken from the cache
+                cached.update({i: loaded[i] if i in loaded else self.cache.get((collection, i)) for i in missing})
+
+        return [cached[i] for i in ids]
+
+    def get(self, collection, document_id):
+        return self.get_many(collection, [document_id])[0]
+
+    def prefetch_conflicts(self, conflicts):
+        '''
+        Loads the entries of some conflict blocks, and then their publications, with a query per collection.
+        '''
+        entry_ids = [
+            entry["id"]
+            for conflict in conflicts
+            for group in ("disconnected", "remaining")
+            for entry in conflict.get(group, [])
+        ]
+        entries = self.get_many(PRETOOLS, entry_ids)
+        publication_ids = [
+            publication
+            for entry in entries if entry
+            for publication in entry.get("data", {}).get("publication") or []
+            if isinstance(publication, ObjectId)
+        ]
+        self.prefetch(PUBLICATIONS, publication_ids)
+
+
+_entry_loader = None
+_entry_loader_lock = threading.Lock()
+
+
+def get_entry_loader():
+    '''
+    Returns the entry loader of this process.
+    '''
+    global _entry_loader
+    with _entry_loader_lock:
+        if _entry_loader is None:
+            _entry_loader = EntryLoader()
+        return _entry_loader
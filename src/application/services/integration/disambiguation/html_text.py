@@ -0,0 +1,102 @@
+import re
+import lxml.html
+from lxml.etree import ParserError
+
+# Elements whose content is not part of the main text of a page
+SKIPPED_TAGS = {"head", "script", "style", "noscript", "template", "nav", "footer", "aside", "form", "svg", "iframe", "button", "select"}
+
+# Elements that start a new line
+BLOCK_TAGS = {
+    "html", "body", "main", "article", "section", "header", "div", "p", "br", "hr", "ul", "ol", "dl", "dt", "dd",
+    "table", "tr", "blockquote", "figure", "figcaption", "center",
+}
+
+HEADINGS = {f"h{level}": level for level in range(1, 7)}
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def flat_text(element) -> str:
+    return " ".join(element.text_content().split())
+
+
+def format_flattened(tag: str, element):
+    '''
+    Markdown of the elements converted as a whole (links, emphasis, headings, list items and preformatted text).
+    Returns None for the rest of elements.
+    '''
+    if tag == "a":
+        text = flat_text(element)
+        href = element.get("href")
+        if not href:
+            return text
+        return f"[{text}]({href})" if text else f"<{href}>"
+    if tag in ("strong", "b"):
+        text = flat_text(element)
+        return f"**{text}**" if text else ""
+    if tag in ("em", "i"):
+        text = flat_text(element)
+        return f"_{text}_" if text else ""
+    if tag in HEADINGS:
+        return f"\n{'#' * HEADINGS[tag]} {flat_text(element)}\n"
+    if tag == "li":
+        return f"\n* {flat_text(element)}\n"
+    if tag == "pre":
+        return f"\n{element.text_content()}\n"
+    return None
+
+
+def parse_html(html: str):
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # strings with an XML encoding declaration have to be parsed as bytes
+        return lxml.html.document_fromstring(html.encode("utf-8"))
+
+
+def html_to_markdown(html: str) -> str:
+    '''
+    Main text of a page as Markdown-like text, in a single walk of the parsed tree:
+    links as [text](url), bold as **text**, italics as _text_, headings as #, list items as "* ".
+    Navigation, footers, forms, scripts and styles are dropped. Returns "" if the page cannot be parsed.
+    '''
+    try:
+        root = parse_html(html)
+    except (ParserError, ValueError):
+        return ""
+
+    parts = []
+    # Pending elements and text, in reverse order. Tails are pushed before the element's children, so they
+    # are emitted after them. The walk is iterative, as pages can be deeply nested.
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+
+        tail = WHITESPACE.sub(" ", item.tail or "")
+        # comments and processing instructions have a non-string tag
+        tag = item.tag.lower() if isinstance(item.tag, str) else None
+
+        flattened = format_flattened(tag, item) if tag else None
+        if flattened is not None:
+            parts.append(flattened)
+            parts.append(tail)
+            continue
+
+        if tag is None or tag in SKIPPED_TAGS:
+            parts.append(tail)
+            continue
+
+        block = tag in BLOCK_TAGS
+        stack.append(tail)
+        if block:
+            stack.append("\n")
+        stack.extend(reversed(item))
+        if block:
+            parts.append("\n")
+        parts.append(WHITESPACE.sub(" ", item.text or ""))
+
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
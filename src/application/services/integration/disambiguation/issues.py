@@ -1,13 +1,13 @@
 import requests
-import json
 import os
 from jinja2 import Environment, FileSystemLoader
+from src.application.services import serialization
 
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
 
 def create_issue(issue):
     with open('data/issues.json', 'a') as f:
-        f.write(json.dumps(issue, indent=4))
+        f.write(serialization.dumps(issue, indent=True))
 
 def generate_github_issue(context, template_path='src/application/services/integration/disambiguation/github_issue.jinja2'):
     env = Environment(loader=FileSystemLoader('.'))
@@ -0,0 +1,148 @@
+import os
+import time
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from src.application.services import serialization
+from src.application.services.integration.disambiguation.config import (
+    LINK_CACHE_PATH,
+    LINK_CACHE_TTL,
+    MAX_CONCURRENT_LINKS,
+    MAX_CONCURRENT_LINKS_PER_HOST,
+    MAX_UNCACHED_LINKS_KEPT,
+)
+from src.application.services.integration.disambiguation import enrich_links
+
+# Fields of an enriched link holding fetched content. Links without any of them are not cached.
+CONTENT_FIELDS = ("content", "readme_content", "repo_metadata", "project_metadata")
+
+
+def is_cacheable(enriched) -> bool:
+    return bool(enriched) and any(enriched.get(field) for field in CONTENT_FIELDS)
+
+
+class LinkCache:
+    '''
+    On-disk (SQLite) cache of enriched links, keyed by URL. Entries older than `ttl` seconds are ignored.
+    '''
+
+    def __init__(self, path, ttl=LINK_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS links (url TEXT PRIMARY KEY, enriched TEXT, fetched_at REAL)")
+        self.connection.commit()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, url):
+        '''
+        Returns the cached enriched link, or None if it is not cached or has expired.
+        '''
+        with self.lock:
+            row = self.connection.execute("SELECT enriched, fetched_at FROM links WHERE url = ?", (url,)).fetchone()
+            fresh = row is not None and time.time() - row[1] <= self.ttl
+            self.stats["hits" if fresh else "misses"] += 1
+        return serialization.loads(row[0]) if fresh else None
+
+    def set(self, url, enriched):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO links (url, enriched, fetched_at) VALUES (?, ?, ?)",
+                (url, serialization.dumps(enriched, default=str), time.time())
+            )
+            self.connection.commit()
+
+
+class LinkEnricher:
+    '''
+    Enriches links (see enrich_links.enrich_link) for all the conflict blocks of a run.
+
+    - Each URL is enriched once per run: blocks asking for a URL that is already being enriched wait for the same task.
+    - Results are kept in an on-disk cache with TTL, so they are reused across runs. Finished tasks are only kept in
+      memory if their result is not cached (at most `max_kept` of them); tasks that failed are dropped, so the
+      link is enriched again the next time it is asked for.
+    - At most `max_concurrent` links are enriched at a time, and `max_per_host` for each host.
+    '''
+
+    def __init__(self, cache=None, max_concurrent=MAX_CONCURRENT_LINKS, max_per_host=MAX_CONCURRENT_LINKS_PER_HOST,
+                 max_kept=MAX_UNCACHED_LINKS_KEPT):
+        self.cache = cache
+        self.max_per_host = max_per_host
+        self.max_kept = max_kept
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.host_semaphores = {}
+        self.tasks = OrderedDict()
+
+    def _host_semaphore(self, url):
+        host = urlparse(url).netloc.lower()
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self.host_semaphores[host]
+
+    async def _enrich(self, url):
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get, url)
+            if cached is not None:
+                return cached
+
+        async with self._host_semaphore(url), self.semaphore:
+            enriched = await enrich_links.enrich_link(url)
+
+        if self.cache and is_cacheable(enriched):
+            await asyncio.to_thread(self.cache.set, url, enriched)
+        return enriched
+
+    def _task_done(self, url, task):
+        if self.tasks.get(url) is not task:
+            return
+        if task.cancelled() or task.exception() is not None or (self.cache and is_cacheable(task.result())):
+            # failed, or reused from the link cache from now on
+            del self.tasks[url]
+            return
+
+        finished = [key for key, other in self.tasks.items() if other.done()]
+        for key in finished[:max(0, len(finished) - self.max_kept)]:
+            del self.tasks[key]
+
+    async def enrich(self, url):
+        '''
+        Returns the enriched link, enriching it only if it was not enriched before in this run.
+        '''
+        task = self.tasks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._enrich(url))
+            task.add_done_callback(lambda task, url=url: self._task_done(url, task))
+            self.tasks[url] = task
+        else:
+            self.tasks.move_to_end(url)
+        return await task
+
+    async def enrich_many(self, urls):
+        '''
+        Enriches several links concurrently. Returns a dictionary: url -> enriched link.
+        '''
+        urls = list(dict.fromkeys(url for url in urls if url))
+        results = await asyncio.gather(*[self.enrich(url) for url in urls])
+        return dict(zip(urls, results))
+
+
+_enrichers = {}
+
+
+def get_link_enricher():
+    '''
+    Returns the link enricher of the running event loop, so that links are deduplicated across all the blocks of a run.
+    '''
+    loop = asyncio.get_running_loop()
+    if loop not in _enrichers:
+        cache = LinkCache(LINK_CACHE_PATH) if LINK_CACHE_PATH else None
+        _enrichers.clear()  # enrichers of finished runs (other event loops) are not needed anymore
+        _enrichers[loop] = LinkEnricher(cache)
+    return _enrichers[loop]
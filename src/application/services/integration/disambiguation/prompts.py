@@ -1,14 +1,16 @@
 import json
+import hashlib
 import logging
 import tiktoken
 
 from typing import List
+from collections import OrderedDict
 from jinja2 import Template
 from functools import lru_cache
 from pathlib import Path
 from pprint import pprint
 
-from src.application.services.integration.disambiguation.utils import get_pub
+from src.application.services.integration.disambiguation.config import TOKEN_COUNT_CACHE_SIZE
 
 MAX_TOTAL_TOKENS = 130000  
 
@@ -22,12 +24,28 @@ MAX_TOTAL_TOKENS = 130000
 def get_tokenizer(model="gpt-4"):
     return tiktoken.encoding_for_model(model)
 
+# Token counts by (model, hash of the text). The same contents are sent in the prompts of every pair of a block,
+# so they are only encoded once. Bounded to the TOKEN_COUNT_CACHE_SIZE most recently used contents.
+_token_counts = OrderedDict()
+
+
+def content_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 def count_tokens(text, model="gpt-4") -> int:
-    return len(get_tokenizer(model).encode(text))
+    key = (model, content_hash(text))
+    count = _token_counts.get(key)
+    if count is None:
+        count = len(get_tokenizer(model).encode(text))
+        _token_counts[key] = count
+        if len(_token_counts) > TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    else:
+        _token_counts.move_to_end(key)
+    return count
 
 def estimate_total_tokens(messages, model="gpt-4"):
-    enc = get_tokenizer(model)
-    return sum(len(enc.encode(msg["content"])) for msg in messages)
+    return sum(count_tokens(msg["content"], model=model) for msg in messages)
 
 
 # -------------------------------
@@ -43,7 +61,6 @@ def build_chat_messages_with_disconnected(
     model="gpt-4"
 ):
     messages = [{"role": "user", "content": instruction_prompt}]
-    enc = get_tokenizer(model)
 
     def chunk_entries(entries: List[dict]):
         chunks = []
@@ -51,14 +68,11 @@ def build_chat_messages_with_disconnected(
         current_token_count = 0
 
         for entry in entries:
-            new_pubs = []
-            if entry['publication']:
-                new_pubs.append(get_pub(entry['publication']))
-            entry['publication'] = new_pubs
+            # publications were already resolved by filter_relevant_fields
             print('Entry')
             pprint(entry)
             entry_json = json.dumps(entry, ensure_ascii=False)
-            entry_tokens = len(enc.encode(entry_json))
+            entry_tokens = count_tokens(entry_json, model=model)
 
             if current_token_count + entry_tokens > max_tokens_per_chunk:
                 chunks.append(current_chunk)
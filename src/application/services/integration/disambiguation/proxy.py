@@ -1,17 +1,30 @@
 import logging
 import requests
-import json
 import re
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from src.application.services import serialization
 from src.application.services.integration.disambiguation.config import (
     OR_API_URL,
     OR_API_KEY,
     HF_API_URL,
     HF_API_KEY,
+    AGREEMENT_MODELS,
 )
+from src.application.services.integration.disambiguation.rate_limit import get_rate_limiter
+from src.application.services.integration.disambiguation.verdict_cache import cached_model_query
 
+OPENROUTER_TEMPERATURE = 0.2
 
+# HTTP session shared by the model clients, so that connections to the providers are pooled and
+# reused across requests and across the threads of the concurrent disambiguation
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+
+@cached_model_query(temperature=OPENROUTER_TEMPERATURE)
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
 def query_openrouter(messages, model):
     headers = {
@@ -21,12 +34,13 @@ def query_openrouter(messages, model):
     payload = {
         "model": model,
         "messages": messages,
-        "temperature": 0.2
+        "temperature": OPENROUTER_TEMPERATURE
     }
 
+    get_rate_limiter("openrouter").acquire()
     logging.info(f"Sending request to OpenRouter API: {OR_API_URL} with key {OR_API_KEY[:4]}...")
     
-    response = requests.post(OR_API_URL, json=payload, headers=headers )
+    response = session.post(OR_API_URL, json=payload, headers=headers )
     
     if response.status_code == 200:
         try:
@@ -45,6 +59,7 @@ def query_openrouter(messages, model):
 
 
 
+@cached_model_query()
 #@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
 def query_huggingface_new(messages, model, provider):
     headers = {
@@ -56,9 +71,10 @@ def query_huggingface_new(messages, model, provider):
     }
      
     URL = f"https://router.huggingface.co/{provider}/v1/chat/completions"
+    get_rate_limiter("huggingface").acquire()
     logging.info(f"Sending request to Hugging Face Inference API: {URL} with key {HF_API_KEY[:4]}...")
     
-    response = requests.post(URL, headers=headers, json=payload, verify=False)
+    response = session.post(URL, headers=headers, json=payload, verify=False)
     response.raise_for_status()
 
     if response.status_code == 200:
@@ -111,48 +127,55 @@ def query_huggingface(messages, model):
     return None
 
 
-def decision_agreement_proxy(messages: str) -> str:
+def query_model(model_spec: dict, messages):
     """
-    This function takes a message as input and returns the agreement of the models.
-    It uses the `decision_agreement` function from the `decision_agreement` module.
+    Query a model of the agreement panel with the client of its provider.
+    - model_spec: entry of AGREEMENT_MODELS, e.g. {"name": "mixtral", "client": "openrouter", "model": "mistralai/mixtral-8x7b-instruct"}
     """
-    # model 1: Llama 4 Scout
-    model = "meta-llama/Llama-4-Scout-17B-16E-Instruct"
-    provider = "together"
-    result_llama_4, meta_llama_4 = query_huggingface_new(messages, model=model, provider=provider)
-    try:
-        result_llama_4 = parse_result(result_llama_4)
-    except Exception as e:
-        logging.warning(f"Parsing error: {e} | Response: {result_llama_4}")
-        result_llama_4 = {}
-
-    # model 2: Mixtral 8x7B
-    model = "mistralai/mixtral-8x7b-instruct"
-    result_mixtral, meta_mixtral = query_openrouter(messages, model=model)
-    try:
-        result_mixtral = parse_result(result_mixtral)
-    except Exception as e:
-        result_mixtral = {}
-    
-    # agreement
-    result_llama_4_verdict = result_llama_4.get("verdict", None)
-    result_mixtral_verdict = result_mixtral.get("verdict", None)
-    # if both models agree, return the result
-    if result_llama_4_verdict == result_mixtral_verdict:
-        if result_llama_4_verdict != None:
-            return {
-                'verdict': result_llama_4_verdict,
-                'llama_4': result_llama_4,
-                'mixtral': result_mixtral
-            }
-        # If models agree and are None, human annotation is needed
-        
+    client = model_spec["client"]
+    if client == "huggingface":
+        return query_huggingface_new(messages, model=model_spec["model"], provider=model_spec["provider"])
+    elif client == "openrouter":
+        return query_openrouter(messages, model=model_spec["model"])
+    raise ValueError(f"Unknown model client: {client}")
+
+
+def combine_verdicts(results: dict) -> dict:
+    """
+    Combine the parsed answers of the models (model name -> answer) into a decision.
+    The verdict is the one given by all the models. If they disagree, or none of them gave a verdict,
+    the verdict is "disagreement" and human annotation is needed.
+    """
+    verdicts = {result.get("verdict", None) for result in results.values()}
+    if len(verdicts) == 1 and None not in verdicts:
+        verdict = verdicts.pop()
     else:
-        return {
-            "verdict": "disagreement",
-            "llama_4": result_llama_4,
-            "mixtral": result_mixtral,
-        }
+        verdict = "disagreement"
+
+    return {"verdict": verdict, **results}
+
+
+def decision_agreement_proxy(messages: str, models: list = None) -> dict:
+    """
+    This function takes a message as input and returns the agreement of the models.
+    All the models of the panel (AGREEMENT_MODELS by default) are queried at the same time, and
+    the result contains the verdict and the answer of each model, under its name.
+    """
+    models = models or AGREEMENT_MODELS
+
+    with ThreadPoolExecutor(max_workers=len(models)) as executor:
+        futures = {spec["name"]: executor.submit(query_model, spec, messages) for spec in models}
+        answers = {name: future.result()[0] for name, future in futures.items()}
+
+    results = {}
+    for name, answer in answers.items():
+        try:
+            results[name] = parse_result(answer)
+        except Exception as e:
+            logging.warning(f"Parsing error: {e} | Response: {answer}")
+            results[name] = {}
+
+    return combine_verdicts(results)
 
 
 def parse_result(text):
@@ -183,7 +206,7 @@ def parse_result(text):
             return {}
 
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return serialization.loads(json_str)
+    except serialization.JSONDecodeError as e:
         logging.warning(f"Failed to parse JSON: {e}")
         return {}
\ No newline at end of file
@@ -0,0 +1,47 @@
+import time
+import threading
+import logging
+
+from src.application.services.integration.disambiguation.config import PROVIDER_REQUESTS_PER_MINUTE
+
+
+class RateLimiter:
+    '''
+    Spaces out the requests to a provider so that no more than `requests_per_minute` are sent.
+    It is thread-safe, as the model clients are called from worker threads.
+    '''
+
+    def __init__(self, requests_per_minute: float):
+        self.interval = 60 / requests_per_minute if requests_per_minute else 0
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        '''
+        Blocks until the next request can be sent.
+        '''
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> RateLimiter:
+    '''
+    Returns the rate limiter shared by all the requests to a provider (e.g. "openrouter", "huggingface").
+    Providers not listed in PROVIDER_REQUESTS_PER_MINUTE are not limited.
+    '''
+    with _limiters_lock:
+        if provider not in _limiters:
+            requests_per_minute = PROVIDER_REQUESTS_PER_MINUTE.get(provider)
+            logging.debug(f"Rate limit for {provider}: {requests_per_minute or 'none'} requests per minute")
+            _limiters[provider] = RateLimiter(requests_per_minute)
+        return _limiters[provider]
@@ -0,0 +1,212 @@
+import os
+import threading
+
+from src.application.services import serialization
+from src.application.services.integration.disambiguation.config import COMPACTION_MIN_STALE_RECORDS
+
+# Key of the lines that mark a record as removed: {"__removed__": key}
+REMOVED = "__removed__"
+
+
+def repair_jsonl_tail(path):
+    """
+    Make sure a JSONL file ends with a newline before records are appended to it.
+    If the last line is incomplete (interrupted write), it is removed. If it is a valid record, the newline is added.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b'\n':
+            return
+
+        # find the start of the last line
+        start = size - 1
+        while start > 0:
+            step = min(4096, start)
+            f.seek(start - step)
+            newline = f.read(step).rfind(b'\n')
+            if newline != -1:
+                start = start - step + newline + 1
+                break
+            start -= step
+
+        f.seek(start)
+        last_line = f.read()
+        try:
+            serialization.loads(last_line)
+        except ValueError:
+            print(f"Removing incomplete last line of {path}")
+            f.seek(start)
+            f.truncate()
+        else:
+            f.write(b'\n')
+
+
+class JsonlRecordStore:
+    '''
+    Keyed records ({key: value} lines) kept in a JSONL file used as an append-only log.
+
+    - Adding, updating and removing a record appends a single line, so they take constant time. When a key
+      appears several times, the last line wins; removals are marked with a {"__removed__": key} line.
+    - The records are kept in memory once loaded. Lines appended to the file by other writers (or processes)
+      are read incrementally on the next load; if the file is replaced or truncated, it is read again.
+    - The log is compacted (rewritten with one line per record, in the order in which records were first
+      added) when most of its lines are stale, and on `compact`. A compacted file is a plain JSONL export.
+    - The tail of the file is repaired (see `repair_jsonl_tail`) before the first append to it, and again only
+      if the file is replaced.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        self.repaired_id = None  # file whose tail was already repaired
+        self._reset()
+
+    def _reset(self):
+        self.records = {}
+        self.loaded = False
+        self.size = 0  # bytes of the file already read
+        self.file_id = None
+        self.lines = 0  # complete lines in the file, including stale ones
+
+    def _apply(self, record):
+        if not isinstance(record, dict):
+            raise ValueError("Each line must be a dictionary")
+        for key, value in record.items():
+            if key == REMOVED:
+                self.records.pop(value, None)
+            else:
+                self.records[key] = value
+
+    def _read(self):
+        '''
+        Reads the lines appended to the file since it was last read.
+        An incomplete last line (interrupted write) is left for a later read.
+        '''
+        stat = os.stat(self.path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self.file_id or stat.st_size < self.size:
+            self._reset()
+            self.file_id = file_id
+
+        with open(self.path, 'rb') as f:
+            f.seek(self.size)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                self.size += len(line)
+                if not line.strip():
+                    continue
+                self.lines += 1
+                try:
+                    record = serialization.loads(line)
+                except serialization.JSONDecodeError as e:
+                    print(f"Skipping invalid line: {e}")
+                    continue
+                self._apply(record)
+        self.loaded = True
+
+    def load(self) -> dict:
+        '''
+        Returns all the records: key -> value. Raises FileNotFoundError if the file does not exist.
+        The dictionary is the one kept by the store (not a copy), so it must not be modified. It is
+        updated by the writes of the store, and replaced if the file has to be read again from the start.
+        '''
+        with self.lock:
+            self._read()
+            return self.records
+
+    def get(self, key, default=None):
+        with self.lock:
+            if os.path.exists(self.path):
+                self._read()
+            return self.records.get(key, default)
+
+    def _append(self, record):
+        if not os.path.exists(self.path) or self._file_id() != self.repaired_id:
+            repair_jsonl_tail(self.path)
+        line = serialization.dumpb(record) + b'\n'
+        with open(self.path, 'ab') as f:
+            start = f.tell()
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.repaired_id = self._file_id()
+
+        # Records are applied in memory only if nothing else was appended since the file was read
+        if self.loaded and start == self.size and self.file_id == self.repaired_id:
+            self._apply(record)
+            self.size += len(line)
+            self.lines += 1
+            self._compact_if_stale()
+
+    def _file_id(self):
+        stat = os.stat(self.path)
+        return (stat.st_dev, stat.st_ino)
+
+    def add(self, record: dict):
+        '''
+        Adds (or replaces) the records of a dictionary, written as a single line.
+        '''
+        with self.lock:
+            self._append(record)
+
+    def update(self, key, value):
+        with self.lock:
+            self._append({key: value})
+
+    def remove(self, key) -> bool:
+        '''
+        Removes a record. Returns False if it did not exist.
+        '''
+        with self.lock:
+            if os.path.exists(self.path):
+                self._read()
+            if key not in self.records:
+                return False
+            self._append({REMOVED: key})
+            return True
+
+    def _compact_if_stale(self):
+        stale = self.lines - len(self.records)
+        if stale >= COMPACTION_MIN_STALE_RECORDS and stale > len(self.records):
+            self.compact()
+
+    def compact(self):
+        '''
+        Rewrites the file with one line per record.
+        '''
+        with self.lock:
+            self._read()
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'wb') as f:
+                for key, value in self.records.items():
+                    f.write(serialization.dumpb({key: value}) + b'\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+
+            stat = os.stat(self.path)
+            self.file_id = self.repaired_id = (stat.st_dev, stat.st_ino)
+            self.size = stat.st_size
+            self.lines = len(self.records)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_record_store(path) -> JsonlRecordStore:
+    '''
+    Returns the record store of a JSONL file, shared by all the readers and writers of the process.
+    '''
+    key = os.path.abspath(path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = JsonlRecordStore(path)
+        return _stores[key]
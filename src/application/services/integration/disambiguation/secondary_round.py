@@ -1,19 +1,27 @@
 from src.application.services.integration.disambiguation.utils import load_dict_from_jsonl, add_jsonl_record, update_jsonl_record
+from src.application.services.integration.block_stream import BlockFile
 from datetime import datetime
+from collections import ChainMap
+import os
 import json
+import time
+import logging
 from pprint import pprint
 
 
 
-def generate_secondary_conflicts(disambiguated_blocks):
+def generate_secondary_conflicts(disambiguated_blocks, keys=None, start=0):
     """
     Create new conflict blocks from unresolved entries in disambiguated_blocks.
+    - keys: records to look at (e.g. the ones produced in the last round). By default, all of them.
+    - start: number of secondary conflicts generated before, so that new ids do not collide with them.
     """
     secondary_conflict = {}
     secondary_block = {}
-    secondary_counter = 0
+    secondary_counter = start
 
-    for parent_id, record in disambiguated_blocks.items():
+    for parent_id in (disambiguated_blocks if keys is None else keys):
+        record = disambiguated_blocks[parent_id]
         unmerged = record.get("unmerged_entries", [])
         resolution = record.get("resolution", None)
         if len(unmerged) > 1 and resolution!= "manual_review_pending":
@@ -38,37 +46,60 @@ def generate_secondary_conflicts(disambiguated_blocks):
 
 
 
-async def run_second_round(conflict_blocks_path, disambiguated_blocks_path, blocks, blocks_path, disambiguate_blocks_func):
-    """
-    Loads existing disambiguation results and conflict blocks,
-    generates second-round conflicts, and runs disambiguation again.
-    """
-    # Load files
-    disambiguated_blocks = load_dict_from_jsonl(disambiguated_blocks_path)
-    conflict_blocks = load_dict_from_jsonl(conflict_blocks_path)
-
-
-    # Generate secondary conflict blocks
-    secondary_conflict, secondary_block = generate_secondary_conflicts(disambiguated_blocks)
-
-    if not secondary_conflict:
-        print("No secondary conflicts to process.")
-        return disambiguated_blocks
-
-    # Update conflict_blocks.json and  blocks with secondary round blocks
-    conflict_blocks.update(secondary_conflict)
-    blocks.update(secondary_block)
-
-
+def save_secondary_conflicts(secondary_conflict, secondary_block, conflict_blocks_path, blocks_path):
     for key in secondary_conflict:
-        update_jsonl_record(conflict_blocks_path, key, secondary_conflict)
-        update_jsonl_record(blocks_path, key, secondary_block)
+        update_jsonl_record(conflict_blocks_path, key, secondary_conflict[key])
+        update_jsonl_record(blocks_path, key, secondary_block[key])
 
-    print(f"🔁 {len(secondary_conflict)} secondary conflict blocks generated and added.")
 
-    # Re-run disambiguation on new conflicts
-    updated_disambiguated_blocks = await disambiguate_blocks_func(conflict_blocks, blocks, disambiguated_blocks_path)
+async def disambiguate_until_converged(blocks_path, conflict_blocks_path, disambiguated_blocks_path, disambiguate_blocks_func):
+    """
+    Disambiguates blocks in rounds until no conflict is left, driven by a work queue.
 
-    print("✅ Second round of disambiguation completed.")
-    return updated_disambiguated_blocks
+    The first queue holds the blocks without a disambiguated record. After each round, secondary conflicts
+    are generated only from the records produced in that round, and only them are queued for the next one.
+    When resuming, records whose secondary conflicts were not generated yet (according to the
+    "parent_block_id" of the conflict blocks) are taken into account too.
 
+    The blocks are not loaded: they are read by key from the blocks file (see BlockFile), and only the
+    secondary blocks generated in this run are kept in memory.
+    """
+    secondary_blocks = {}
+    blocks = ChainMap(secondary_blocks, BlockFile(blocks_path, save_index=True))
+    conflict_blocks = load_dict_from_jsonl(conflict_blocks_path)
+    disambiguated_blocks = load_dict_from_jsonl(disambiguated_blocks_path) if os.path.exists(disambiguated_blocks_path) else {}
+
+    expanded = {block.get("parent_block_id") for block in conflict_blocks.values() if isinstance(block, dict) and block.get("parent_block_id")}
+    secondary_count = sum(1 for block in conflict_blocks.values() if isinstance(block, dict) and block.get("parent_block_id"))
+
+    queue = [key for key in blocks if key not in disambiguated_blocks]
+    new_records = [key for key in disambiguated_blocks if key not in expanded]
+    round_number = 0
+
+    while True:
+        secondary_conflict, secondary_block = generate_secondary_conflicts(disambiguated_blocks, keys=new_records, start=secondary_count)
+        if secondary_conflict:
+            save_secondary_conflicts(secondary_conflict, secondary_block, conflict_blocks_path, blocks_path)
+            conflict_blocks = load_dict_from_jsonl(conflict_blocks_path)
+            secondary_blocks.update(secondary_block)
+            secondary_count += len(secondary_conflict)
+            print(f"🔁 {len(secondary_conflict)} secondary conflict blocks generated and added.")
+
+        queue = [key for key in dict.fromkeys(queue + list(secondary_conflict)) if key not in disambiguated_blocks]
+        if not queue:
+            print("✨All conflicts resolved.")
+            return disambiguated_blocks
+
+        round_number += 1
+        conflicts_in_queue = sum(1 for key in queue if key in conflict_blocks)
+        logging.info(f"Round {round_number}: {len(queue)} blocks queued ({conflicts_in_queue} conflict blocks)")
+        start_time = time.perf_counter()
+
+        disambiguated_blocks = await disambiguate_blocks_func(conflict_blocks, blocks, disambiguated_blocks_path, keys=queue)
+
+        new_records = [key for key in queue if key in disambiguated_blocks]
+        logging.info(f"Round {round_number} done in {time.perf_counter() - start_time:.1f}s: {len(new_records)} records, {len(queue) - len(new_records)} blocks left")
+        if not new_records:
+            logging.warning(f"No block was disambiguated in round {round_number}. Stopping.")
+            return disambiguated_blocks
+        queue = []
@@ -2,37 +2,13 @@ from bson import ObjectId
 import json
 import os
 from pprint import pprint 
-
-def build_instances_keys_dict():
-    from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
-
-    # Step 1: Build a publication lookup dict with stringified ObjectIds
-    publication_dict = {
-        str(doc['_id']): {**doc, "_id": str(doc['_id'])}
-        for doc in mongo_adapter.fetch_entries( "publicationsMetadataDev", {})
-    }
-    # Step 2: Build the main document dictionary and replace data.publication
-    doc_dict = {}
-    for doc in mongo_adapter.fetch_entries( "pretoolsDev", {}):
-        pub_ids= doc.get('data', {}).get('publication')
-        pubs = []
-        for pub_id in pub_ids:
-            if isinstance(pub_id, ObjectId):
-                pubs.append(pub_id)
-        
-        doc['data']['publication'] = pubs
-        doc['_id'] = str(doc['_id'])
-
-        doc_dict[doc['_id']] = doc
-
-    return doc_dict
+from src.application.services.integration.disambiguation.entry_loader import get_entry_loader, PRETOOLS, PUBLICATIONS
+from src.application.services.integration.disambiguation.record_store import get_record_store, repair_jsonl_tail
 
 
 def get_pub(object_id):
-    from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
-
-    publication = mongo_adapter.fetch_entry( "publicationsMetadataDev", object_id)
-    # Step 2: Build the main document dictionary and replace data.publication
+    # Served by the entry loader, which usually has it prefetched along with its conflict block
+    publication = get_entry_loader().get(PUBLICATIONS, object_id)
     
     if publication:
         return publication.get('data')
@@ -40,74 +16,31 @@ def get_pub(object_id):
         return None
 
 def load_dict_from_jsonl(path):
-    result = {}
-    with open(path, 'r') as f:
-        for line in f:
-            try:
-                entry = json.loads(line)
-                if not isinstance(entry, dict):
-                    raise ValueError("Each line must be a dictionary")
-                result.update(entry)
-            except json.JSONDecodeError as e:
-                print(f"Skipping invalid line: {e}")
-    return result
+    # Records are kept in memory by the store; only lines appended since the last load are parsed
+    return get_record_store(path).load()
 
 
 def remove_jsonl_record(path, target_key):
     print(f'Removing record(s) with key: {target_key}')
-    temp_path = path + '.tmp'
-    removed = False
-
-    with open(path, 'r') as infile, open(temp_path, 'w') as outfile:
-        for line in infile:
-            try:
-                record = json.loads(line)
-                key = next(iter(record))
-                if key != target_key:
-                    json.dump(record, outfile)
-                    outfile.write('\n')
-                else:
-                    removed = True
-            except json.JSONDecodeError:
-                continue  # optionally log or keep corrupted lines
-
-    if removed:
-        os.replace(temp_path, path)
-    else:
-        os.remove(temp_path)
+    if not get_record_store(path).remove(target_key):
         print(f'Key {target_key} not found.')
 
 
 def update_jsonl_record(path, updated_key, new_value):
     print(f'Updating record with key: {updated_key}')
-    updated = False
-    temp_path = path + '.tmp'
-
-    with open(path, 'r') as infile, open(temp_path, 'w') as outfile:
-        for line in infile:
-            try:
-                record = json.loads(line)
-                key = next(iter(record))
-                if key == updated_key:
-                    json.dump({updated_key: new_value}, outfile)
-                    updated = True
-                else:
-                    json.dump(record, outfile)
-                outfile.write('\n')
-            except json.JSONDecodeError:
-                continue  # optionally log bad lines
-
-    if not updated:
-        with open(temp_path, 'a') as outfile:
-            json.dump({updated_key: new_value}, outfile)
-            outfile.write('\n')
-
-    os.replace(temp_path, path)  # atomic rename
+    get_record_store(path).update(updated_key, new_value)
+
 
 def add_jsonl_record(path, new_record):
-    with open(path, 'a') as f:
-            json.dump(new_record, f)
-            f.write('\n')
+    # The record is appended in a single call and synced, so that an interruption cannot leave half a line
+    get_record_store(path).add(new_record)
+
+
+def export_jsonl(path):
+    """
+    Compact a JSONL record file, so that it has a single line per key (plain JSONL).
+    """
+    get_record_store(path).compact()
 
 
 def process_publications(publications):
@@ -118,32 +51,33 @@ def process_publications(publications):
     if not publications:
         return []
     else:
+        # All the publications of the entry are fetched at once (if they were not prefetched)
+        ids = [publication for publication in publications if isinstance(publication, ObjectId)]
+        documents = dict(zip(ids, get_entry_loader().get_many(PUBLICATIONS, ids)))
+
         processed_publications = []
         for publication in publications:
             if isinstance(publication, ObjectId):
-                publication_str = str(publication)
-                processed_publications.append(get_pub(publication_str))
+                document = documents[publication]
+                processed_publications.append(document.get('data') if document else None)
             else:
                 processed_publications.append(publication)
         return processed_publications
 
 
-def replace_with_full_entries(conflict, instances_dict):
-    from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
+def replace_with_full_entries(conflict):
+    """
+    Replace the summary entries of a conflict with the full pretools entries.
+    Entries are served by the entry loader (see EntryLoader.prefetch_conflicts); the ones not
+    prefetched are fetched in a single query.
+    """
+    loader = get_entry_loader()
+    loader.prefetch_conflicts([conflict])
+
     new_conflict = {
-        "disconnected": [],
-        "remaining": [],
+        "disconnected": loader.get_many(PRETOOLS, [entry["id"] for entry in conflict['disconnected']]),
+        "remaining": loader.get_many(PRETOOLS, [entry["id"] for entry in conflict['remaining']]),
     }
-    for entry in conflict['disconnected']:
-        entry_id = entry["id"]
-        new_entry = mongo_adapter.fetch_entry("pretoolsDev", entry_id)
-        new_conflict['disconnected'].append(new_entry)
-
-    
-    for entry in conflict['remaining']:
-        entry_id = entry["id"]
-        new_entry = mongo_adapter.fetch_entry("pretoolsDev", entry_id)
-        new_conflict['remaining'].append(new_entry)
 
     return new_conflict
 
@@ -185,7 +119,7 @@ def filter_relevant_fields(conflict):
             "source": entry["data"].get("source"),
             "license": entry["data"].get("license"),
             "authors": entry["data"].get("authors"),
-            "publication": entry["data"].get("publication"),
+            "publication": process_publications(entry["data"].get("publication")),
             "documentation": entry["data"].get("documentation")
         }
         filtered_conflict["remaining"].append(filtered_entry)
@@ -0,0 +1,128 @@
+import os
+import json
+import sqlite3
+import hashlib
+import logging
+import threading
+import functools
+from datetime import datetime
+
+from src.application.services import serialization
+from src.application.services.integration.disambiguation.config import VERDICT_CACHE_PATH
+
+
+def normalize_messages(messages):
+    '''
+    Messages as they are compared by the cache: only role and content, without surrounding whitespace.
+    '''
+    return [{"role": m.get("role"), "content": (m.get("content") or "").strip()} for m in messages]
+
+
+def verdict_cache_key(model, messages, temperature=None, **params):
+    '''
+    Hash of everything that determines the answer of a model: model, normalized messages, temperature and
+    any other request parameter (e.g. the Hugging Face provider).
+    '''
+    payload = {
+        "model": model,
+        "messages": normalize_messages(messages),
+        "temperature": temperature,
+        "params": params,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    '''
+    On-disk (SQLite) cache of the answers of the models, keyed by `verdict_cache_key`.
+    The raw answers are stored, so changes in the parsing or combination of verdicts apply to cached answers too.
+    It can be shared by several threads.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            "key TEXT PRIMARY KEY, model TEXT, answer TEXT, meta TEXT, created_at TEXT)"
+        )
+        self.connection.commit()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, key):
+        '''
+        Returns the cached (answer, meta) for the key, or None.
+        '''
+        with self.lock:
+            row = self.connection.execute("SELECT answer, meta FROM verdicts WHERE key = ?", (key,)).fetchone()
+            self.stats["hits" if row else "misses"] += 1
+        if row:
+            return row[0], serialization.loads(row[1])
+        return None
+
+    def set(self, key, model, answer, meta):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, model, answer, meta, created_at) VALUES (?, ?, ?, ?, ?)",
+                (key, model, answer, serialization.dumps(meta or {}), datetime.now().isoformat())
+            )
+            self.connection.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+
+
+_verdict_cache = None
+_verdict_cache_lock = threading.Lock()
+
+
+def get_verdict_cache():
+    '''
+    Returns the verdict cache of this process, at VERDICT_CACHE_PATH. None if the cache is disabled (empty path).
+    '''
+    global _verdict_cache
+    if not VERDICT_CACHE_PATH:
+        return None
+    with _verdict_cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(VERDICT_CACHE_PATH)
+        return _verdict_cache
+
+
+def verdict_cache_stats():
+    '''
+    Hits and misses of the verdict cache in this process, or None if it has not been used.
+    '''
+    return dict(_verdict_cache.stats) if _verdict_cache is not None else None
+
+
+def cached_model_query(temperature=None):
+    '''
+    Decorator for the model clients (query(messages, model, **params) -> (answer, meta)).
+    The cache is checked before the request is sent, and non-empty answers are stored.
+    - temperature: temperature used by the client, which is part of the cache key.
+    '''
+    def decorator(query):
+        @functools.wraps(query)
+        def wrapper(messages, model, **params):
+            cache = get_verdict_cache()
+            if cache is None:
+                return query(messages, model=model, **params)
+
+            key = verdict_cache_key(model, messages, temperature, **params)
+            cached = cache.get(key)
+            if cached is not None:
+                logging.info(f"Cached answer of {model} ({cache.stats})")
+                return cached
+
+            answer, meta = query(messages, model=model, **params)
+            if answer:
+                cache.set(key, model, answer, meta)
+            return answer, meta
+        return wrapper
+    return decorator
@@ -1,34 +1,10 @@
 import json
 from collections import defaultdict
-from urllib.parse import urlparse
 
-# Merges groups with shared links and same name and updated the grouped.json file
-
-def normalize_url(url):
-    """Normalize a URL by removing the protocol, trailing slash, query parameters, and handling Bioconductor package URLs."""
-    if not url:
-        return None
-
-    parsed_url = urlparse(url)
-    netloc = parsed_url.netloc.lower()
-    path = parsed_url.path.rstrip('/')
-
-    # Remove query parameters and fragments
-    path = path.split('?')[0].split('#')[0]
-
-    # Remove '.html' from the end of Bioconductor URLs
-    if path.endswith('.html'):
-        path = path[:-5]
-
-    # Handle Bioconductor package URLs
-    if 'bioconductor.org' in netloc:
-        parts = path.split('/')
-        for part in reversed(parts):
-            if part and part not in ('release', 'bioc', 'html', 'packages'):
-                return f"bioconductor.org/packages/{part}"
-
-    return f"{netloc}{path}"
+from src.application.services.integration.grouping_engine import DisjointSet
+from src.application.services.integration.url_normalization import instance_links
 
+# Merges groups with shared links and same name and updated the grouped.json file
 
 def find_shared_links_accross_groups(data):
     """
@@ -47,8 +23,7 @@ def find_shared_links_accross_groups(data):
         instances = group_data.get("instances", [])
 
         for instance in instances:
-            repo_links = {normalize_url(repo["url"]) for repo in instance["data"].get("repository", []) if repo.get("url")}
-            webpage_links = {normalize_url(url) for url in instance["data"].get("webpage", []) if url}
+            repo_links, webpage_links = instance_links(instance)
             combined_links = repo_links | webpage_links  # Union of both sets
 
             # Assign each link to its corresponding group key
@@ -86,47 +61,72 @@ def create_new_group_key(group):
         return f"{name}/*"
 
 
+def merge_overlapping_groups(unique_name_groups):
+    """
+    Merge the groups of keys that share at least one key, transitively, using a disjoint-set over the keys.
+
+    Args:
+        unique_name_groups (list): Lists of group keys with the same name and a common link. The same list can appear several times.
+
+    Returns:
+        list: Disjoint lists of sorted group keys, in order of first appearance.
+    """
+    sets = DisjointSet()
+    key_nodes = {}
+    for group in unique_name_groups:
+        for key in group:
+            if key not in key_nodes:
+                key_nodes[key] = sets.add()
+        for key in group[1:]:
+            sets.union(key_nodes[group[0]], key_nodes[key])
+
+    components = {}
+    for key, node in key_nodes.items():
+        components.setdefault(sets.find(node), []).append(key)
+
+    return [sorted(keys) for keys in components.values()]
+
+
 def update_groups(unique_name_groups, grouped_instancies):
-    # 1. Add the new merged groups (new merged key and full instances as values) and remove the original groups
-    seen_keys = set()
-    seen_groups = []
+    # Add the new merged groups (new merged key and full instances as values) and remove the original groups.
+    # unique_name_groups must be disjoint (see merge_overlapping_groups).
     for group in unique_name_groups:
-        if group in seen_groups:
-            print(f"Group {group} already seen")
-        # 1.1. Create a new key for the merged group
+        # 1. Create a new key for the merged group
         new_group_key = create_new_group_key(group)
-        # 1.2. Create a new group with the full instances
+        # 2. Create a new group with the full instances
         new_group_instances = []
         for key in group:
-            if key not in seen_keys:
-                seen_keys.add(key)
-            else:
-                print(f"Key {key} already seen")
-                print(f"group: {group}")
             new_group_instances.extend(grouped_instancies[key]["instances"])
 
-        # 1.3 remove the original groups from the grouped_instancies. 
-        # This is doen before the addition of the new group to avoid conflicts with the new key
+        # 3. remove the original groups from the grouped_instancies. 
+        # This is done before the addition of the new group to avoid conflicts with the new key
         for key in group:
             del grouped_instancies[key]
 
-        # 1.4. Add the new group to the new dictionary
-        grouped_instancies[new_group_key] = {"instances": new_group_instances}
-
-        seen_groups.append(group)
+        # 4. Add the new group to the dictionary. If a group with the new key was not part of the merge, keep its instances too.
+        if new_group_key in grouped_instancies:
+            print(f"Group {new_group_key} already exists. Adding the instances of {group} to it")
+            grouped_instancies[new_group_key]["instances"].extend(new_group_instances)
+        else:
+            grouped_instancies[new_group_key] = {"instances": new_group_instances}
 
     return grouped_instancies
 
 
-def recover_shared_name_link(grouped_instancies):    
+def recover_shared_name_link(grouped_instancies, shared_links=None):
+    """
+    Merges the groups with the same name and a common link.
+    - grouped_instancies: group key -> {"instances": [...]}. Instances can be full entries or just their
+      identifiers (e.g. GroupingEngine.groups), as long as `shared_links` is given.
+    - shared_links: link -> keys of the groups with it (e.g. GroupingEngine.shared_links). By default, they
+      are found in the links of the instances (see find_shared_links_accross_groups).
+    """
 
     print(f"Groups of tools before recovery: {len(grouped_instancies)}")
-    print(f"Example of group keys: {list(grouped_instancies.keys())[:5]}")
-    example_key = list(grouped_instancies.keys())[0]
-    print(f"Example of group data: {grouped_instancies[example_key]}")
 
     # 1. Build the shared_links dictionary
-    shared_links = find_shared_links_accross_groups(grouped_instancies)
+    if shared_links is None:
+        shared_links = find_shared_links_accross_groups(grouped_instancies)
 
     # 2. Find same name and link occurrencies
     unique_name_groups = find_same_name_link_groups(shared_links)
@@ -134,65 +134,13 @@ def recover_shared_name_link(grouped_instancies):
     print(f"Groups of tools with same name and common link: {len(unique_name_groups)}")
     print(f"Example of groups: {unique_name_groups[:5]}")
 
-    # 3. Merge groups with same name and shared links and add to the grouped_instances dictionary
-
-    # check wether any key appears in more than one group 
-    
-    keys_in_several_groups = []
-    for key in grouped_instancies:
-        count = 0
-        for group in unique_name_groups:
-            if key in group:
-                count += 1
-        if count > 1:
-            keys_in_several_groups.append(key)
-    
-    print(f"Keys in more than one group: {len(set(keys_in_several_groups))}")
-    print(f"Keys: {keys_in_several_groups}")
-
-    # the groups containing the same keys must be merged
-    merged_groups = []
-    groups_to_remove = []
-    for key in keys_in_several_groups:
-        new_group = []
-        for group in unique_name_groups:
-            if key in group:
-                groups_to_remove.append(group)
-                if key not in new_group:
-                    new_group.extend(group)
-                    print(f"To remove: {group}")
-        if new_group not in merged_groups:
-            merged_groups.append(new_group)
-            print(f"To merge: {new_group}")
-    
-
-    print(f"Groups merged: {len(groups_to_remove)}")
-    print(groups_to_remove)
-    print(f"Groups to be merged: {len(merged_groups)}")
-    print(merged_groups)
+    # 3. Groups sharing keys (e.g. the same keys sharing several links) are merged into one
+    merged_groups = merge_overlapping_groups(unique_name_groups)
 
-    # Update the unique_name_groups list
-    new_unique_names_groups = []
-    count = 0
-    for group in unique_name_groups:
-        if group not in groups_to_remove:
-            new_unique_names_groups.append(group)
-        else:
-            print(f"Removing group: {group}")
-            count += 1
-    
-    print(f"Groups removed: {count}")
-    
-    print(f"Groups without the merged groups: {len(new_unique_names_groups)}")
-
-    for group in merged_groups:
-        new_unique_names_groups.append(group)  
-     
-    print(f"Groups of tools with same name and common link after merging: {len(new_unique_names_groups)}")
-    print(f"Example of groups: {unique_name_groups[:5]}")
+    print(f"Groups of tools with same name and common link after merging: {len(merged_groups)}")
 
-    
-    grouped_instancies = update_groups(new_unique_names_groups, grouped_instancies)
+    # 4. Merge groups with same name and shared links and add to the grouped_instances dictionary
+    grouped_instancies = update_groups(merged_groups, grouped_instancies)
     print(f"Groups of tools after recovery: {len(grouped_instancies)}")
 
     return grouped_instancies
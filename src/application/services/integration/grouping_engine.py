@@ -0,0 +1,226 @@
+import logging
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.application.services.integration.url_normalization import add_normalized_links, instance_links
+
+logger = logging.getLogger("rs-etl-pipeline")
+
+# Webpages pointing to these sites are considered repository links when grouping entries
+REPOSITORY_LINKS = ["github", "sourceforge", "gitlab", "bitbucket", "bioconductor.org/packages", "pypi.org/project/", "metacpan.org/pod/", "cran.r-project.org/package"]
+
+# Fields of the pretools entries needed to group them
+GROUPING_PROJECTION = {'data.name': 1, 'data.type': 1, 'data.repository.url': 1, 'data.webpage': 1}
+
+# Entries fetched at a time when the full documents are attached to their groups (see iter_group_blocks)
+GROUP_FETCH_BATCH = 1000
+
+
+def entry_key(entry: Dict) -> str:
+    '''
+    Name/type key of an entry. Entries without a type (or with "undefined" type) get the wildcard type "*".
+    '''
+    name = entry['data']['name'].lower()
+    software_type = entry['data'].get('type') or '*'
+    if software_type == 'undefined':
+        software_type = '*'
+    return f"{name}/{software_type}"
+
+
+def entry_links(entry: Dict) -> Set[str]:
+    '''
+    Normalized repository links of an entry, including webpages hosted in repository sites.
+    '''
+    return repository_links(*instance_links(entry))
+
+
+def repository_links(repo_links: Set[str], webpage_links: Set[str]) -> Set[str]:
+    return repo_links | {link for link in webpage_links if any(repo_link in link for repo_link in REPOSITORY_LINKS)}
+
+
+class DisjointSet:
+    '''
+    Disjoint-set (union-find) over consecutive integer ids, with path compression and union by rank.
+    Each set also tracks its smallest id, which is used to name it.
+    '''
+
+    def __init__(self):
+        self.parent: List[int] = []
+        self.rank: List[int] = []
+        self.smallest: List[int] = []
+
+    def __len__(self):
+        return len(self.parent)
+
+    def add(self) -> int:
+        node = len(self.parent)
+        self.parent.append(node)
+        self.rank.append(0)
+        self.smallest.append(node)
+        return node
+
+    def find(self, node: int) -> int:
+        root = node
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # path compression
+        while self.parent[node] != root:
+            self.parent[node], node = root, self.parent[node]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        self.smallest[root_a] = min(self.smallest[root_a], self.smallest[root_b])
+        return root_a
+
+
+class GroupingEngine:
+    '''
+    Groups software entries that share a repository link or a name/type key.
+
+    Entries are added one by one (e.g. from a cursor projected on GROUPING_PROJECTION) and only their
+    identifier, name/type key and an integer id are kept. Links and keys are mapped to the first entry in
+    which they were seen and merged with a disjoint-set, so groups linked through several entries end up
+    together regardless of the order of the entries. The entries with each link are kept too, to find
+    the links shared by several groups (see entries_recovery).
+
+    Full documents are attached at output time with `build_groups`, or streamed group by group with
+    `iter_group_blocks`, along with their normalized links (see url_normalization.add_normalized_links).
+    Each group is named after the name/type key of its first entry.
+    '''
+
+    def __init__(self):
+        self.sets = DisjointSet()
+        self.ids: Dict = {}
+        self.entry_ids: List = []
+        self.keys: List[str] = []
+        self.key_nodes: Dict[str, int] = {}
+        self.link_nodes: Dict[str, int] = {}
+        self.link_entries: Dict[str, List[int]] = {}
+
+    def add(self, entry: Dict) -> int:
+        '''
+        Adds an entry and merges it with the groups sharing its links or name/type key.
+        '''
+        node = self.sets.add()
+        self.ids[entry['_id']] = node
+        self.entry_ids.append(entry['_id'])
+        key = entry_key(entry)
+        self.keys.append(key)
+
+        first = self.key_nodes.setdefault(key, node)
+        if first != node:
+            self.sets.union(first, node)
+
+        repo_links, webpage_links = instance_links(entry)
+        for link in repository_links(repo_links, webpage_links):
+            first = self.link_nodes.setdefault(link, node)
+            if first != node:
+                self.sets.union(first, node)
+
+        for link in repo_links | webpage_links:
+            self.link_entries.setdefault(link, []).append(node)
+
+        return node
+
+    def add_all(self, entries: Iterable[Dict]):
+        for entry in entries:
+            self.add(entry)
+        logger.info(f"{len(self.sets)} entries added to the grouping ({len(self.link_nodes)} distinct links)")
+
+    def group_key(self, entry_id) -> Optional[str]:
+        '''
+        Key of the group of an entry, or None if the entry was not added.
+        '''
+        node = self.ids.get(entry_id)
+        if node is None:
+            return None
+        return self._node_key(node)
+
+    def _node_key(self, node: int) -> str:
+        return self.keys[self.sets.smallest[self.sets.find(node)]]
+
+    def groups(self) -> Dict[str, Dict]:
+        '''
+        Members of each group: group key -> {"instances": [entry identifiers]}, in the order the entries were added.
+        '''
+        groups = {}
+        for node, entry_id in enumerate(self.entry_ids):
+            groups.setdefault(self._node_key(node), {"instances": []})["instances"].append(entry_id)
+        return groups
+
+    def shared_links(self) -> Dict[str, List[str]]:
+        '''
+        Links (repository or webpage) of entries in different groups: link -> sorted group keys.
+        '''
+        shared = {}
+        for link, nodes in self.link_entries.items():
+            keys = {self._node_key(node) for node in nodes}
+            if len(keys) > 1:
+                shared[link] = sorted(keys)
+        return shared
+
+    def build_groups(self, documents: Iterable[Dict]) -> Dict[str, Dict]:
+        '''
+        Attaches the full documents to their groups.
+        - documents: the entries added to the engine, in full. Entries not added are ignored.
+          Their normalized links are stored in them.
+
+        Returns a dictionary: group key -> {"instances": [documents], "links": set of links}.
+        '''
+        grouped_instances = {}
+        for document in documents:
+            key = self.group_key(document['_id'])
+            if key is None:
+                logger.warning(f"Entry {document['_id']} was not grouped. Skipping it.")
+                continue
+            group = grouped_instances.setdefault(key, {"instances": [], "links": set()})
+            add_normalized_links(document)
+            group['instances'].append(document)
+            group['links'].update(entry_links(document))
+
+        return grouped_instances
+
+
+def iter_group_blocks(groups: Dict[str, Dict], fetch_documents: Callable[[List], Iterable[Dict]],
+                      batch_size: int = GROUP_FETCH_BATCH) -> Iterator[Tuple[str, Dict]]:
+    '''
+    Yields the (key, block) pairs of some groups with their full documents, in the order of the groups.
+    - groups: group key -> {"instances": [entry identifiers]} (see GroupingEngine.groups).
+    - fetch_documents: returns the full documents of some entry identifiers (e.g. with a single query).
+
+    The documents of consecutive groups are fetched together, about `batch_size` at a time, so only the
+    documents of the groups being written are in memory. Entries that are not found anymore are skipped.
+    '''
+    batch = []
+    size = 0
+    for key, group in groups.items():
+        batch.append((key, group["instances"]))
+        size += len(group["instances"])
+        if size >= batch_size:
+            yield from _attach_documents(batch, fetch_documents)
+            batch = []
+            size = 0
+    if batch:
+        yield from _attach_documents(batch, fetch_documents)
+
+
+def _attach_documents(batch, fetch_documents):
+    documents = {document['_id']: document for document in fetch_documents([entry_id for _, ids in batch for entry_id in ids])}
+    for key, ids in batch:
+        instances = []
+        for entry_id in ids:
+            document = documents.get(entry_id)
+            if document is None:
+                logger.warning(f"Entry {entry_id} was not found. Skipping it.")
+                continue
+            add_normalized_links(document)
+            instances.append(document)
+        if instances:
+            yield key, {"instances": instances}
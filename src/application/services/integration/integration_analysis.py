@@ -1,4 +1,5 @@
-import json
+from src.application.services import serialization
+from src.application.services.integration.block_stream import iter_blocks
 
 def log_types(data):
     '''write in file the types of instances with more than one type'''
@@ -52,10 +53,9 @@ def log_names_case_insensitive(data):
     
 
 if __name__ == "__main__":
-    input_file = "data/grouped.json"
+    input_file = "data/grouped.jsonl"
 
-    with open(input_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = dict(iter_blocks(input_file))
 
     print(f'There are {len(data)} tools groups in the dataset.')
 
@@ -63,8 +63,8 @@ if __name__ == "__main__":
     log_names(data)
     log_names_case_insensitive(data)
 
-    with open('data/shared_links.json', 'r') as f:
-        shared_links = json.load(f)
+    with open('data/shared_links.json', 'rb') as f:
+        shared_links = serialization.load(f)
 
     number_of_groups = 0
     unique_name_groups = 0
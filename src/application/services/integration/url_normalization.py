@@ -0,0 +1,94 @@
+'''
+Canonical normalization of the URLs (repositories and webpages) used to link entries during integration.
+The links of each entry are normalized once, when it is grouped, and stored in the grouped blocks (see
+`add_normalized_links`), so that recovery and conflict detection read them instead of parsing the URLs again,
+even in another process.
+'''
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# Maximum number of distinct URLs kept in the cache
+URL_CACHE_SIZE = 2 ** 18
+
+# Field of the instances of the grouped blocks with their normalized links: {"repository": [...], "webpage": [...]}
+NORMALIZED_LINKS = 'normalized_links'
+
+BIOCONDUCTOR_IGNORED_PARTS = ('release', 'bioc', 'html', 'packages')
+
+# Rules applied to the normalized "host/path" of some hosts, so that different URLs of the same
+# repository or package are the same link. The first matching rule is applied.
+HOST_RULES = [
+    # Code hosting: https://github.com/org/tool.git -> github.com/org/tool
+    (re.compile(r'^(?:www\.)?(github\.com|gitlab\.com|bitbucket\.org)(/.+?)(?:\.git)?$'), r'\1\2'),
+    # PyPI: https://pypi.org/project/tool/1.0/ and https://pypi.python.org/pypi/tool -> pypi.org/project/tool
+    (re.compile(r'^(?:www\.)?pypi(?:\.python)?\.org/(?:project|pypi)/([^/]+).*$'), r'pypi.org/project/\1'),
+    # CRAN: https://cran.r-project.org/web/packages/tool/index.html and https://cran.r-project.org/package=tool -> cran.r-project.org/package/tool
+    (re.compile(r'^(?:www\.)?cran\.r-project\.org/(?:web/packages/|package=)([^/]+).*$'), r'cran.r-project.org/package/\1'),
+]
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize_url(url: Optional[str]) -> Optional[str]:
+    """Normalize a URL by removing the protocol, trailing slash and '.html', and handling Bioconductor, code hosting, PyPI and CRAN URLs."""
+    if not url:
+        return None
+
+    parsed_url = urlparse(url)
+    netloc = parsed_url.netloc.lower()
+    path = parsed_url.path.rstrip('/')  # Remove trailing slash
+
+    # Remove '.html' from the end of Bioconductor URLs
+    if path.endswith('.html'):
+        path = path[:-5]
+
+    # Handle Bioconductor package URLs
+    if 'bioconductor.org' in netloc:
+        parts = path.split('/')
+        # Identify package name (last meaningful part)
+        for part in reversed(parts):
+            if part and part not in BIOCONDUCTOR_IGNORED_PARTS:
+                return f"bioconductor.org/packages/{part}"
+
+    # Generic normalization: remove protocol, keep domain + path
+    link = f"{netloc}{path}"
+    for pattern, replacement in HOST_RULES:
+        if pattern.match(link):
+            return pattern.sub(replacement, link)
+    return link
+
+
+def normalized_links(instance: Dict) -> Tuple[Set[str], Set[str]]:
+    """
+    Normalized repository and webpage links of a pretools entry.
+
+    Returns:
+        tuple: (repository links, webpage links). URLs that cannot be normalized are left out.
+    """
+    data = instance['data']
+    repo_links = {normalize_url(repo['url']) for repo in data.get('repository') or [] if repo.get('url')}
+    webpage_links = {normalize_url(url) for url in data.get('webpage') or [] if url}
+    repo_links.discard(None)
+    webpage_links.discard(None)
+    return repo_links, webpage_links
+
+
+def add_normalized_links(instance: Dict) -> Tuple[Set[str], Set[str]]:
+    """
+    Stores the normalized links of a pretools entry in it (NORMALIZED_LINKS), and returns them (see normalized_links).
+    """
+    repo_links, webpage_links = normalized_links(instance)
+    instance[NORMALIZED_LINKS] = {'repository': sorted(repo_links), 'webpage': sorted(webpage_links)}
+    return repo_links, webpage_links
+
+
+def instance_links(instance: Dict) -> Tuple[Set[str], Set[str]]:
+    """
+    Normalized repository and webpage links of an instance of the grouped blocks: the ones stored when it
+    was grouped, or computed for instances without them (e.g. grouped files written by older versions).
+    """
+    links = instance.get(NORMALIZED_LINKS)
+    if links is None:
+        return normalized_links(instance)
+    return set(links['repository']), set(links['webpage'])
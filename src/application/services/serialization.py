@@ -0,0 +1,97 @@
+"""
+JSON serialization of the pipeline files (blocks, JSONL logs, results).
+
+orjson is used when it is installed and stdlib json otherwise; both backends produce the same compact,
+UTF-8 output. ObjectIds and datetimes are written as MongoDB extended JSON ({"$oid": ...}, {"$date": ...}),
+like bson.json_util. Set JSON_BACKEND=json to force the stdlib backend.
+"""
+import os
+import json
+from bson import json_util
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None and os.getenv("JSON_BACKEND", "orjson") == "orjson" else "json"
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError, so this catches errors of both backends
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _default(fallback=None):
+    # BSON types (ObjectId, datetime, Decimal128...) are converted by json_util, the rest by `fallback`
+    def default(obj):
+        try:
+            return json_util.default(obj)
+        except TypeError:
+            if fallback is None:
+                raise
+            return fallback(obj)
+    return default
+
+
+def dumpb(obj, indent=False, sort_keys=False, default=None) -> bytes:
+    '''
+    Serializes an object to UTF-8 JSON bytes.
+    - indent: indent nested values with two spaces.
+    - default: function called for objects of other types that cannot be serialized.
+    '''
+    if BACKEND == "orjson":
+        options = ORJSON_OPTIONS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        if sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=_default(default), option=options)
+        except TypeError:
+            pass  # values orjson does not support (e.g. integers over 64 bits) are left to stdlib
+    return _stdlib_dumps(obj, indent, sort_keys, default).encode("utf-8")
+
+
+def dumps(obj, indent=False, sort_keys=False, default=None) -> str:
+    '''
+    Serializes an object to a JSON string (see dumpb).
+    '''
+    if BACKEND == "orjson":
+        return dumpb(obj, indent, sort_keys, default).decode("utf-8")
+    return _stdlib_dumps(obj, indent, sort_keys, default)
+
+
+def _stdlib_dumps(obj, indent, sort_keys, default):
+    return json.dumps(
+        obj,
+        default=_default(default),
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+    )
+
+
+def loads(data):
+    '''
+    Parses JSON from a string or bytes. Extended JSON values are returned as they are (e.g. {"$oid": ...}).
+    '''
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump(obj, f, indent=False, sort_keys=False, default=None):
+    '''
+    Writes an object as JSON to a file opened in text or binary mode.
+    '''
+    if "b" in getattr(f, "mode", ""):
+        f.write(dumpb(obj, indent, sort_keys, default))
+    else:
+        f.write(dumps(obj, indent, sort_keys, default))
+
+
+def load(f):
+    return loads(f.read())
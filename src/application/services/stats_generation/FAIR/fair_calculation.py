@@ -6,7 +6,7 @@ from typing import List, Dict, Any
 from bson import ObjectId
 from pprint import pprint
 import requests 
-import json
+from src.application.services import serialization
 
 def get_pub(object_id):
     from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
@@ -234,8 +234,8 @@ def compute_fair_results(tools):
     
         #results.append(result)
     
-        with open('scripts/data/fair_results.jsonl', 'a') as f:
-            f.write(json.dumps(result) + '\n')
+        with open('scripts/data/fair_results.jsonl', 'ab') as f:
+            f.write(serialization.dumpb(result) + b'\n')
 
 
 def compute_fair_results_collections(tools):
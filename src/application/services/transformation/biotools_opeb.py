@@ -1,6 +1,6 @@
 from src.application.services.transformation.metadata_standardizers import MetadataStandardizer
 from src.domain.models.software_instance.main import instance
-from src.domain.models.software_instance.EDAM_forFE import EDAMDict
+from src.domain.models.software_instance.edam_index import get_edam_index
 from src.shared.utils import validate_and_filter
 
 from pydantic import TypeAdapter, HttpUrl, BaseModel, model_validator
@@ -137,7 +137,7 @@ class biotoolsOPEBStandardizer(MetadataStandardizer):
             if 'datatype' in data:
                 datatype = {
                     'vocabulary': 'EDAM',
-                    'term': EDAMDict[data['datatype']],
+                    'term': get_edam_index().labels[data['datatype']],
                     'uri': data['datatype']
                 }
             else:
@@ -147,7 +147,7 @@ class biotoolsOPEBStandardizer(MetadataStandardizer):
                 for format in data['formats']:
                     new_format = {
                         'vocabulary': 'EDAM',
-                        'term': EDAMDict[format],
+                        'term': get_edam_index().labels[format],
                         'uri': format,
                         'datatype': datatype
                     }
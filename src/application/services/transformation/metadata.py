@@ -9,7 +9,7 @@ from datetime import datetime
 from src.domain.models.metadata import Metadata
 from datetime import datetime
 
-def create_new_metadata(source_identifier, identifier, source_url: str = None,  alambique: str = 'alambiqueDev') -> Metadata:
+def create_new_metadata(source_identifier, identifier, source_url: str = None,  alambique: str = 'alambiqueDev', data_source: str = None, content_hash: str = None) -> Metadata:
     current_date = datetime.now().isoformat()
     commit_url = build_commit_url()
     pipeline_url = os.getenv("CI_PIPELINE_URL")
@@ -30,7 +30,9 @@ def create_new_metadata(source_identifier, identifier, source_url: str = None,
         source=[{
             "collection": alambique,
             "id": source_identifier,
-            "source_url": source_url
+            "source_url": source_url,
+            "data_source": data_source,
+            "content_hash": content_hash
         }]
     )
     return metadata
@@ -1,19 +1,24 @@
-import json
 from src.application.services.integration.conflict_detection import find_disconnected_entries, apply_source_name_merge
+from src.application.services.integration.block_stream import iter_blocks, write_blocks
 
 
 def detect_conflicts(grouped_entries_file, disconnected_entries_file):
-    with open(grouped_entries_file, "r", encoding="utf-8") as f:
-        grouped_entries = json.load(f)
+    # Blocks are streamed from the file, so the grouped entries are never loaded as a whole
+    counts = {"blocks": 0, "instances": 0}
+
+    def count_blocks(blocks):
+        for key, block in blocks:
+            counts["blocks"] += 1
+            counts["instances"] += len(block.get("instances", []))
+            yield key, block
 
-    print(f"Number of blocks: {len(grouped_entries)}")
-    print(f"Number of instances: {sum(len(block['instances']) for block in grouped_entries.values())}")
-    
     #conflict_blocks = find_disconnected_entries(grouped_entries)
-    conflict_blocks = find_disconnected_entries(grouped_entries, use_name_match_for_no_links=False)
+    conflict_blocks = find_disconnected_entries(count_blocks(iter_blocks(grouped_entries_file)), use_name_match_for_no_links=False)
+
+    print(f"Number of blocks: {counts['blocks']}")
+    print(f"Number of instances: {counts['instances']}")
+
     conflict_blocks = apply_source_name_merge(conflict_blocks)
     print(f"{len(conflict_blocks)} conflictive keys found.")
 
-    with open(disconnected_entries_file, "w", encoding="utf-8") as f:
-        json.dump(conflict_blocks, f, indent=4)
-
+    write_blocks(disconnected_entries_file, conflict_blocks.items())
@@ -1,11 +1,11 @@
 import os
 import logging
-from bson import json_util 
 
 from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
 from src.infrastructure.db.mongo.standardized_software_repository import StdSoftwareMetaRepository
-from src.application.services.integration.group_entries import group_by_key_with_links
+from src.application.services.integration.grouping_engine import GroupingEngine, GROUPING_PROJECTION, iter_group_blocks
 from src.application.services.integration.entries_recovery import recover_shared_name_link
+from src.application.services.integration.block_stream import write_blocks
 
 logger = logging.getLogger("rs-etl-pipeline")
 
@@ -13,36 +13,18 @@ logger = logging.getLogger("rs-etl-pipeline")
 PRETOOLS = os.getenv('PRETOOLS', 'pretoolsDev')
 
 
-def fetch_pretools():
+def group_pretools(std_software_repo):
     """
-    Get all entries from the pretools collection.
-    Returns a list of dictionaries with the data field of each entry.
-    """
-    std_software_repo = StdSoftwareMetaRepository(mongo_adapter)
-
-    # fetch entries 
-    # IGNORE OPEB_METRICS and BIOCONDA (OPEB_TOOLS_BIOCONDA)
-    logger.debug(f"Fetching entries from {PRETOOLS} collection")
-    raw_entries = std_software_repo.get_standardized_software_data()
-
-    # validated_documents = mongo_adapter.validate_pretools_data(documents) # do not validate for now
-    entries = []
-    
-    logger.debug("Now turing cursor to list of entries")
-    for entry in raw_entries:
-        entries.append(entry)
-
-    logger.debug("Entries fetched. Returning them to the caller")
-    return entries
-
+    Group the entries of the pretools collection referring to the same software.
 
-def write_json_util(file_name, data):
+    The collection is streamed with only the fields needed to group the entries, and only the
+    membership of the groups (entry identifiers) is kept. Returns the grouping engine.
     """
-    Write data to a JSON file. Uses the bson.json_util module to serialize the data.
-    """
-    with open(file_name, 'w') as f:
-        s = json_util.dumps(data)
-        f.write(s)
+    engine = GroupingEngine()
+
+    logger.debug(f"Grouping entries from {PRETOOLS} collection")
+    engine.add_all(std_software_repo.iter_standardized_software_data(projection=GROUPING_PROJECTION))
+    return engine
 
 
 def grouping_and_recovery_process(grouped_entries_file):
@@ -50,28 +32,26 @@ def grouping_and_recovery_process(grouped_entries_file):
     Group entries from the pretools collection and recover shared entries.
     
     Args:
-    - grouped_entries_file (str): Path to the file containing grouped entries. Default is 'data/grouped.json'.
+    - grouped_entries_file (str): Path to the file containing grouped entries. Default is 'data/grouped.jsonl'.
 
-    Write the grouped entries to a JSON file.
+    Write the grouped entries to a block file, one block per line (see block_stream.write_blocks).
+    Groups are written one batch at a time, fetching the full entries of each batch when it is written.
     '''
-    # ==================================================
-    # 1. Fetch entries from the pretools collection
-    # ==================================================
-    logger.info('Fetching entries from pretools')
-    entries = fetch_pretools()
+    std_software_repo = StdSoftwareMetaRepository(mongo_adapter)
 
     # ==================================================
-    # 2. Group entries refering to the same software
+    # 1-2. Stream entries from the pretools collection and group entries refering to the same software
     # ==================================================
     logger.info('Starting grouping process')
-    grouped_by_key = group_by_key_with_links(entries)
+    engine = group_pretools(std_software_repo)
 
     # ==================================================
     # 3. Merge groups on entries that share name and non-repository link/s
     # ==================================================
     logger.info('Merging groups of shared name and non-repository link') 
-    grouped_instances = recover_shared_name_link(grouped_by_key)
+    grouped_ids = recover_shared_name_link(engine.groups(), shared_links=engine.shared_links())
 
     logger.info("Grouping and recovery process complete. Writing grouped entries to file.")
-    write_json_util(grouped_entries_file, grouped_instances)
-
+    blocks = iter_group_blocks(grouped_ids, std_software_repo.get_standardized_software_by_ids)
+    n_blocks = write_blocks(grouped_entries_file, blocks, index=True)
+    logger.info(f"{n_blocks} blocks written to {grouped_entries_file}")
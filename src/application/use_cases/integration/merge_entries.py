@@ -1,5 +1,8 @@
 
 import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from bson import json_util
 from pydantic import BaseModel
 from datetime import datetime
@@ -7,8 +10,17 @@ from bson import ObjectId
 from pydantic.json import pydantic_encoder
 from src.domain.models.software_instance.main import instance
 from src.domain.models.software_instance.multitype_instance import multitype_instance
-from src.application.services.integration.disambiguation.utils import load_dict_from_jsonl
-from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
+from src.application.services.integration.block_stream import BlockFile
+
+PRETOOLS = 'pretoolsDev'
+TOOLS = 'toolsDev'
+
+# Fields of the tools documents that are only set when they are created
+INSERT_ONLY_FIELDS = ['created_at']
+
+# Number of blocks whose entries are fetched, merged and written together
+MERGE_BATCH_SIZE = 200
+
 
 def pretty_print_model(model: BaseModel) -> None:
     print(model.model_dump_json(indent=4))
@@ -19,7 +31,8 @@ def pretty_print_dict(d):
 
 
 def convert_to_multi_type_instance(entry):
-    instance_data_dict = entry['data']
+    # copied so that the fetched entry is left untouched (its type would otherwise be nested again on a second conversion)
+    instance_data_dict = dict(entry['data'])
     if instance_data_dict['type']:
         instance_data_dict['type'] = [instance_data_dict['type']]
     else:
@@ -31,19 +44,22 @@ def convert_to_multi_type_instance(entry):
 
 
 def merge_instances(instances):
-    merged_instances = instances[0]
-    for instance in instances[1:]:
-        merged_instances = merged_instances.merge(instance)   
-
-    return merged_instances 
+    # single pass over the instances, with the same result as folding multitype_instance.merge
+    return multitype_instance.merge_many(instances)
         
 
+def get_mongo_adapter():
+    # imported here, as the client connects to the database when the module is imported
+    from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
+    return mongo_adapter
+
+
 def fetch_entry_from_db(entry_id):
     query = {
         "_id": entry_id
     }
-    entry = mongo_adapter.fetch_entry(
-        collection_name='pretoolsDev',
+    entry = get_mongo_adapter().fetch_entry(
+        collection_name=PRETOOLS,
         query=query
     ) 
     if entry:
@@ -52,24 +68,41 @@ def fetch_entry_from_db(entry_id):
         return None
 
 
+def fetch_entries_from_db(entries_ids):
+    """
+    Fetch several entries from the pretools collection with a single `$in` query.
+    Returns a dictionary id -> entry, without the ids that are not in the collection.
+    """
+    if not entries_ids:
+        return {}
+    entries = get_mongo_adapter().fetch_entries(PRETOOLS, {"_id": {"$in": list(set(entries_ids))}})
+    return {entry['_id']: entry for entry in entries}
+
 
+def tool_id(entries_ids):
+    """
+    Deterministic id of the tool merged from some pretools entries: the same entries (in any order)
+    always give the same id, so saving a tool again updates it instead of inserting a duplicate.
+    """
+    members = "\n".join(sorted(str(entry_id) for entry_id in entries_ids))
+    return hashlib.blake2b(members.encode('utf-8'), digest_size=12).hexdigest()
 
 
 def prepare_for_db(entry, entries_ids):
     """
-    WARNING: this function inserts the entries in the db even if the entry is already there.
-    This is because it is for the first time we are merging the entries.
-
-    TODO: adapt this function to check if the entry is already in the db and if so,
-    update it instead of inserting it again. Add metadata to reflect updates in it. 
+    Build the tools document of a merged entry. Its id is derived from the ids of the merged entries
+    (see tool_id), so it is upserted: re-running the merge updates the existing document.
     """
     # make suere entries_ids is a list
     if not isinstance(entries_ids, list):
         entries_ids = [entries_ids]
-    
+
+    timestamp = datetime.now().isoformat()
     db_entry = {
+        '_id': tool_id(entries_ids),
         'source': entries_ids,
-        "timestamp": datetime.now().isoformat()
+        'created_at': timestamp,
+        "timestamp": timestamp
     }
 
     db_entry['data'] = entry
@@ -77,56 +110,112 @@ def prepare_for_db(entry, entries_ids):
     return db_entry
 
 
-def merge_entries(entries_ids):
-    # retrieve full entries from db
-    entries = [fetch_entry_from_db(entry) for entry in entries_ids]
+def merge_documents(entries):
+    """
+    Merge full pretools entries into a single entry (a dictionary ready to be saved).
+    """
     # Put type in list and validate entries as multitype_instance
     instances = [convert_to_multi_type_instance(entry) for entry in entries]
-    print('Instances in entries_ids converted to multitype_instance.')
-
-    # merge entries
-    if len(instances) > 1:
-        # merge instances
-        print(f"Merging {len(instances)} entries in entries_ids...")
-        merged_instances = merge_instances(instances)
-        print('Entries in entries_ids merged.')
-    else:
-        merged_instances = instances[0]
-        print(f"Only one entry in entries_ids. No merging needed.")
+    merged_instances = merge_instances(instances) if len(instances) > 1 else instances[0]
+    return merged_instances.model_dump(mode="json")
 
-    merged_entries = merged_instances.model_dump(mode="json")   
+
+def merge_entries(entries_ids):
+    # retrieve full entries from db
+    entries = [fetch_entry_from_db(entry) for entry in entries_ids]
+    print(f"Merging {len(entries)} entries in entries_ids...")
+    merged_entries = merge_documents(entries)
+    print('Entries in entries_ids merged.')
 
     return merged_entries
 
 
 def save_entry(metadata):
     try:
-        id = mongo_adapter.insert_one(
-            collection_name='toolsDev',
-            document=metadata
-        )
+        summary = get_mongo_adapter().bulk_upsert(TOOLS, [metadata], INSERT_ONLY_FIELDS)
 
     except Exception as e:
         print(f"Error saving entry {metadata['_id']}.")
-        pretty_print_model(metadata)
+        pretty_print_dict(metadata)
         raise
 
     else:
-        return id
-    
+        return metadata['_id']
+
+
+def entries_to_save(block):
+    """
+    Groups of entries of a disambiguated block that are merged and saved as a tool:
+        - resolution == merged or resolution == no_conflict: the "merged entries"
+        - resolution == partial: the "merged entries", and the "unmerged entry" if there is only one
+    Other blocks (unclear, pending human review) are not saved.
+    """
+    resolution = block.get("resolution")
+    if resolution in ("no_conflict", "merged"):
+        return [block.get("merged_entries")]
+    if resolution == "partial":
+        groups = [block.get("merged_entries")]
+        if len(block.get("unmerged_entries")) == 1:
+            groups.append(block.get("unmerged_entries"))
+        return groups
+    return []
+
+
+def merge_job(job):
+    """
+    Merge the entries of a job (ids and full entries) and build its tools document.
+    Top-level function, so that it can be run in worker processes.
+    """
+    entries_ids, entries = job
+    return prepare_for_db(merge_documents(entries), entries_ids)
+
+
+def iter_batches(items, batch_size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
-def merge_and_save_blocks(disambiguated_blocks_file):
+
+def merge_batch(batch, executor=None):
+    """
+    Fetch the entries of a batch of blocks with one query, and merge them (in the worker processes
+    of `executor` if given). Returns the tools documents to be saved.
+    """
+    jobs = []
+    for key, block in batch:
+        for entries_ids in entries_to_save(block):
+            jobs.append((key, entries_ids))
+
+    fetched = fetch_entries_from_db([entry_id for _, entries_ids in jobs for entry_id in entries_ids])
+    for key, entries_ids in jobs:
+        missing = [entry_id for entry_id in entries_ids if entry_id not in fetched]
+        if missing:
+            print(f"Error processing block {key}.")
+            raise ValueError(f"Entries of block {key} not found in {PRETOOLS}: {missing}")
+
+    jobs = [(entries_ids, [fetched[entry_id] for entry_id in entries_ids]) for _, entries_ids in jobs]
+    if executor is None:
+        return [merge_job(job) for job in jobs]
+    return list(executor.map(merge_job, jobs))
+
+
+def merge_and_save_blocks(disambiguated_blocks_file, batch_size=MERGE_BATCH_SIZE, workers=1):
     '''
-    Merge entries if:
-        - resolution == merged or resolution == no_conflict:
-            - merge “merged entries”
-        - resolution == partial:
-            - merge “merged entries”
-            - save entry in “unmerge_entry” if len == 1
+    Merge the entries of the resolved blocks and save them in the tools collection (see entries_to_save).
+
+    Blocks are processed in batches of `batch_size`: the entries of a batch are fetched with a single query,
+    merged (in `workers` processes if more than 1) and upserted with a single bulk write. Tools are keyed by
+    the ids of their entries (see tool_id), so re-running the merge updates them instead of duplicating them.
     '''
 
-    disambiguated_blocks = load_dict_from_jsonl(disambiguated_blocks_file)
-    print('Disambiguated blocks loaded.')
+    # Only the offsets of the blocks are kept in memory; blocks are parsed one at a time
+    disambiguated_blocks = BlockFile(disambiguated_blocks_file)
+    print('Disambiguated blocks indexed.')
 
     summary = {
         "N": len(disambiguated_blocks),
@@ -136,42 +225,38 @@ def merge_and_save_blocks(disambiguated_blocks_file):
         "n_unclear": 0
     }
 
-    for key, value in disambiguated_blocks.items():
-        try:
-            if value.get("resolution") == "no_conflict" or value.get("resolution") == "merged":
-                entry = merge_entries(value.get("merged_entries"))
-                db_entry = prepare_for_db(entry, value.get("merged_entries"))
-                db_id = save_entry(db_entry)
-                print(f"Entry {key} saved in db with id {db_id}.")
-                summary['n_processed'] += 1
-                summary['n_inserted_entries'] += 1
+    writer = get_mongo_adapter().bulk_writer(TOOLS, INSERT_ONLY_FIELDS, batch_size=max(batch_size, 500))
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    start = time.perf_counter()
+    n_blocks = 0
 
-            elif value.get("resolution") == "partial":
-                entry = merge_entries(value.get("merged_entries"))
-                db_entry = prepare_for_db(entry, value.get("merged_entries"))
-                db_id = save_entry(db_entry)
-                print(f"Entry {key} saved in db with id {db_id}.")
+    try:
+        for batch in iter_batches(disambiguated_blocks.items(), batch_size):
+            for document in merge_batch(batch, executor):
+                writer.add(document)
                 summary['n_inserted_entries'] += 1
+            writer.flush()
 
-                if len(value.get("unmerged_entries"))==1:
-                    entry = merge_entries(value.get("unmerged_entries"))
-                    db_entry = prepare_for_db(entry, value.get("unmerged_entries"))
-                    db_id = save_entry(db_entry)
-                    print(f"Entry {key} saved in db with id {db_id}.")
-                    summary['n_inserted_entries'] += 1
-                
-                summary['n_processed'] += 1
-            
-            else:
-                if value.get("resolution") == "unclear":
+            for key, block in batch:
+                resolution = block.get("resolution")
+                if resolution in ("no_conflict", "merged", "partial"):
+                    summary['n_processed'] += 1
+                elif resolution == "unclear":
                     summary['n_unclear'] += 1
-                elif value.get("resolution") == "manual_review_pending":
+                elif resolution == "manual_review_pending":
                     summary['n_pending'] += 1
-            
-        except:
-            print(f"Error processing block {key}.")
-            raise
 
+            n_blocks += len(batch)
+            elapsed = time.perf_counter() - start
+            print(f"{n_blocks}/{summary['N']} blocks merged ({n_blocks / elapsed:.1f} blocks/s, {summary['n_inserted_entries']} tools)")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    summary['elapsed'] = time.perf_counter() - start
+    summary['n_new_tools'] = writer.totals['upserted']
+    summary['n_updated_tools'] = writer.totals['matched']
+    summary['n_failed'] = writer.totals['failed']
     return summary
 
 
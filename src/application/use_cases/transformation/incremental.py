@@ -0,0 +1,100 @@
+'''
+Incremental transformation of a source.
+
+Each pretools entry keeps, in its source item, the hash of the raw entry it was generated from
+(see `compute_content_hash`). In an incremental run:
+- only raw entries updated after the watermark of the source (the latest '@last_updated_at'
+  seen in the previous run) are read,
+- among them, those whose hash matches the stored one are skipped,
+- pretools entries whose raw entry no longer exists are reported as deleted (but not removed).
+'''
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+from bson import json_util
+from src.infrastructure.db.mongo.raw_software_repository import RawSoftwareMetadataRepository
+from src.infrastructure.db.mongo.standardized_software_repository import StdSoftwareMetaRepository
+from src.infrastructure.db.mongo.transformation_state_repository import TransformationStateRepository
+
+logger = logging.getLogger("rs-etl-pipeline")
+
+# Fields of raw entries that importers refresh on every run. They are left out of the content hash
+IMPORTER_BOOKKEEPING_FIELDS = ('@created_at', '@created_by', '@created_logs', '@last_updated_at', '@updated_by', '@updated_logs')
+
+
+def compute_content_hash(raw_entry: Dict) -> str:
+    '''
+    Computes a hash of the content of a raw entry, ignoring the bookkeeping fields of the importers.
+    Two versions of a raw entry with the same hash are standardized into the same entries.
+    '''
+    content = {key: value for key, value in raw_entry.items() if key not in IMPORTER_BOOKKEEPING_FIELDS}
+    serialized = json_util.dumps(content, sort_keys=True)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+class IncrementalTransformation:
+    '''
+    Change detection for the transformation of a single source.
+    '''
+
+    def __init__(self, source: str, db_adapter):
+        self.source = source
+        self.raw_repo = RawSoftwareMetadataRepository(db_adapter)
+        self.std_repo = StdSoftwareMetaRepository(db_adapter)
+        self.state_repo = TransformationStateRepository(db_adapter)
+
+        state = self.state_repo.get_state(source) or {}
+        self.watermark: Optional[str] = state.get('watermark')
+        self.new_watermark: Optional[str] = self.watermark
+        self.stats = {'read': 0, 'changed': 0, 'new': 0, 'unchanged': 0, 'deleted': 0}
+
+        if self.watermark:
+            logger.info(f"Incremental transformation of {source}: reading raw entries updated after {self.watermark}")
+        else:
+            logger.info(f"Incremental transformation of {source}: no watermark found, reading all raw entries")
+
+    def changed_entries(self, page: List[Dict]) -> List[Dict]:
+        '''
+        Returns the raw entries of the page that are new or whose content changed since they were last transformed.
+        '''
+        known_hashes = self.std_repo.get_source_hashes({raw_entry['_id'] for raw_entry in page if raw_entry.get('_id')})
+
+        changed = []
+        for raw_entry in page:
+            self.stats['read'] += 1
+            last_updated_at = raw_entry.get('@last_updated_at')
+            if last_updated_at and (self.new_watermark is None or str(last_updated_at) > self.new_watermark):
+                self.new_watermark = str(last_updated_at)
+
+            known_hash = known_hashes.get(raw_entry.get('_id'))
+            if known_hash is None:
+                self.stats['new'] += 1
+                changed.append(raw_entry)
+            elif known_hash != compute_content_hash(raw_entry):
+                self.stats['changed'] += 1
+                changed.append(raw_entry)
+            else:
+                self.stats['unchanged'] += 1
+
+        return changed
+
+    def finish(self) -> Dict:
+        '''
+        Reports deletions, saves the new watermark of the source and returns the statistics of the run.
+        '''
+        raw_ids = self.raw_repo.get_raw_ids_from_source(self.source)
+        transformed_ids = self.std_repo.get_source_ids(self.source)
+        deleted = {raw_id: pretools_ids for raw_id, pretools_ids in transformed_ids.items() if raw_id not in raw_ids}
+        self.stats['deleted'] = len(deleted)
+
+        if deleted:
+            logger.warning(f"{len(deleted)} raw entries of {self.source} no longer exist. Pretools entries generated from them: {sorted(id for ids in deleted.values() for id in ids)}")
+
+        self.state_repo.save_state(self.source, {
+            'watermark': self.new_watermark,
+            'last_run_at': datetime.now().isoformat(),
+            'last_run_stats': self.stats
+        })
+        logger.info(f"Incremental transformation of {self.source} finished: {self.stats}")
+        return self.stats
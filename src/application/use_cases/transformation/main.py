@@ -1,10 +1,14 @@
 import os
 import logging 
-from typing import List, Dict
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional
 from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
 from src.application.use_cases.transformation.publications_processing import extract_publications, standardize_publications
 from src.infrastructure.db.mongo.raw_software_repository import RawSoftwareMetadataRepository
-from src.application.use_cases.transformation.software_metadata_processing import standardize_entry, save_entry
+from src.application.use_cases.transformation.software_metadata_processing import save_entry, buffer_entry, PRETOOLS, INSERT_ONLY_FIELDS
+from src.application.use_cases.transformation.standardization import standardize_entry, standardize_pages
+from src.application.use_cases.transformation.incremental import IncrementalTransformation
 
 logger = logging.getLogger("rs-etl-pipeline")
 
@@ -55,14 +59,19 @@ def process_publications(entry: Dict, source: str):
     return list(publications_ids)
 
 
-def process_raw_entry(raw_entry, source):
+def process_raw_entry(raw_entry, source, writer=None, software_metadata_dicts=None):
+    '''
+    software_metadata_dicts: the standardized instances of the entry, if they have already
+    been computed (e.g. in a worker process). Otherwise the entry is standardized here.
+    '''
 
     # Process publication metadata in the entry and push publications to the appropriate collection
     publication_ids = process_publications(raw_entry, source)
 
     # Standardize software metadata in the entry
-    raw_identifier = get_identifier(raw_entry)
-    software_metadata_dicts = standardize_entry(raw_identifier, raw_entry, source)
+    if software_metadata_dicts is None:
+        raw_identifier = get_identifier(raw_entry)
+        software_metadata_dicts = standardize_entry(raw_identifier, raw_entry, source) or []
 
     # TODO Validate URLs of repositories and webpage
     # using functions in adapters/http/url_resolver.py 
@@ -72,47 +81,81 @@ def process_raw_entry(raw_entry, source):
         # Add publication Ids to the dictionary
         software_metadata_dict['publication'] = publication_ids
 
-        # Save the entry in the database
-        save_entry(software_metadata_dict, raw_entry)
+        # Save the entry in the database, or leave it in the bulk writer until the page is flushed
+        if writer is not None:
+            buffer_entry(software_metadata_dict, raw_entry, writer)
+        else:
+            save_entry(software_metadata_dict, raw_entry)
     
     return
 
 
 
-def process_source(source: str):
+def process_page(page, source, writer=None, standardized_page=None):
+    '''
+    Process a page of raw entries and flush the bulk writer, if any.
+
+    standardized_page: standardized instances of each entry of the page, if already computed.
+    '''
+    for i, raw_entry in enumerate(page):
+        software_metadata_dicts = standardized_page[i] if standardized_page is not None else None
+        process_raw_entry(raw_entry, source, writer, software_metadata_dicts)
+
+    if writer is not None:
+        writer.flush()
+
+
+def process_source(source: str, bulk_write: bool = True, executor: Optional[ProcessPoolExecutor] = None, max_pending: int = 2, incremental: bool = False):
     """
     Process each data source by retrieving and transforming data.
 
     Args:
         source (str): The data source to process.
+        bulk_write (bool): If True, the standardized entries of each page of raw data are upserted
+            in the pretools collection with a single bulk write. Otherwise, each entry is saved individually.
+        executor (ProcessPoolExecutor): If provided, the pages of raw data are standardized in its worker
+            processes, while publications and writes to the database stay in this process.
+        max_pending (int): Maximum number of pages submitted to the executor at a time.
+        incremental (bool): If True, only raw entries that are new or changed since the last incremental
+            run are transformed, and deletions are reported (see IncrementalTransformation).
 
     This function logs the start of the data transformation, retrieves the raw data, and
     processes each entry if data is found. Logs if no data is found.
     """
-    
+    writer = mongo_adapter.bulk_writer(PRETOOLS, INSERT_ONLY_FIELDS) if bulk_write else None
 
     try:
         logger.info(f"Starting transformation of data from {source}")            
+        tracker = IncrementalTransformation(source, mongo_adapter) if incremental else None
         alambique_repo = RawSoftwareMetadataRepository(mongo_adapter)
-        raw_data = alambique_repo.get_raw_documents_from_source(source)
+        raw_data = alambique_repo.get_raw_documents_from_source(source, updated_since=tracker.watermark if tracker else None)
 
         # checking if first batch has data
         try:
             first_batch = next(raw_data)
         except StopIteration:
             logger.info(f"No data found for source {source}")
+            if tracker:
+                tracker.finish()
             return
 
         logger.debug(f"Transforming raw tools metadata from {source}")
-
-        # first batch 
-        for raw_entry in first_batch:
-            process_raw_entry(raw_entry, source)
-
-        # remaining batches
-        for batch in raw_data:
-            for raw_entry in batch:
-                process_raw_entry(raw_entry, source)
+        pages = chain([first_batch], raw_data)
+        if tracker:
+            pages = (tracker.changed_entries(page) for page in pages)
+
+        if executor is not None:
+            for page, standardized_page in standardize_pages(executor, pages, source, max_pending):
+                process_page(page, source, writer, standardized_page)
+        else:
+            for page in pages:
+                process_page(page, source, writer)
+
+        if writer is not None:
+            logger.info(f"Entries of {source} written to {PRETOOLS}: {writer.totals}")
+
+        if tracker:
+            tracker.finish()
  
     except Exception as e:
         raise e
@@ -137,16 +180,28 @@ sources = [
 
 
 
-def transform_sources(sources: List[str], **kwargs):
+def transform_sources(sources: List[str], bulk_write: bool = True, workers: int = 1, incremental: bool = False, **kwargs):
     """
     Main function to orchestrate the transformation process for multiple sources.
 
     Args:
         loglevel (int): The log level to use across the application. Defaults to logging.WARNING.
         sources (List[str]): A list of data sources to process. Defaults to the predefined list of sources.
+        bulk_write (bool): Whether to write the standardized entries in bulk, one write per page of raw data. Defaults to True.
+        workers (int): Number of worker processes used to standardize the raw entries. With 1 (default), everything runs in this process.
+        incremental (bool): Whether to transform only the raw entries that changed since the last incremental run. Defaults to False.
         **kwargs: Arbitrary keyword arguments.
 
     This function sets up logging and processes each source using a database adapter.
+    The pool of workers is shared by all the sources, so pages of a source are standardized
+    in parallel and the workers are reused from one source to the next.
     """
-    for source in sources:
-        process_source(source)
+    if workers <= 1:
+        for source in sources:
+            process_source(source, bulk_write=bulk_write, incremental=incremental)
+        return
+
+    logger.info(f"Standardizing with {workers} worker processes")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for source in sources:
+            process_source(source, bulk_write=bulk_write, executor=executor, max_pending=2 * workers, incremental=incremental)
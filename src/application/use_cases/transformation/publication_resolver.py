@@ -0,0 +1,93 @@
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("rs-etl-pipeline")
+
+# Fields that identify a publication, in the order in which they are checked.
+IDENTITY_FIELDS = ('doi', 'title', 'url', 'pmid', 'pmcid')
+
+
+def normalize_identity(field: str, value: Any) -> Optional[str]:
+    '''
+    Returns the key used to index a publication identifier, or None if the value is empty.
+    DOIs are case insensitive and titles are compared ignoring case, repeated whitespace and a final period.
+    '''
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if field == 'doi':
+        value = value.lower()
+    elif field == 'title':
+        value = ' '.join(value.split()).casefold().rstrip('.')
+    return value or None
+
+
+class PublicationIdentityResolver:
+    '''
+    Resolves publications to the identifier of their entry in the publications collection.
+
+    The identifying fields (doi, title, url, pmid, pmcid) of all the publications in the collection
+    are loaded once, the first time a publication is resolved, and publications inserted afterwards
+    are added with `register`. Publications not found in memory are looked up with a single `$or`
+    query, in case they were inserted by another process.
+    '''
+
+    def __init__(self, publications_repo, fallback: bool = True):
+        self.publications_repo = publications_repo
+        self.fallback = fallback
+        self.index = {field: {} for field in IDENTITY_FIELDS}
+        self.loaded = False
+        self.stats = {'hits': 0, 'fallback_hits': 0, 'misses': 0}
+
+    def load(self):
+        '''
+        Loads the identifying fields of all the publications in the collection.
+        '''
+        count = 0
+        for entry in self.publications_repo.get_identities():
+            self.register(entry.get('data') or {}, entry['_id'])
+            count += 1
+        self.loaded = True
+        logger.info(f"Loaded the identifiers of {count} publications")
+
+    def register(self, publication: Dict[str, Any], publication_id: str):
+        '''
+        Adds the identifiers of a publication to the index. Existing identifiers are kept.
+        '''
+        for field in IDENTITY_FIELDS:
+            key = normalize_identity(field, publication.get(field))
+            if key is not None:
+                self.index[field].setdefault(key, publication_id)
+
+    def _lookup(self, publication: Dict[str, Any]) -> Optional[str]:
+        for field in IDENTITY_FIELDS:
+            key = normalize_identity(field, publication.get(field))
+            if key is not None and key in self.index[field]:
+                return self.index[field][key]
+        return None
+
+    def resolve(self, publication: Dict[str, Any]) -> Optional[str]:
+        '''
+        Returns the identifier of the publication in the publications collection, or None if it is not there.
+        - publication: standardized publication to be checked
+        '''
+        if not self.loaded:
+            self.load()
+
+        publication_id = self._lookup(publication)
+        if publication_id is not None:
+            self.stats['hits'] += 1
+            return publication_id
+
+        if self.fallback:
+            identifiers = {field: publication.get(field) for field in IDENTITY_FIELDS}
+            entries = self.publications_repo.find_by_identifiers(identifiers)
+            for entry in entries:
+                self.register(entry.get('data') or {}, entry['_id'])
+            publication_id = self._lookup(publication) if entries else None
+            if publication_id is not None:
+                self.stats['fallback_hits'] += 1
+                return publication_id
+
+        self.stats['misses'] += 1
+        return None
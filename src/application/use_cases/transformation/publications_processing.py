@@ -4,7 +4,7 @@ from typing import Dict, Any, Optional, List
 from src.application.services.publications.metadata import create_new_metadata
 from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
 from src.infrastructure.db.mongo.publications_repository import PublicationsMetadataRepository
-from src.infrastructure.db.mongo.database_adapter import DatabaseAdapter
+from src.application.use_cases.transformation.publication_resolver import PublicationIdentityResolver
 from src.application.services.publications.publication_standardizer_factory import StandardizerFactory
 from src.application.services.publications.publication_extractor_factory import ExtractorFactory
 
@@ -12,50 +12,33 @@ logger = logging.getLogger("rs-etl-pipeline")
 
 PUBLICATIONS_COLLECTION = os.getenv('PUBLICATIONS_COLLECTION', 'publicationsDev')
 
-def publication_in_collection(publication: Dict[str, Any], publications_repo: DatabaseAdapter) -> Optional[str]:
+# Created on first use, so the publications are loaded once per run
+_publication_resolver = None
+
+def get_publication_resolver() -> PublicationIdentityResolver:
+    '''
+    Returns the publication identity resolver of this run, creating it the first time.
+    '''
+    global _publication_resolver
+    if _publication_resolver is None:
+        _publication_resolver = PublicationIdentityResolver(PublicationsMetadataRepository(mongo_adapter))
+    return _publication_resolver
+
+
+def publication_in_collection(publication: Dict[str, Any], resolver: PublicationIdentityResolver) -> Optional[str]:
     '''
     Checks if the publication is already in the publications collection.
     - publication: publication to be checked
-    - db_adapter: database adapter
+    - resolver: publication identity resolver
     '''
-    # Check doi
-    if publication.get('doi'):
-        entry = publications_repo.find_by_doi(publication.get('doi'))
-        if entry:
-            return entry['_id']
-
-    # Check title 
-    if publication.get('title'):
-        entry = publications_repo.find_by_title(publication.get('title'))
-        if entry:
-            return entry['_id']
-
-    # Check URL 
-    if publication.get('url'):
-        entry = publications_repo.find_by_url(publication.get('url'))
-        if entry:
-            return entry['_id']
-
-    # Check pmid 
-    if publication.get('pmid'):
-        entry = publications_repo.find_by_pmid(publication.get('pmid'))
-        if entry:
-            return entry['_id']
-
-    # Check pmcid
-    if publication.get('pmcid'):
-        entry = publications_repo.find_by_pmcid(publication.get('pmcid'))
-        if entry:
-            return entry['_id']
-
-    return None
-
-
-def add_publication(publication: Dict[str, Any], publications_repo: DatabaseAdapter) -> str:
+    return resolver.resolve(publication)
+
+
+def add_publication(publication: Dict[str, Any], resolver: PublicationIdentityResolver) -> str:
     '''
-    Add a publication to the publications collection.
+    Add a publication to the publications collection and to the resolver.
     - publication: publication to be added
-    - db_adapter: database adapter
+    - resolver: publication identity resolver
     '''
     # Generate entry metadata
     metadata_dict = create_new_metadata()
@@ -65,13 +48,14 @@ def add_publication(publication: Dict[str, Any], publications_repo: DatabaseAdap
 
     # Insert in database
     logger.debug(f"Adding publication {metadata_dict['data']['title']} to the publications collection.")
-    id = publications_repo.save_entry(metadata_dict)
+    id = resolver.publications_repo.save_entry(metadata_dict)
+    resolver.register(publication, id)
     return id
 
 
 
-def standardize_publications(source_name : str, publications_ids, raw_publication_dict: Dict[str, Any]) -> List[str]:
-    publications_repo = PublicationsMetadataRepository(mongo_adapter)
+def standardize_publications(source_name : str, publications_ids, raw_publication_dict: Dict[str, Any], resolver: Optional[PublicationIdentityResolver] = None) -> List[str]:
+    resolver = resolver or get_publication_resolver()
 
     # Parse the entry 
     publication_standardizer = StandardizerFactory.get_standardizer(source_name)
@@ -82,11 +66,11 @@ def standardize_publications(source_name : str, publications_ids, raw_publicatio
         standardized_publication_dict = standardized_publication.model_dump() 
     
     # Check if the publication is already in the publications collection
-    publication_id = publication_in_collection(standardized_publication_dict, publications_repo)
+    publication_id = publication_in_collection(standardized_publication_dict, resolver)
     if publication_id:
         publications_ids.add(publication_id)
     else:
-        publication_id = add_publication(standardized_publication_dict, publications_repo)
+        publication_id = add_publication(standardized_publication_dict, resolver)
         publications_ids.add(publication_id)
 
     return publications_ids
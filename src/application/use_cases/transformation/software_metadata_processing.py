@@ -2,7 +2,8 @@ import os
 import logging 
 import json
 from typing import List, Dict
-from src.application.services.transformation.standardizers_factory import MetadataStandardizerFactory
+from src.application.use_cases.transformation.standardization import standardize_entry
+from src.application.use_cases.transformation.incremental import compute_content_hash
 from src.application.services.transformation.metadata import create_new_metadata, update_existing_metadata
 from src.domain.models.metadata import Metadata
 from src.infrastructure.db.mongo.mongo_db_singleton import mongo_adapter
@@ -12,6 +13,10 @@ logger = logging.getLogger("rs-etl-pipeline")
 
 ALAMBIQUE = os.getenv('ALAMBIQUE', 'alambiqueDev')
 PRETOOLS = os.getenv('PRETOOLS', 'pretoolsDev')
+
+# Metadata fields that are only written when the entry is created in the pretools collection
+INSERT_ONLY_FIELDS = ('created_at', 'created_by', 'created_logs')
+
 def get_identifier(entry: Dict) -> str:
     '''
     Extracts the identifier from a raw entry.
@@ -25,23 +30,20 @@ def get_identifier(entry: Dict) -> str:
         return None
     return identifier
 
-def standardize_entry(identifier: str,  raw: Dict, source: str) -> List[Dict]:
-    
-    if not identifier:
-        logger.debug("No identifier found for entry; skipping...")
-        return
-
-    # Standardize the software metadata entries into the standard data model
-    standardizer = MetadataStandardizerFactory.get_standardizer(source)
-    tools = standardizer.process_transformation(raw)
-
-    if tools:
-        # To dictionary 
-        tools_dicts = [inst.model_dump(mode="json") for inst in tools]
-    else:
-        tools_dicts = []
-
-    return(tools_dicts)
+def build_source_metadata(raw_entry, identifier) -> Metadata:
+    '''
+    Creates the metadata of a new pretools entry generated from raw_entry.
+    '''
+    source_url = raw_entry.get('@source_url', None)
+    source_identifier = get_identifier(raw_entry)
+    return create_new_metadata(
+        source_identifier,
+        identifier,
+        source_url,
+        ALAMBIQUE,
+        data_source=raw_entry.get('@data_source'),
+        content_hash=compute_content_hash(raw_entry)
+    )
 
 
 def generate_metadata(raw_entry, identifier):
@@ -59,11 +61,9 @@ def generate_metadata(raw_entry, identifier):
     entry_exists_db = mongo_adapter.entry_exists(PRETOOLS, identifier)
 
     if entry_exists_db == False:
-        source_url = raw_entry.get('@source_url', None)
-        source_identifier = get_identifier(raw_entry)
         logger.debug(f"Creating metadata for entry {identifier}")
-        logger.debug(f"Source identifier: {source_identifier}")
-        metadata = create_new_metadata(source_identifier, identifier, source_url, ALAMBIQUE)
+        logger.debug(f"Source identifier: {get_identifier(raw_entry)}")
+        metadata = build_source_metadata(raw_entry, identifier)
     else:
         existing_metadata  = mongo_adapter.get_entry_metadata(PRETOOLS, identifier)
         logger.debug(f"Updating metadata for entry {identifier}")
@@ -71,6 +71,8 @@ def generate_metadata(raw_entry, identifier):
         existing_metadata['id'] = existing_metadata.pop('_id')
         existing_metadata = Metadata(**existing_metadata)
         metadata = update_existing_metadata(existing_metadata)
+        # Keep the source (and its content hash) up to date with the raw entry
+        metadata.source = build_source_metadata(raw_entry, identifier).source
     
     metadata_dict = metadata.model_dump(mode="json")
 
@@ -78,11 +80,10 @@ def generate_metadata(raw_entry, identifier):
 
 
 
-def save_entry(software_metadata_dict, raw_entry):
+def build_identifier(software_metadata_dict) -> str:
     '''
-    Save the entry in the database
+    Builds the identifier of the entry in the pretools collection: source/name/type/version
     '''
-    # Generate metadata for the new metada entry
     source = software_metadata_dict['source'][0]
     name = software_metadata_dict['name']
     type = software_metadata_dict['type']
@@ -92,7 +93,15 @@ def save_entry(software_metadata_dict, raw_entry):
     else:
         version = None
 
-    identifier = f'{source}/{name}/{type}/{version}'
+    return f'{source}/{name}/{type}/{version}'
+
+
+def save_entry(software_metadata_dict, raw_entry):
+    '''
+    Save the entry in the database
+    '''
+    # Generate metadata for the new metada entry
+    identifier = build_identifier(software_metadata_dict)
     
     entry_metadata = generate_metadata(raw_entry, identifier)
 
@@ -105,6 +114,33 @@ def save_entry(software_metadata_dict, raw_entry):
     return
 
 
+def build_upsert_document(software_metadata_dict, raw_entry) -> Dict:
+    '''
+    Build the pretools document of an entry to be upserted without reading the existing one.
+    The creation fields (INSERT_ONLY_FIELDS) are only written if the entry is new, so the
+    metadata is generated as for a new entry and the database keeps the original creation data.
+    '''
+    identifier = build_identifier(software_metadata_dict)
+    metadata = build_source_metadata(raw_entry, identifier)
+
+    document = metadata.model_dump(mode="json")
+    document['data'] = software_metadata_dict
+    return document
+
+
+def buffer_entry(software_metadata_dict, raw_entry, writer):
+    '''
+    Add the entry to a bulk writer (see MongoDBAdapter.bulk_writer) instead of saving it right away.
+    '''
+    try:
+        document = build_upsert_document(software_metadata_dict, raw_entry)
+        writer.add(document)
+    except Exception as e:
+        logger.error(f"An error occurred while preparing entry from {get_identifier(raw_entry)} for bulk write: {e}")
+
+    return
+
+
 def push_to_db(software_metadata_dict, entry_metadata, identifier):
 
     try:
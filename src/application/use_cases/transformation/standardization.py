@@ -0,0 +1,63 @@
+'''
+Standardization of raw software metadata into the standard data model.
+
+This module does not use the database, so its functions can run in worker processes
+(see `standardize_pages`). Writing the results to the database is left to the caller.
+'''
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+from src.application.services.transformation.standardizers_factory import MetadataStandardizerFactory
+
+logger = logging.getLogger("rs-etl-pipeline")
+
+
+def standardize_entry(identifier: str,  raw: Dict, source: str) -> List[Dict]:
+    
+    if not identifier:
+        logger.debug("No identifier found for entry; skipping...")
+        return
+
+    # Standardize the software metadata entries into the standard data model
+    standardizer = MetadataStandardizerFactory.get_standardizer(source)
+    tools = standardizer.process_transformation(raw)
+
+    if tools:
+        # To dictionary 
+        tools_dicts = [inst.model_dump(mode="json") for inst in tools]
+    else:
+        tools_dicts = []
+
+    return(tools_dicts)
+
+
+def standardize_page(page: List[Dict], source: str) -> List[List[Dict]]:
+    '''
+    Standardizes every raw entry of a page. Runs in the worker processes.
+
+    Returns:
+        list: for each raw entry in the page, the list of standardized instances (as dictionaries).
+    '''
+    return [standardize_entry(raw_entry.get('_id'), raw_entry, source) or [] for raw_entry in page]
+
+
+def standardize_pages(executor: ProcessPoolExecutor, pages: Iterable[List[Dict]], source: str, max_pending: int) -> Iterator[Tuple[List[Dict], List[List[Dict]]]]:
+    '''
+    Fans out the pages of raw entries to the worker processes of `executor` and yields
+    the results in the same order as the pages, so that a single writer can consume them.
+    At most `max_pending` pages are submitted at a time to bound memory usage.
+
+    Yields:
+        tuple: (page, standardized), where standardized[i] is the list of standardized instances of page[i].
+    '''
+    pending = deque()
+    for page in pages:
+        pending.append((page, executor.submit(standardize_page, page, source)))
+        if len(pending) >= max_pending:
+            page, future = pending.popleft()
+            yield page, future.result()
+
+    while pending:
+        page, future = pending.popleft()
+        yield page, future.result()
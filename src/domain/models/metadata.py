@@ -8,6 +8,8 @@ class source_item(BaseModel):
     id: str = Field(..., description="Id of the source")
 
     source_url : Optional[HttpUrl] = Field(None, description="URL of the source") # generally, only available for github, sourceforge and bioconductor
+    data_source : Optional[str] = Field(None, description="Source (importer) of the raw entry, as in its '@data_source' field")
+    content_hash : Optional[str] = Field(None, description="Hash of the content of the raw entry, used to skip unchanged entries in incremental transformations")
 
 
 class source_items_list(BaseModel):
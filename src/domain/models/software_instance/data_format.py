@@ -1,7 +1,7 @@
 from pydantic import BaseModel, model_validator, HttpUrl, AnyUrl, TypeAdapter
 from typing import Optional, Any, Dict
 
-from src.domain.models.software_instance.EDAM_forFE import EDAMDict
+from src.domain.models.software_instance.edam_index import get_edam_index
 
 
 ###------------------------------------------------------------
@@ -125,11 +125,12 @@ class data_format(BaseModel, validate_assignment=True):
     def mapEDAMDict(term: str):
         '''
         term: free text string
-        Maps a free text string to an EDAM term if the match is perfect.
+        Maps a free text string to an EDAM format if the match is perfect.
         '''
-        for key,value in EDAMDict.items():
-            if term.lower().lstrip() == value.lower():
-                return(key, value, 'EDAM')
+        edam_index = get_edam_index()
+        uri = edam_index.uri(term, 'format')
+        if uri:
+            return(uri, edam_index.label(uri), 'EDAM')
 
         return('', term, '')
 
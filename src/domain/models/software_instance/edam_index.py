@@ -0,0 +1,85 @@
+'''
+Index of the EDAM terms, to map free text labels to EDAM URIs (and back) without scanning the EDAM dictionary.
+'''
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+
+from src.domain.models.software_instance.EDAM_forFE import load_EDAM_data
+
+EDAM_BRANCHES = ('topic', 'operation', 'format', 'data')
+
+_BRANCH_PATTERN = re.compile(r'^https?://edamontology\.org/(topic|operation|format|data)_\d+$')
+
+
+def normalize_label(label: str) -> str:
+    '''
+    Key used to compare labels: case folded, without leading/trailing whitespace.
+    '''
+    return label.strip().casefold()
+
+
+def edam_branch(uri: str) -> Optional[str]:
+    '''
+    Branch of an EDAM URI (topic, operation, format or data), or None if it is not an EDAM term.
+    '''
+    match = _BRANCH_PATTERN.match(uri)
+    return match.group(1) if match else None
+
+
+class EDAMIndex:
+    '''
+    Precomputed lookups over the EDAM terms.
+    - labels: EDAM URI -> preferred label (e.g. EDAMDict)
+    - synonyms: EDAM URI -> other labels of the term. Preferred labels take precedence over synonyms.
+
+    When several terms share a label, the first one in `labels` is returned, as the former linear scans did.
+    '''
+
+    def __init__(self, labels: Dict[str, str], synonyms: Optional[Dict[str, Iterable[str]]] = None):
+        self.labels = {}
+        self.uris = {}
+        self.branch_uris = {branch: {} for branch in EDAM_BRANCHES}
+
+        for uri, label in labels.items():
+            # skip the header row of the source CSV ("Class ID": "Preferred Label")
+            if not uri.startswith('http'):
+                continue
+            self.labels[uri] = label
+            self._add(normalize_label(label), uri)
+
+        for uri, uri_synonyms in (synonyms or {}).items():
+            for synonym in uri_synonyms:
+                self._add(normalize_label(synonym), uri)
+
+    def _add(self, key: str, uri: str):
+        self.uris.setdefault(key, uri)
+        branch = edam_branch(uri)
+        if branch:
+            self.branch_uris[branch].setdefault(key, uri)
+
+    def uri(self, term: str, branch: Optional[str] = None) -> Optional[str]:
+        '''
+        Returns the URI of the EDAM term whose label (or synonym) matches the free text term, or None.
+        - term: free text string
+        - branch: if given, only terms of this branch (topic, operation, format or data) are considered
+        '''
+        if not term:
+            return None
+        uris = self.uris if branch is None else self.branch_uris[branch]
+        return uris.get(normalize_label(term))
+
+    def label(self, uri: str) -> Optional[str]:
+        '''
+        Returns the preferred label of an EDAM URI, or None if it is unknown.
+        '''
+        return self.labels.get(str(uri))
+
+
+@lru_cache(maxsize=None)
+def get_edam_index() -> EDAMIndex:
+    '''
+    Returns the EDAM index shared by all the models. It is built the first time it is needed.
+    '''
+    data = load_EDAM_data()
+    return EDAMIndex(data['labels'], data.get('synonyms'))
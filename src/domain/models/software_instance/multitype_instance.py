@@ -5,7 +5,7 @@ The "data" in entries in the tools collection (post integration) this schema (mu
 """
 
 from src.domain.models.software_instance.main import instance, software_types
-from typing import List, Dict
+from typing import ClassVar, List, Dict
 
 class multitype_instance(instance):
     '''
@@ -14,6 +14,17 @@ class multitype_instance(instance):
     type : List[software_types]
     other_names : List[str]
 
+    # Fields merged as the union of their items
+    UNION_FIELDS: ClassVar[List[str]] = [
+        'type', 'version', 'label', 'links', 'webpage', 'download', 'operating_system', 'source_code', 'source',
+        'edam_topics', 'edam_operations', 'description', 'dependencies', 'tags', 'publication', 'languages',
+    ]
+
+    # Fields that are True if any of the instances has it
+    ANY_FIELDS: ClassVar[List[str]] = [
+        'https', 'ssl', 'operational', 'bioschemas', 'test', 'inst_instr', 'contribution_policy', 'termsUse',
+    ]
+
     def merge(self, other: 'instance') -> 'instance':
         '''
         Merges two instances of the same software into one.
@@ -66,6 +77,104 @@ class multitype_instance(instance):
 
         return self
 
+    @classmethod
+    def merge_many(cls, instances: List['multitype_instance']) -> 'multitype_instance':
+        '''
+        Merges several instances of the same software into one, with the same result as folding `merge`
+        over them (list fields have the same items, although possibly in a different order).
+        Each merged field is accumulated in a single pass into a new list that starts with the values of the
+        first instance, and the result is a new instance built from a copy of the fields of the first instance
+        with the merged fields replaced, so it is validated only once instead of on every assignment of every
+        pairwise merge. The lists of the instances are not modified, but nested items with the same key (e.g.
+        documentation or authors) are merged in place into the first of them, as in `merge`. A single instance
+        is returned as it is.
+        '''
+        first, rest = instances[0], instances[1:]
+        if not rest:
+            return first
+
+        merged = {}
+
+        other_names = {}
+        for inst in instances:
+            if inst is not first and inst.name != first.name:
+                other_names[inst.name] = None
+            other_names.update(dict.fromkeys(inst.other_names))
+        merged['other_names'] = list(other_names)
+
+        for field in cls.UNION_FIELDS:
+            merged[field] = cls._union(getattr(inst, field) for inst in instances)
+
+        for field in cls.ANY_FIELDS:
+            merged[field] = cls._first_truthy([getattr(inst, field) for inst in instances])
+
+        # repositories are appended if their url is not in the repositories merged before that instance
+        repositories = list(first.repository)
+        urls = {repo.url for repo in repositories}
+        for inst in rest:
+            new_repositories = [repo for repo in inst.repository if repo.url not in urls]
+            repositories.extend(new_repositories)
+            urls.update(repo.url for repo in new_repositories)
+        merged['repository'] = repositories
+
+        # all the data formats are merged, including the repeated ones of the first instance (see merge_data_formats)
+        data_format_key = lambda fmt: (fmt.vocabulary, fmt.term)
+        merged['input'] = cls._merge_keyed([[], [fmt for inst in instances for fmt in inst.input]], data_format_key)
+        merged['output'] = cls._merge_keyed([[], [fmt for inst in instances for fmt in inst.output]], data_format_key)
+        merged['documentation'] = cls._merge_keyed([inst.documentation for inst in instances], lambda doc: (doc.type, doc.url))
+        merged['authors'] = cls._merge_keyed([inst.authors for inst in instances], lambda author: author.name)
+        merged['topics'] = cls._merge_keyed([inst.topics for inst in instances], lambda tp: (tp.uri, tp.term))
+        merged['operations'] = cls._merge_keyed([inst.operations for inst in instances], lambda op: (op.uri, op.term))
+        merged['license'] = cls._merge_many_licenses([inst.license for inst in instances])
+
+        # citations are filtered after each instance, as fully contained citations are dropped on every merge
+        citations = first.citation
+        for i, inst in enumerate(rest):
+            if i == 0 or inst.citation:
+                citations = cls._merge_citation_lists(citations, inst.citation)
+        merged['citation'] = citations
+
+        # fields not merged (e.g. the name) and extra fields are taken from the first instance, as in `merge`
+        return cls(**{**dict(first), **merged})
+
+    @staticmethod
+    def _union(lists) -> list:
+        return list(dict.fromkeys(item for values in lists for item in values))
+
+    @staticmethod
+    def _first_truthy(values):
+        # the value of `a or b or c ...`
+        for value in values:
+            if value:
+                return value
+        return values[-1]
+
+    @staticmethod
+    def _merge_keyed(item_lists, key) -> list:
+        '''
+        Items of several lists, where the items of the later lists with the same key as a previous one are
+        merged into it. Repeated keys in the first list are not merged (the last item is kept), as in `merge`.
+        '''
+        item_map = {key(item): item for item in item_lists[0]}
+        for items in item_lists[1:]:
+            for item in items:
+                item_key = key(item)
+                if item_key in item_map:
+                    item_map[item_key] = item_map[item_key].merge(item)
+                else:
+                    item_map[item_key] = item
+        return list(item_map.values())
+
+    @classmethod
+    def _merge_many_licenses(cls, license_lists) -> list:
+        # The first non-empty list is kept as it is until another instance has licenses too (see merge_licenses)
+        licenses = license_lists[0]
+        for other_licenses in license_lists[1:]:
+            if not licenses:
+                licenses = other_licenses or []
+            elif other_licenses:
+                licenses = cls._merge_keyed([licenses, other_licenses], lambda lic: lic.name)
+        return licenses
             
     def merge_repositories(self, other_repository):
         """
@@ -188,36 +297,41 @@ class multitype_instance(instance):
         Ensures that no duplicate citations are added and that the most complete
         information is retained.
         """
+        return self._merge_citation_lists(self.citation, other_citations)
+
+    @classmethod
+    def _merge_citation_lists(cls, citations: List[Dict], other_citations: List[Dict]) -> List[Dict]:
         citation_map = {}
 
-        for citation in self.citation + other_citations:
+        for citation in citations + other_citations:
             # Generate a unique key based on essential fields
             key = (citation.get('title', ''), citation.get('year', ''), citation.get('DOI', ''))
 
             if key in citation_map:
                 # Merge the existing citation with the new one
-                citation_map[key] = self._merge_two_citations(citation_map[key], citation)
+                citation_map[key] = cls._merge_two_citations(citation_map[key], citation)
             else:
                 # Add the new citation if not already present
                 citation_map[key] = citation
 
-        # Update the citations list with the merged results
-        self.citation = list(citation_map.values())
+        merged_citations = list(citation_map.values())
 
         # Remove any citations that are fully contained within another
-        resulting_citation = [cit for i, cit in enumerate(self.citation) 
-                        if not any(self._is_subset(cit, other) for j, other in enumerate(self.citation) if i != j)]
+        resulting_citation = [cit for i, cit in enumerate(merged_citations) 
+                        if not any(cls._is_subset(cit, other) for j, other in enumerate(merged_citations) if i != j)]
         
         return resulting_citation
 
-    def _is_subset(self, cit1: Dict, cit2: Dict) -> bool:
+    @staticmethod
+    def _is_subset(cit1: Dict, cit2: Dict) -> bool:
         """
         Check if cit1 is a subset of cit2, meaning all non-empty fields in cit1
         are present and equal in cit2.
         """
         return all(cit2.get(key) == value for key, value in cit1.items() if value)
 
-    def _merge_two_citations(self, cit1: Dict, cit2: Dict) -> Dict:
+    @staticmethod
+    def _merge_two_citations(cit1: Dict, cit2: Dict) -> Dict:
         """
         Merges two citation dictionaries, preferring non-empty and more complete fields.
         If one citation is more complete than the other, it will replace the less complete one.
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, HttpUrl, model_validator, field_validator
-from typing import Optional
+from typing import Optional, ClassVar
 import re
-from src.domain.models.software_instance.EDAM_forFE import EDAMDict
+from src.domain.models.software_instance.edam_index import get_edam_index
 
 
 class vocabularyItem(BaseModel):
@@ -12,6 +12,9 @@ class vocabularyItem(BaseModel):
     term : Optional[str] = None
     uri : Optional[HttpUrl] = None
 
+    # EDAM branch in which free text terms are looked up (None: any branch)
+    edam_branch : ClassVar[Optional[str]] = None
+
     @field_validator('uri', mode="before")
     @classmethod
     def uri_none(cls, value):
@@ -47,21 +50,18 @@ class vocabularyItem(BaseModel):
         if not data.term:
             if data.uri.host == 'edamontology.org':
                 data.vocabulary = 'EDAM'
-                data.term = EDAMDict.get(str(data.uri))
+                data.term = get_edam_index().label(data.uri)
             
         return data
     
     @staticmethod
-    def get_EDAM_uri(term: str):
+    def get_EDAM_uri(term: str, branch: Optional[str] = None):
         '''
         Maps a free text string to an EDAM term if the match is perfect.
         term: free text string
+        branch: EDAM branch of the term (topic, operation, format or data). Defaults to any branch.
         '''
-        for key,value in EDAMDict.items():
-            if term.lower().lstrip() == value.lower():
-                return(key)
-
-        return(None)
+        return get_edam_index().uri(term, branch)
 
     @model_validator(mode="after")
     @classmethod
@@ -70,7 +70,7 @@ class vocabularyItem(BaseModel):
         If there is no URI, try to populate it from the EDAM dictionary.
         '''
         if not data.uri:
-            data.uri = HttpUrl(vocabularyItem.get_EDAM_uri(data.term))
+            data.uri = HttpUrl(vocabularyItem.get_EDAM_uri(data.term, cls.edam_branch))
             if data.uri:
                 data.vocabulary = 'EDAM'
             
@@ -121,6 +121,8 @@ class vocabulary_topic(vocabularyItem):
     '''
     specific to topics
     '''
+    edam_branch = 'topic'
+
     @model_validator(mode="after")
     @classmethod
     def uri_EDAM_topic(cls, data):
@@ -146,6 +148,7 @@ class vocabulary_operation(vocabularyItem):
     '''
     specific to operations
     '''
+    edam_branch = 'operation'
 
     @model_validator(mode="after")
     @classmethod
@@ -12,7 +12,7 @@ New developers should implement this interface when integrating a new database o
 """
 
 
-from typing import Protocol, Dict, Any
+from typing import Protocol, Dict, Any, List, Iterable
 
 class DatabaseAdapter(Protocol):
     def entry_exists(self, collection_name: str, query: Dict[str, Any]) -> bool:
@@ -26,3 +26,6 @@ class DatabaseAdapter(Protocol):
 
     def get_raw_documents_from_source(self, collection_name: str, source: str) -> Dict[str, Any]:
         pass
+
+    def bulk_upsert(self, collection_name: str, documents: List[Dict[str, Any]], insert_only_fields: Iterable[str] = ()) -> Dict[str, int]:
+        pass
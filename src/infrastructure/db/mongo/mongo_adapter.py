@@ -6,8 +6,9 @@
 import os
 import pymongo
 import logging
-from typing import Dict
-from pymongo.errors import NetworkTimeout, AutoReconnect, CursorNotFound
+from typing import Dict, List, Iterable
+from pymongo import UpdateOne
+from pymongo.errors import NetworkTimeout, AutoReconnect, CursorNotFound, BulkWriteError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from src.infrastructure.db.mongo.database_adapter import DatabaseAdapter
 
@@ -174,12 +175,35 @@ class MongoDBAdapter(DatabaseAdapter):
         )
 
 
+    @retry(
+    retry=retry_if_exception_type((NetworkTimeout, AutoReconnect)),
+    wait=wait_exponential(multiplier=1, min=1, max=10), 
+    stop=stop_after_attempt(5),
+    )
+    def upsert_entry(self, collection_name: str, identifier: str, data: dict):
+        """
+        Update specific fields of an entry in a given MongoDB collection, creating the entry if it does not exist.
+
+        Args:
+            collection_name (str): The name of the MongoDB collection where the entry will be upserted.
+            identifier (str): The unique identifier ('_id') of the entry.
+            data (dict): A dictionary containing the fields and values to be set.
+        """
+        collection = self.db[collection_name]
+        logger.debug("Upserting entry %s in collection: %s", identifier, collection_name)
+        collection.update_one(
+            {'_id': identifier},
+            {'$set': data},
+            upsert=True
+        )
+
+
     @retry(
     retry=retry_if_exception_type((NetworkTimeout, AutoReconnect, CursorNotFound)),
     wait=wait_exponential(multiplier=1, min=1, max=10), 
     stop=stop_after_attempt(5),
     )
-    def fetch_entries(self, collection_name: str, query: Dict):
+    def fetch_entries(self, collection_name: str, query: Dict, projection: Dict = None):
         """
         Retrieve documents from a specified MongoDB collection that match a given query.
 
@@ -188,6 +212,7 @@ class MongoDBAdapter(DatabaseAdapter):
         Args:
             collection_name (str): The name of the collection from which documents are to be retrieved.
             query (dict): A dictionary specifying the query criteria used to find documents. This must conform to MongoDB's query format.
+            projection (dict): Fields to include or exclude from the documents. Defaults to None (all fields).
 
         Returns:
             pymongo.cursor.Cursor: A cursor for all documents that match the query, which allows for iterating over the documents found.
@@ -197,44 +222,74 @@ class MongoDBAdapter(DatabaseAdapter):
         collection = self.db[collection_name]
 
         try:
-            document = collection.find(query, no_cursor_timeout=True).batch_size(100) # preventing automatic cursor timeout
+            document = collection.find(query, projection=projection, no_cursor_timeout=True).batch_size(100) # preventing automatic cursor timeout
             return list(document)
 
         except CursorNotFound:
             logger.error(f"Cursor was lost for query: {query}. Retrying...")
             raise # Retrying the operation
 
-    @retry( 
-            retry=retry_if_exception_type((NetworkTimeout, AutoReconnect, CursorNotFound)),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            stop=stop_after_attempt(5),
-    )
-    def fetch_paginated_entries(self, collection_name: str, query: Dict, page_size: int = 100):
+    def fetch_paginated_entries(self, collection_name: str, query: Dict, page_size: int = 100, projection: Dict = None, keyset: bool = True):
         """
         Retrieve documents from a specified MongoDB collection that match a given query in paginated form.
 
-        This function searches for all documents within the specified collection that match the criteria outlined in the query dictionary. It returns a cursor to the documents, which can be iterated over to access individual documents. This is typically used for fetching multiple documents rather than a single document.
+        By default, pages are read with keyset (range) pagination: documents are sorted by `_id` and each page asks for the documents whose `_id` is greater than the last one seen. This uses the `_id` index, so reading a page does not require scanning the previous ones, as `skip` does. Each page is fetched (and retried on network errors) independently, so a lost connection resumes from the last page read.
 
         Args:
             collection_name (str): The name of the collection from which documents are to be retrieved.
             query (dict): A dictionary specifying the query criteria used to find documents. This must conform to MongoDB's query format.
             page_size (int): The number of documents to retrieve per page. Defaults to 100.
+            projection (dict): Fields to include or exclude from the documents. `_id` is always returned. Defaults to None (all fields).
+            keyset (bool): If False, pages are read with skip/limit instead. Defaults to True.
         
         Yields:
             List[Dict]: A list of documents that match the query, with each list representing a page of documents.
         """
         logger.debug(f"Fetching paginated entries from collection {collection_name} with query: {query}")
-        collection = self.db[collection_name]
-        skip = 0 
-
+        if projection:
+            # _id is needed to read the next page: only an exclusion of _id is dropped ({'_id': 1} is kept as given)
+            projection = {k: v for k, v in projection.items() if k != '_id' or v} or None
+
+        if not keyset:
+            skip = 0 
+            while True:
+                documents = self._fetch_page(collection_name, query, page_size, projection, skip=skip)
+                if not documents:
+                    break # stops when no more documents are found
+
+                yield documents
+                skip += page_size # moves to the next page
+            return
+
+        last_id = None
         while True:
-            cursor = collection.find(query).skip(skip).limit(page_size)
-            documents = list(cursor)
+            page_query = query if last_id is None else {'$and': [query, {'_id': {'$gt': last_id}}]}
+            documents = self._fetch_page(collection_name, page_query, page_size, projection, sort=True)
             if not documents:
                 break # stops when no more documents are found
 
             yield documents
-            skip += page_size # moves to the next page
+            if len(documents) < page_size:
+                break # last page
+            last_id = documents[-1]['_id'] # moves to the next page
+
+
+    @retry( 
+            retry=retry_if_exception_type((NetworkTimeout, AutoReconnect, CursorNotFound)),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            stop=stop_after_attempt(5),
+    )
+    def _fetch_page(self, collection_name: str, query: Dict, page_size: int, projection: Dict = None, skip: int = 0, sort: bool = False):
+        """
+        Retrieve a single page of documents. Used by `fetch_paginated_entries`.
+        """
+        collection = self.db[collection_name]
+        cursor = collection.find(query, projection=projection)
+        if sort:
+            cursor = cursor.sort('_id', pymongo.ASCENDING)
+        if skip:
+            cursor = cursor.skip(skip)
+        return list(cursor.limit(page_size).batch_size(page_size))
 
 
 
@@ -285,4 +340,110 @@ class MongoDBAdapter(DatabaseAdapter):
         id_inserted_doc =  collection.insert_one(document)
         logger.debug(f"Inserted document into collection {collection_name}")
         return id_inserted_doc.inserted_id
-    
\ No newline at end of file
+
+
+    @retry(
+    retry=retry_if_exception_type((NetworkTimeout, AutoReconnect)),
+    wait=wait_exponential(multiplier=1, min=1, max=10), 
+    stop=stop_after_attempt(5),
+    )
+    def bulk_upsert(self, collection_name: str, documents: List[Dict], insert_only_fields: Iterable[str] = ()):
+        """
+        Insert or update several documents of a MongoDB collection in a single round trip.
+
+        Each document is turned into an `UpdateOne` operation with `upsert=True`, matched by its `_id` (or `id`, which is renamed to `_id` as in `insert_one`). Fields listed in `insert_only_fields` are written with `$setOnInsert`, so they are kept untouched when the document already exists; the rest are written with `$set`. The operations are sent as one unordered `bulk_write`, so a failing document does not prevent the others from being written.
+
+        Args:
+            collection_name (str): The name of the collection where the documents will be upserted.
+            documents (list): A list of dictionaries representing the documents to be upserted.
+            insert_only_fields (iterable): Names of the fields that must only be set when the document is created (e.g. 'created_at').
+
+        Returns:
+            dict: Counts of matched, modified, upserted and failed documents.
+        """
+        summary = {'matched': 0, 'modified': 0, 'upserted': 0, 'failed': 0}
+        if not documents:
+            return summary
+
+        insert_only_fields = set(insert_only_fields)
+        operations = []
+        for document in documents:
+            document = dict(document)
+            if 'id' in document:
+                document['_id'] = document.pop('id')
+            identifier = document.pop('_id')
+
+            update = {'$set': {k: v for k, v in document.items() if k not in insert_only_fields}}
+            on_insert = {k: v for k, v in document.items() if k in insert_only_fields}
+            if on_insert:
+                update['$setOnInsert'] = on_insert
+
+            operations.append(UpdateOne({'_id': identifier}, update, upsert=True))
+
+        collection = self.db[collection_name]
+        try:
+            result = collection.bulk_write(operations, ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as bwe:
+            details = bwe.details
+            for error in details.get('writeErrors', []):
+                logger.error(f"Bulk upsert failed for document {error.get('op', {}).get('q')} in collection {collection_name}: {error.get('errmsg')}")
+
+        summary['matched'] = details.get('nMatched', 0)
+        summary['modified'] = details.get('nModified', 0)
+        summary['upserted'] = details.get('nUpserted', 0)
+        summary['failed'] = len(details.get('writeErrors', []))
+        logger.debug(f"Bulk upsert into collection {collection_name}: {summary}")
+        return summary
+
+
+    def bulk_writer(self, collection_name: str, insert_only_fields: Iterable[str] = (), batch_size: int = 500):
+        """
+        Create a buffered writer that upserts documents into a collection in batches.
+
+        Args:
+            collection_name (str): The name of the collection where the documents will be upserted.
+            insert_only_fields (iterable): Names of the fields that must only be set when the document is created.
+            batch_size (int): Number of buffered documents that triggers an automatic flush. Defaults to 500.
+
+        Returns:
+            BulkUpsertWriter: The buffered writer.
+        """
+        return BulkUpsertWriter(self, collection_name, insert_only_fields, batch_size)
+
+
+
+class BulkUpsertWriter:
+    """
+    Buffer of documents to be upserted in a collection with `MongoDBAdapter.bulk_upsert`.
+
+    Documents are collected with `add` and written with `flush`, which is also called automatically
+    when the buffer reaches `batch_size` documents. Documents sharing an `_id` are collapsed in the
+    buffer (the last one wins), as would happen when writing them one after another.
+    """
+
+    def __init__(self, db_adapter: MongoDBAdapter, collection_name: str, insert_only_fields: Iterable[str] = (), batch_size: int = 500):
+        self.db_adapter = db_adapter
+        self.collection_name = collection_name
+        self.insert_only_fields = tuple(insert_only_fields)
+        self.batch_size = batch_size
+        self.buffer = {}
+        self.totals = {'matched': 0, 'modified': 0, 'upserted': 0, 'failed': 0}
+
+    def add(self, document: Dict):
+        identifier = document.get('_id', document.get('id'))
+        self.buffer[identifier] = document
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        documents = list(self.buffer.values())
+        self.buffer = {}
+        summary = self.db_adapter.bulk_upsert(self.collection_name, documents, self.insert_only_fields)
+        for key, value in summary.items():
+            self.totals[key] += value
+
+    def __len__(self):
+        return len(self.buffer)
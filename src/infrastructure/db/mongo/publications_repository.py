@@ -2,6 +2,8 @@
 from src.infrastructure.db.mongo.mongo_adapter import MongoDBAdapter
 
 class PublicationsMetadataRepository:
+    IDENTITY_PROJECTION = {"data.doi": 1, "data.title": 1, "data.url": 1, "data.pmid": 1, "data.pmcid": 1}
+
     def __init__(self, db_adapter: MongoDBAdapter):
         self.db_adapter = db_adapter
         self.collection_name = "publicationsMetadataDev"
@@ -31,6 +33,28 @@ class PublicationsMetadataRepository:
         query = {"data.pmcid": pmcid}
         return self.db_adapter.fetch_entry(self.collection_name, query)
 
+    def find_by_identifiers(self, identifiers: dict):
+        """
+        Find the publication metadata entries matching any of the given identifiers, in a single query.
+
+        Args:
+            identifiers (dict): field of the publication data (doi, title, url, pmid, pmcid) -> value.
+
+        Returns:
+            list: The matching entries, with only their identifying fields.
+        """
+        conditions = [{f"data.{field}": value} for field, value in identifiers.items() if value]
+        if not conditions:
+            return []
+        query = {"$or": conditions}
+        return self.db_adapter.fetch_entries(self.collection_name, query, projection=self.IDENTITY_PROJECTION)
+
+    def get_identities(self, page_size: int = 5000):
+        """Yield every publication metadata entry, with only its identifying fields."""
+        pages = self.db_adapter.fetch_paginated_entries(self.collection_name, {}, page_size=page_size, projection=self.IDENTITY_PROJECTION)
+        for page in pages:
+            yield from page
+
     def entry_exists(self, identifier: str) -> bool:
         return self.db_adapter.entry_exists(self.collection_name, identifier)
 
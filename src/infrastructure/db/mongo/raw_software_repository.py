@@ -1,7 +1,7 @@
 # Raw software repository# This adapter translates DB logic into domain logic from src.infrastructure.mongo_adapter import MongoDBAdapter
 
 from src.infrastructure.db.mongo.mongo_adapter import MongoDBAdapter
-from typing import Dict, Any
+from typing import Dict, Any, Set
 
 class RawSoftwareMetadataRepository:
     def __init__(self, db_adapter: MongoDBAdapter):
@@ -9,7 +9,7 @@ class RawSoftwareMetadataRepository:
         self.collection_name = "alambiqueDev"
 
 
-    def get_raw_documents_from_source(self,source: str):
+    def get_raw_documents_from_source(self, source: str, page_size: int = 100, projection: Dict[str, Any] = None, updated_since: str = None):
         """
         Retrieve and return documents from a specified MongoDB collection that match a particular source.
 
@@ -17,12 +17,28 @@ class RawSoftwareMetadataRepository:
 
         Args:
             source (str): The source identifier used to generate the query for fetching documents. Documents in the collection that match this source will be retrieved.
+            page_size (int): Number of documents per page. Defaults to 100.
+            projection (dict): Fields to include or exclude from the documents. Defaults to None (all fields).
+            updated_since (str): If provided, only documents whose '@last_updated_at' is later than this value (or that lack it) are retrieved.
 
         Returns:
-            Generator.
+            Generator of pages (lists of documents), read with keyset pagination over `_id`.
         """
-        raw_data = self.db_adapter.fetch_paginated_entries(self.collection_name, {'@data_source': source})
+        query = {'@data_source': source}
+        if updated_since:
+            query['$or'] = [
+                {'@last_updated_at': {'$gt': updated_since}},
+                {'@last_updated_at': {'$exists': False}}
+            ]
+        raw_data = self.db_adapter.fetch_paginated_entries(self.collection_name, query, page_size=page_size, projection=projection)
 
         return raw_data
+
+    def get_raw_ids_from_source(self, source: str) -> Set[str]:
+        """
+        Return the identifiers of all the raw documents of a source.
+        """
+        pages = self.db_adapter.fetch_paginated_entries(self.collection_name, {'@data_source': source}, page_size=5000, projection={'_id': 1})
+        return {document['_id'] for page in pages for document in page}
     
     
\ No newline at end of file
@@ -22,6 +22,67 @@ class StdSoftwareMetaRepository:
         return standardized_software_data
 
 
+    def iter_standardized_software_data(self, projection=None, page_size=1000):
+        """
+        Yield the entries of the pretools collection one by one, reading them in pages.
+
+        Args:
+            projection (dict): Fields to return. Defaults to None (all fields).
+            page_size (int): Number of entries read from the database at a time.
+        """
+        for page in self.db_adapter.fetch_paginated_entries(self.collection_name, {}, page_size=page_size, projection=projection):
+            yield from page
+
+
+    def get_standardized_software_by_ids(self, ids):
+        """
+        Return the entries of the pretools collection with the given identifiers, with a single query.
+        Identifiers without an entry are left out.
+        """
+        if not ids:
+            return []
+        return self.db_adapter.fetch_entries(self.collection_name, {'_id': {'$in': list(ids)}})
+
+
+    def get_source_hashes(self, raw_ids):
+        """
+        Return the content hash stored in the pretools entries generated from the given raw entries.
+
+        Args:
+            raw_ids (list): Identifiers of the raw entries (source.id in the pretools entries).
+
+        Returns:
+            dict: raw entry identifier -> content hash. Raw entries without pretools entries are not included.
+        """
+        if not raw_ids:
+            return {}
+        query = {'source.id': {'$in': list(raw_ids)}}
+        documents = self.db_adapter.fetch_entries(self.collection_name, query, projection={'source': 1})
+        hashes = {}
+        for doc in documents:
+            for source in doc.get('source', []):
+                if source.get('id') in raw_ids and source.get('content_hash'):
+                    hashes[source['id']] = source['content_hash']
+        return hashes
+
+
+    def get_source_ids(self, data_source: str):
+        """
+        Return the identifiers of the raw entries from which the pretools entries of a data source were generated.
+
+        Returns:
+            dict: raw entry identifier -> list of identifiers of the pretools entries generated from it.
+        """
+        query = {'source.data_source': data_source}
+        source_ids = {}
+        for page in self.db_adapter.fetch_paginated_entries(self.collection_name, query, page_size=5000, projection={'source': 1}):
+            for doc in page:
+                for source in doc.get('source', []):
+                    if source.get('data_source') == data_source:
+                        source_ids.setdefault(source['id'], []).append(doc['_id'])
+        return source_ids
+
+
     def validate_standardized_software_data(self, documents):
         """
         Validate a list of documents using the PretoolsEntryModel schema and return the validated documents.
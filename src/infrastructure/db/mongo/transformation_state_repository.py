@@ -0,0 +1,20 @@
+# This adapter translates DB logic into domain logic 
+# This repository keeps the state of the transformation of each source (e.g. watermark of incremental runs).
+
+from src.infrastructure.db.mongo.mongo_adapter import MongoDBAdapter
+from typing import Dict, Any, Optional
+import os
+
+
+class TransformationStateRepository:
+    def __init__(self, db_adapter: MongoDBAdapter):
+        self.db_adapter = db_adapter
+        self.collection_name = os.getenv('TRANSFORMATION_STATE', 'transformationStateDev')
+
+    def get_state(self, source: str) -> Optional[Dict[str, Any]]:
+        """Return the state of the last transformation of a source, or None if it was never transformed incrementally."""
+        return self.db_adapter.fetch_entry(self.collection_name, {'_id': source})
+
+    def save_state(self, source: str, state: Dict[str, Any]):
+        """Create or replace the fields of the state of a source."""
+        self.db_adapter.upsert_entry(self.collection_name, source, state)
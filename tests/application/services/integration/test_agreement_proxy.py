@@ -93,4 +93,40 @@ def test_decision_agreement_proxy_with_variants(monkeypatch, mock_llama, mock_mi
     assert 'mixtral' in result
     for model in ['llama_4', 'mixtral']:
         assert 'explanation' in result[model]
-        assert 'features' in result[model]
\ No newline at end of file
+        assert 'features' in result[model]
+
+def test_models_are_queried_at_the_same_time(monkeypatch):
+    import threading
+    # Each model waits for the other one: if they were queried one after another, the barrier would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def mock_query_huggingface_new(messages, model, provider):
+        barrier.wait()
+        return llama_4_same, {}
+
+    def mock_query_openrouter(messages, model):
+        barrier.wait()
+        return mixtral_same, {}
+
+    monkeypatch.setattr("src.application.services.integration.disambiguation.proxy.query_huggingface_new", mock_query_huggingface_new)
+    monkeypatch.setattr("src.application.services.integration.disambiguation.proxy.query_openrouter", mock_query_openrouter)
+
+    assert decision_agreement_proxy(messages)["verdict"] == "Same"
+
+
+def test_configurable_model_panel(monkeypatch):
+    answers = {"model-a": mixtral_same, "model-b": mixtral_same, "model-c": "no verdict"}
+
+    def mock_query_openrouter(messages, model):
+        return answers[model], {}
+
+    monkeypatch.setattr("src.application.services.integration.disambiguation.proxy.query_openrouter", mock_query_openrouter)
+
+    panel = [{"name": name, "client": "openrouter", "model": name} for name in ["model-a", "model-b"]]
+    result = decision_agreement_proxy(messages, models=panel)
+    assert result["verdict"] == "Same"
+    assert set(result) == {"verdict", "model-a", "model-b"}
+
+    # a model without verdict needs human annotation
+    panel.append({"name": "model-c", "client": "openrouter", "model": "model-c"})
+    assert decision_agreement_proxy(messages, models=panel)["verdict"] == "disagreement"
@@ -0,0 +1,75 @@
+import os
+import json
+from bson import ObjectId
+from src.application.services.integration import block_stream
+from src.application.services.integration.block_stream import BlockFile, write_blocks, iter_blocks, index_path
+from src.application.services.integration.disambiguation.utils import load_dict_from_jsonl
+
+
+BLOCKS = {
+    "trimal/cmd": {"instances": [{"_id": ObjectId("64a7f0c2e4b0a1a2b3c4d5e6"), "name": "trimal"}]},
+    "fastqc/cmd": {"instances": [{"name": "fastqc", "version": ["0.11"]}]},
+    "samtools/lib": {"instances": []},
+}
+
+
+def test_jsonl_blocks_round_trip_one_block_per_line(tmp_path):
+    path = str(tmp_path / "grouped.jsonl")
+    assert write_blocks(path, BLOCKS.items(), index=True) == 3
+
+    with open(path) as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["trimal/cmd"]["instances"][0]["_id"] == {"$oid": "64a7f0c2e4b0a1a2b3c4d5e6"}
+
+    blocks = BlockFile(path)
+    assert len(blocks) == 3
+    assert "fastqc/cmd" in blocks
+    assert blocks["fastqc/cmd"] == BLOCKS["fastqc/cmd"]
+    assert [key for key, _ in iter_blocks(path)] == list(BLOCKS)
+    # the file is also a plain JSONL file for the disambiguation
+    assert load_dict_from_jsonl(path)["samtools/lib"] == {"instances": []}
+
+
+def test_json_blocks_are_a_single_object(tmp_path):
+    path = str(tmp_path / "grouped.json")
+    write_blocks(path, BLOCKS.items())
+
+    with open(path) as f:
+        data = json.load(f)
+    assert list(data) == list(BLOCKS)
+    assert dict(iter_blocks(path))["fastqc/cmd"] == BLOCKS["fastqc/cmd"]
+    assert not os.path.exists(index_path(path))
+
+
+def test_index_is_used_when_up_to_date_and_rebuilt_otherwise(tmp_path, mocker):
+    path = str(tmp_path / "grouped.jsonl")
+    write_blocks(path, BLOCKS.items(), index=True)
+
+    scan = mocker.spy(block_stream, "scan_block_offsets")
+    assert len(BlockFile(path)) == 3
+    scan.assert_not_called()
+
+    with open(path, "a") as f:
+        f.write(json.dumps({"bedtools/cmd": {"instances": []}}) + "\n")
+
+    blocks = BlockFile(path, save_index=True)
+    assert scan.call_count == 1
+    assert blocks["bedtools/cmd"] == {"instances": []}
+
+    # the rebuilt index is saved and used next time
+    assert len(BlockFile(path)) == 4
+    assert scan.call_count == 1
+
+
+def test_last_line_wins_and_removed_blocks_are_skipped(tmp_path):
+    path = tmp_path / "disambiguated.jsonl"
+    lines = [
+        {"a/cmd": {"resolution": "unclear"}},
+        {"b/cmd": {"resolution": "merged"}},
+        {"a/cmd": {"resolution": "merged"}},
+        {block_stream.REMOVED: "b/cmd"},
+    ]
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines) + '{"c/cmd": {"resol')
+
+    assert dict(iter_blocks(str(path))) == {"a/cmd": {"resolution": "merged"}}
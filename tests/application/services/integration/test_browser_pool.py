@@ -0,0 +1,146 @@
+import threading
+import pytest
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from src.application.services.integration.disambiguation import browser_pool
+from src.application.services.integration.disambiguation.browser_pool import BrowserPool, needs_javascript, fetch_static_html
+
+STATIC_PAGE = "<html><body><h1>Tool</h1><p>" + "A tool that aligns sequences. " * 20 + "</p><img src='/logo.png'></body></html>"
+APP_PAGE = "<html><body><div id=\"root\"></div><script src='/app.js'></script></body></html>"
+
+
+@pytest.fixture
+def server(tmp_path):
+    (tmp_path / "static.html").write_text(STATIC_PAGE)
+    (tmp_path / "app.html").write_text(APP_PAGE)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+    requested = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            requested.append(self.path)
+
+    httpd = HTTPServer(("127.0.0.1", 0), partial(Handler, directory=str(tmp_path)))
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}", requested
+    httpd.shutdown()
+
+
+def test_needs_javascript():
+    assert not needs_javascript(STATIC_PAGE)
+    assert needs_javascript(APP_PAGE)
+    assert needs_javascript("<html><noscript>Please enable JavaScript to use this site</noscript>" + STATIC_PAGE)
+
+
+@pytest.mark.asyncio
+async def test_static_pages_are_not_rendered(server, monkeypatch):
+    base_url, _ = server
+    pool = BrowserPool()
+    rendered = []
+
+    async def mock_render(url):
+        rendered.append(url)
+        return "<html>rendered</html>"
+
+    monkeypatch.setattr(pool, "render", mock_render)
+
+    assert await pool.fetch(f"{base_url}/static.html") == (STATIC_PAGE, "http")
+    assert await pool.fetch(f"{base_url}/app.html") == ("<html>rendered</html>", "browser")
+    # nothing extracted from the static page: it is rendered
+    assert await pool.fetch(f"{base_url}/static.html", extract=lambda html: "rendered" in html) == (True, "browser")
+    assert rendered == [f"{base_url}/app.html", f"{base_url}/static.html"]
+    assert pool.stats["http"] == 1
+
+
+@pytest.mark.asyncio
+async def test_static_html_is_used_when_the_browser_fails(server, monkeypatch):
+    base_url, _ = server
+    pool = BrowserPool()
+
+    async def mock_render(url):
+        raise RuntimeError("Executable doesn't exist")
+
+    monkeypatch.setattr(pool, "render", mock_render)
+
+    assert await pool.fetch(f"{base_url}/app.html") == (APP_PAGE, "http")
+    assert await pool.fetch(f"{base_url}/missing.html") == (None, None)
+
+
+@pytest.mark.asyncio
+async def test_failed_launch_is_not_retried_until_the_delay_passes(server, monkeypatch):
+    base_url, _ = server
+    launches = []
+
+    class FailingPlaywright:
+        async def start(self):
+            launches.append(1)
+            raise RuntimeError("Executable doesn't exist")
+
+    monkeypatch.setattr(browser_pool, "async_playwright", FailingPlaywright)
+    pool = BrowserPool(retry_delay=60)
+
+    assert await pool.fetch(f"{base_url}/app.html") == (APP_PAGE, "http")
+    assert await pool.fetch(f"{base_url}/app.html") == (APP_PAGE, "http")
+    assert len(launches) == 1
+
+    pool.launch_failed_at -= 60
+    assert await pool.fetch(f"{base_url}/app.html") == (APP_PAGE, "http")
+    assert len(launches) == 2
+
+
+def test_static_fetch_is_capped(server):
+    base_url, _ = server
+    assert fetch_static_html(f"{base_url}/static.html", max_bytes=100) == STATIC_PAGE[:100]
+
+
+@pytest.mark.asyncio
+async def test_pages_are_reused_and_recycled():
+    class FakeResponse:
+        status = 200
+
+    class FakePage:
+        def __init__(self):
+            self.closed = False
+
+        async def goto(self, url, **kwargs):
+            return FakeResponse()
+
+        async def content(self):
+            return "<html></html>"
+
+        async def close(self):
+            self.closed = True
+
+    class FakeContext:
+        pages = []
+
+        async def new_page(self):
+            self.pages.append(FakePage())
+            return self.pages[-1]
+
+    pool = BrowserPool(max_page_uses=3)
+    pool.context = FakeContext()
+
+    for _ in range(7):
+        await pool.render("http://example.org")
+
+    assert len(FakeContext.pages) == 3
+    assert [page.closed for page in FakeContext.pages] == [True, True, False]
+    assert pool.stats == {"http": 0, "browser": 7, "recycled_pages": 2}
+
+
+@pytest.mark.asyncio
+async def test_browser_blocks_images(server):
+    base_url, requested = server
+    pool = BrowserPool()
+    try:
+        await pool.start()
+    except Exception as e:
+        pytest.skip(f"Chromium is not available: {e}")
+    try:
+        html = await pool.render(f"{base_url}/static.html")
+    finally:
+        await pool.close()
+
+    assert "aligns sequences" in html
+    assert not any("logo.png" in path for path in requested)
@@ -0,0 +1,71 @@
+import random
+from collections import OrderedDict
+import tiktoken
+from src.application.services.integration.disambiguation import conflict_builder, prompts
+
+
+def byte_tokenizer():
+    # offline tokenizer: one token per byte, plus " t" and "the"
+    ranks = {bytes([i]): i for i in range(256)}
+    ranks[b" t"] = 256
+    ranks[b"th"] = 257
+    ranks[b"the"] = 258
+    return tiktoken.Encoding(name="bytes", pat_str=r" ?\S+|\s+", mergeable_ranks=ranks, special_tokens={})
+
+
+class CountingTokenizer:
+    def __init__(self):
+        self.enc = byte_tokenizer()
+        self.encoded = []
+
+    def encode(self, text):
+        self.encoded.append(text)
+        return self.enc.encode(text)
+
+
+def test_chunks_do_not_split_words(monkeypatch):
+    enc = byte_tokenizer()
+    monkeypatch.setattr(conflict_builder, "get_tokenizer", lambda model: enc)
+    random.seed(1)
+    words = ["".join(random.choices("abcdethé", k=random.randint(1, 12))) for _ in range(2000)]
+    text = "\n".join(" ".join(words[i:i + 10]) for i in range(0, len(words), 10))
+
+    chunks = conflict_builder.chunk_text(text, max_tokens=100)
+
+    assert all(len(enc.encode(chunk)) <= 100 for chunk in chunks)
+    assert " ".join(chunks) == " ".join(words)
+    assert conflict_builder.chunk_text(" \n ", max_tokens=100) == []
+    assert conflict_builder.chunk_text("the theme", max_tokens=100) == ["the theme"]
+
+
+def test_long_words_are_split(monkeypatch):
+    monkeypatch.setattr(conflict_builder, "get_tokenizer", lambda model: byte_tokenizer())
+    assert conflict_builder.chunk_text("a" * 250, max_tokens=100) == ["a" * 100, "a" * 100, "a" * 50]
+
+
+def test_token_counts_are_memoized(monkeypatch):
+    tokenizer = CountingTokenizer()
+    monkeypatch.setattr(prompts, "get_tokenizer", lambda model: tokenizer)
+    monkeypatch.setattr(prompts, "_token_counts", OrderedDict())
+    messages = [{"role": "user", "content": "the same content"}, {"role": "user", "content": "other content"}]
+
+    expected = sum(len(tokenizer.enc.encode(message["content"])) for message in messages)
+
+    assert prompts.estimate_total_tokens(messages) == expected
+    assert prompts.estimate_total_tokens(messages) == expected
+    assert prompts.estimate_total_tokens(messages, model="other") == expected
+    assert tokenizer.encoded == ["the same content", "other content"] * 2
+
+
+def test_token_counts_are_bounded(monkeypatch):
+    tokenizer = CountingTokenizer()
+    monkeypatch.setattr(prompts, "get_tokenizer", lambda model: tokenizer)
+    monkeypatch.setattr(prompts, "_token_counts", OrderedDict())
+    monkeypatch.setattr(prompts, "TOKEN_COUNT_CACHE_SIZE", 2)
+
+    for text in ["a", "b", "a", "c", "a", "b"]:
+        prompts.count_tokens(text)
+
+    # "b" was the least recently used when "c" was counted
+    assert tokenizer.encoded == ["a", "b", "c", "b"]
+    assert len(prompts._token_counts) == 2
@@ -0,0 +1,69 @@
+import json
+import pytest
+from src.application.services.integration.block_stream import iter_json_object_items
+from src.application.services.integration.conflict_detection import find_disconnected_entries
+
+
+def instance(entry_id, name, source, repositories=(), webpages=()):
+    return {
+        "_id": entry_id,
+        "data": {
+            "name": name,
+            "source": [source],
+            "repository": [{"url": url} for url in repositories],
+            "webpage": list(webpages),
+        }
+    }
+
+
+BLOCKS = {
+    "ale/cmd": {"instances": [
+        instance("biotools/ale/cmd/None", "ale", "biotools", webpages=["https://github.com/wrenlab/label-extraction"]),
+        instance("bioconda_recipes/ale/cmd/1", "ale", "bioconda_recipes", repositories=["https://github.com/sc932/ALE.git"]),
+        instance("github/ale/cmd/1", "ale", "github", repositories=["https://www.github.com/sc932/ALE"]),
+        instance("bioconda/ale/cmd/1", "ale", "bioconda", webpages=["https://github.com/wrenlab/label-extraction"]),
+    ]},
+    "trimal/cmd": {"instances": [
+        instance("biotools/trimal/cmd/None", "trimal", "biotools", webpages=["http://trimal.cgenomics.org"]),
+        instance("github/trimal/cmd/1", "trimal", "github", webpages=["http://trimal.cgenomics.org/"]),
+    ]},
+    "single/cmd": {"instances": [instance("biotools/single/cmd/None", "single", "biotools")]},
+}
+
+
+def test_entries_without_shared_links_are_disconnected():
+    conflicts = find_disconnected_entries(BLOCKS, use_name_match_for_no_links=False)
+
+    assert list(conflicts) == ["ale/cmd"]
+    assert [e["id"] for e in conflicts["ale/cmd"]["disconnected"]] == ["biotools/ale/cmd/None"]
+    assert [e["id"] for e in conflicts["ale/cmd"]["remaining"]] == ["bioconda_recipes/ale/cmd/1", "github/ale/cmd/1"]
+
+
+def test_blocks_are_streamed_from_the_grouped_file(tmp_path):
+    path = tmp_path / "grouped.json"
+    path.write_text(json.dumps(BLOCKS, indent=4))
+
+    # small chunks, so values span several reads
+    items = list(iter_json_object_items(str(path), chunk_size=16))
+
+    assert items == list(BLOCKS.items())
+    assert find_disconnected_entries(iter(items)) == find_disconnected_entries(BLOCKS)
+
+    path.write_text(" { } ")
+    assert list(iter_json_object_items(str(path))) == []
+
+
+def test_malformed_block_fails_without_buffering_the_rest_of_the_file(tmp_path, mocker):
+    path = tmp_path / "grouped.json"
+    blocks = {f"tool{i}/cmd": {"instances": []} for i in range(2000)}
+    text = json.dumps(blocks)
+    # a broken value in the second block
+    path.write_text(text.replace('{"instances": []}', '{"instances": [,]}', 2).replace('{"instances": [,]}', '{"instances": []}', 1))
+
+    read = mocker.spy(json.JSONDecoder, "raw_decode")
+    items = iter_json_object_items(str(path), chunk_size=256)
+    assert next(items)[0] == "tool0/cmd"
+    with pytest.raises(json.JSONDecodeError):
+        list(items)
+    # the error is raised from the first chunks, not after reading the whole file
+    assert max(len(call.args[1]) for call in read.call_args_list) < 1024
@@ -0,0 +1,78 @@
+import json
+import asyncio
+import random
+import pytest
+from src.application.services.integration.disambiguation import disambiguator
+from src.application.services.integration.disambiguation.rate_limit import RateLimiter
+
+
+@pytest.mark.asyncio
+async def test_blocks_are_disambiguated_concurrently_and_saved_in_order(monkeypatch, tmp_path):
+    blocks = {f"tool{i}/cmd": {"instances": []} for i in range(12)}
+    conflict_blocks = {key: {} for i, key in enumerate(blocks) if i % 3 != 0}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def mock_process_conflict(key, conflict, pair_semaphore=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(random.random() / 100)
+        in_flight -= 1
+        return {key: {"resolution": "automated"}}
+
+    monkeypatch.setattr(disambiguator, "process_conflict", mock_process_conflict)
+    monkeypatch.setattr(disambiguator, "build_no_conflict_record", lambda key, block: {key: {"resolution": "no_conflict"}})
+
+    path = tmp_path / "disambiguated_blocks.jsonl"
+    # a previous run was interrupted while writing a record
+    path.write_text(json.dumps({"tool0/cmd": {"resolution": "no_conflict"}}) + '\n{"tool1/cm')
+
+    result = await disambiguator.disambiguate_blocks(conflict_blocks, blocks, str(path), max_blocks=3)
+
+    saved = [next(iter(json.loads(line))) for line in path.read_text().splitlines()]
+    assert saved == list(blocks)
+    assert set(result) == set(blocks)
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_pairs_after_a_disagreement_are_cancelled(monkeypatch):
+    pairs = [{"remaining": [{"id": "a"}], "disconnected": [{"id": name}]} for name in "bcde"]
+    finished = []
+    manual = []
+
+    async def mock_disambiguate_pair(key, conflict_pair, pair_semaphore):
+        name = conflict_pair["disconnected"][0]["id"]
+        async with pair_semaphore:
+            await asyncio.sleep({"b": 0.02, "c": 0.01}.get(name, 0.05))
+        finished.append(name)
+        return conflict_pair, {"verdict": "disagreement" if name == "c" else "same", "confidence": "high"}
+
+    monkeypatch.setattr(disambiguator, "replace_with_full_entries", lambda conflict: conflict)
+    monkeypatch.setattr(disambiguator, "build_pairs", lambda conflict, key, more_than_two_pairs: (pairs, None))
+    monkeypatch.setattr(disambiguator, "disambiguate_pair", mock_disambiguate_pair)
+    monkeypatch.setattr(disambiguator, "generate_context", lambda key, conflict: {})
+    monkeypatch.setattr(disambiguator, "generate_github_issue", lambda context: "")
+    monkeypatch.setattr(disambiguator, "create_github_issue", lambda title, body, labels: {"html_url": "https://github.com/issue/1"})
+    monkeypatch.setattr(disambiguator, "build_disambiguated_record_manual", lambda key, conflict, url: manual.append(key) or {key: url})
+
+    record = await disambiguator.process_conflict("tool/cmd", {}, pair_semaphore=asyncio.Semaphore(3))
+
+    # "b" is still needed, while "d" and "e" are cancelled as soon as "c" disagrees
+    assert finished == ["c", "b"]
+    assert manual == ["tool/cmd_pair_2"]
+    assert record == {"tool/cmd_pair_2": "https://github.com/issue/1"}
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    now = [100.0]
+    sleeps = []
+    monkeypatch.setattr("time.monotonic", lambda: now[0])
+    monkeypatch.setattr("time.sleep", lambda seconds: sleeps.append(seconds))
+
+    limiter = RateLimiter(requests_per_minute=30)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [2.0, 4.0]
@@ -0,0 +1,71 @@
+import json
+import pytest
+from src.application.services.integration.disambiguation.secondary_round import disambiguate_until_converged
+from src.application.services.integration.disambiguation.utils import load_dict_from_jsonl, add_jsonl_record
+
+
+def write_lines(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_rounds_only_process_queued_blocks(tmp_path):
+    blocks_path = write_lines(tmp_path / "blocks.jsonl", [
+        {"ale/cmd": {"instances": [{"_id": "x"}, {"_id": "y"}, {"_id": "z"}]}},
+        {"trimal/cmd": {"instances": [{"_id": "t"}]}},
+        {"done/cmd": {"instances": [{"_id": "d"}]}},
+    ])
+    conflict_blocks_path = write_lines(tmp_path / "conflict_blocks.jsonl", [{"ale/cmd": {"disconnected": [], "remaining": []}}])
+    disambiguated_path = write_lines(tmp_path / "disambiguated_blocks.jsonl", [{"done/cmd": {"resolution": "no_conflict", "unmerged_entries": []}}])
+    rounds = []
+
+    async def mock_disambiguate_blocks(conflict_blocks, blocks, path, keys=None):
+        rounds.append(keys)
+        for key in keys:
+            # blocks are read by key, including the secondary blocks of the previous round
+            assert isinstance(blocks[key]["instances"], list)
+            # the first round leaves two entries of ale/cmd unmerged; they are merged in the second round
+            unmerged = ["y", "z"] if key == "ale/cmd" else []
+            add_jsonl_record(path, {key: {"resolution": "partial", "unmerged_entries": unmerged}})
+        return load_dict_from_jsonl(path)
+
+    result = await disambiguate_until_converged(blocks_path, conflict_blocks_path, disambiguated_path, mock_disambiguate_blocks)
+
+    assert rounds == [["ale/cmd", "trimal/cmd"], ["ale/cmd_secondary_1"]]
+    assert set(result) == {"done/cmd", "ale/cmd", "trimal/cmd", "ale/cmd_secondary_1"}
+    secondary = load_dict_from_jsonl(conflict_blocks_path)["ale/cmd_secondary_1"]
+    assert secondary["parent_block_id"] == "ale/cmd"
+    assert secondary["remaining"] == [{"id": "y"}] and secondary["disconnected"] == [{"id": "z"}]
+
+    # resuming a finished run does nothing
+    rounds.clear()
+    await disambiguate_until_converged(blocks_path, conflict_blocks_path, disambiguated_path, mock_disambiguate_blocks)
+    assert rounds == []
+
+
+@pytest.mark.asyncio
+async def test_resume_generates_missing_secondary_conflicts(tmp_path):
+    blocks_path = write_lines(tmp_path / "blocks.jsonl", [{"ale/cmd": {}}, {"bwa/cmd": {}}])
+    conflict_blocks_path = write_lines(tmp_path / "conflict_blocks.jsonl", [
+        {"ale/cmd": {}},
+        {"bwa/cmd": {}},
+        {"ale/cmd_secondary_1": {"parent_block_id": "ale/cmd"}},
+    ])
+    disambiguated_path = write_lines(tmp_path / "disambiguated_blocks.jsonl", [
+        {"ale/cmd": {"unmerged_entries": ["x", "y"]}},
+        {"ale/cmd_secondary_1": {"unmerged_entries": []}},
+        {"bwa/cmd": {"unmerged_entries": ["a", "b"]}},
+    ])
+    rounds = []
+
+    async def mock_disambiguate_blocks(conflict_blocks, blocks, path, keys=None):
+        rounds.append(keys)
+        for key in keys:
+            add_jsonl_record(path, {key: {"unmerged_entries": []}})
+        return load_dict_from_jsonl(path)
+
+    await disambiguate_until_converged(blocks_path, conflict_blocks_path, disambiguated_path, mock_disambiguate_blocks)
+
+    # ale/cmd was already expanded; the new id does not collide with the existing secondary conflict
+    assert rounds == [["bwa/cmd_secondary_2"]]
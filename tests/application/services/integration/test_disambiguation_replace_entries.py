@@ -1,24 +1,10 @@
-from src.application.services.integration.disambiguation.utils import build_instances_keys_dict, replace_with_full_entries
+from src.application.services.integration.disambiguation.utils import replace_with_full_entries
 from tests.application.services.integration.data.data_disambiguation_original import original_conflict
 import pytest 
 import json
 from pprint import pprint
 
 
-# ---------
-# build instances_keys_dict with tests/application/services/integration/data/grouped_entries.json 
-# ---------
-
-with open('tests/application/services/integration/data/grouped_entries.json') as f:
-    grouped_entries = json.load(f)
-
-instances_dict = build_instances_keys_dict(grouped_entries)
-
-# save the instances_dict to a json file
-with open('tests/application/services/integration/data/instances_dict.json', 'w') as f:
-    json.dump(instances_dict, f, indent=4)
-
-
 # ---------
 # Test 
 # ---------
@@ -27,7 +13,7 @@ class TestReplaceWithFullEntries:
 
     def test_replace_with_full_entries(self): 
 
-        conflict = replace_with_full_entries(original_conflict, instances_dict)
+        conflict = replace_with_full_entries(original_conflict)
         #pprint(conflict)
         
         assert isinstance(conflict, dict)
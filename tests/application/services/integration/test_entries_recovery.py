@@ -0,0 +1,33 @@
+from src.application.services.integration.entries_recovery import recover_shared_name_link, merge_overlapping_groups
+
+
+def group(*instances):
+    return {'instances': list(instances), 'links': set()}
+
+
+def instance(_id, repository=(), webpage=()):
+    return {'_id': _id, 'data': {'repository': [{'url': url} for url in repository], 'webpage': list(webpage)}}
+
+
+def test_merge_overlapping_groups():
+    groups = [['a/cmd', 'a/lib'], ['b/cmd', 'b/web'], ['a/cmd', 'a/lib'], ['a/lib', 'a/web']]
+    assert merge_overlapping_groups(groups) == [['a/cmd', 'a/lib', 'a/web'], ['b/cmd', 'b/web']]
+
+
+def test_recover_shared_name_link():
+    grouped = {
+        'tool/cmd': group(instance('1', webpage=['https://tool.org/'])),
+        'tool/lib': group(instance('2', webpage=['http://tool.org'])),
+        'tool/web': group(instance('3', webpage=['https://tool.org/docs']), instance('4', repository=['https://github.com/org/tool-web'])),
+        'tool/*': group(instance('5', webpage=['https://tool.org/docs'])),
+        'other/cmd': group(instance('6', webpage=['https://tool.org/'])),
+        'single/lib': group(instance('7', webpage=['https://single.org'])),
+        'single/cmd': group(instance('8', webpage=['https://single.org/'])),
+    }
+
+    result = recover_shared_name_link(grouped)
+
+    # tool.org is shared with "other", so it does not count. tool/web and tool/* share tool.org/docs
+    assert list(result) == ['tool/cmd', 'tool/lib', 'other/cmd', 'tool/*', 'single/*']
+    assert [inst['_id'] for inst in result['tool/*']['instances']] == ['5', '3', '4']
+    assert [inst['_id'] for inst in result['single/*']['instances']] == ['8', '7']
@@ -0,0 +1,67 @@
+import pytest
+from bson import ObjectId
+from src.application.services.integration.disambiguation import entry_loader, utils
+from src.application.services.integration.disambiguation.entry_loader import EntryLoader, PRETOOLS, PUBLICATIONS
+
+
+@pytest.fixture
+def adapter(mongo_adapter, mocker):
+    adapter = mongo_adapter
+
+    publications = [ObjectId(), ObjectId()]
+    adapter.db[PUBLICATIONS].insert_many([
+        {'_id': publications[0], 'data': {'title': 'ALE paper'}},
+        {'_id': publications[1], 'data': {'title': 'ALE-core paper'}},
+    ])
+    adapter.db[PRETOOLS].insert_many([
+        {'_id': 'biotools/ale/cmd/None', 'data': {'name': 'ale', 'publication': [publications[0]]}},
+        {'_id': 'bioconda_recipes/ale/cmd/20180904', 'data': {'name': 'ale', 'publication': []}},
+        {'_id': 'bioconda_recipes/ale-core/cmd/1.0', 'data': {'name': 'ale-core', 'publication': [publications[1], {'title': 'inline'}]}},
+    ])
+    mocker.spy(adapter, "fetch_entries")
+    return adapter
+
+
+def conflict(disconnected, remaining):
+    return {'disconnected': [{'id': i} for i in disconnected], 'remaining': [{'id': i} for i in remaining]}
+
+
+def test_conflicts_are_loaded_with_one_query_per_collection(adapter, monkeypatch):
+    loader = EntryLoader(adapter)
+    monkeypatch.setattr(entry_loader, "_entry_loader", loader)
+    conflicts = [
+        conflict(['biotools/ale/cmd/None'], ['bioconda_recipes/ale/cmd/20180904']),
+        conflict(['bioconda_recipes/ale-core/cmd/1.0', 'missing/tool/cmd/1'], ['biotools/ale/cmd/None']),
+    ]
+
+    loader.prefetch_conflicts(conflicts)
+    assert adapter.fetch_entries.call_count == 2
+
+    full = utils.replace_with_full_entries(conflicts[1])
+    filtered = utils.filter_relevant_fields({'disconnected': full['disconnected'][:1], 'remaining': full['remaining']})
+
+    assert full['disconnected'][1] is None
+    assert filtered['disconnected'][0]['publication'] == [{'title': 'ALE-core paper'}, {'title': 'inline'}]
+    assert filtered['remaining'][0]['publication'] == [{'title': 'ALE paper'}]
+    # everything was served from the prefetched documents, including the missing entry
+    assert adapter.fetch_entries.call_count == 2
+
+
+def test_publications_can_be_requested_by_string_id(adapter):
+    loader = EntryLoader(adapter)
+    publication_id = adapter.db[PUBLICATIONS].find_one({'data.title': 'ALE paper'})['_id']
+
+    assert loader.get(PUBLICATIONS, str(publication_id))['data'] == {'title': 'ALE paper'}
+    assert loader.get(PUBLICATIONS, publication_id)['data'] == {'title': 'ALE paper'}
+    assert adapter.fetch_entries.call_count == 1
+
+
+def test_cache_is_bounded(adapter):
+    loader = EntryLoader(adapter, max_size=2)
+    ids = ['biotools/ale/cmd/None', 'bioconda_recipes/ale/cmd/20180904', 'bioconda_recipes/ale-core/cmd/1.0']
+
+    assert [entry['data']['name'] for entry in loader.get_many(PRETOOLS, ids)] == ['ale', 'ale', 'ale-core']
+    assert len(loader.cache) == 2
+
+    loader.get(PRETOOLS, ids[0])
+    assert adapter.fetch_entries.call_count == 2
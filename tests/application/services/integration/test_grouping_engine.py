@@ -0,0 +1,88 @@
+import copy
+from src.application.services.integration.group_entries import group_by_key_with_links
+from src.application.services.integration.grouping_engine import DisjointSet, GroupingEngine, iter_group_blocks
+from src.application.services.integration.entries_recovery import recover_shared_name_link
+
+
+def entry(_id, name, type=None, repository=(), webpage=()):
+    return {
+        '_id': _id,
+        'data': {
+            'name': name,
+            'type': type,
+            'repository': [{'url': url} for url in repository],
+            'webpage': list(webpage),
+        }
+    }
+
+
+def test_disjoint_set():
+    sets = DisjointSet()
+    nodes = [sets.add() for _ in range(5)]
+    sets.union(nodes[3], nodes[4])
+    sets.union(nodes[1], nodes[4])
+    assert sets.find(nodes[1]) == sets.find(nodes[3])
+    assert sets.find(nodes[0]) != sets.find(nodes[1])
+    assert sets.smallest[sets.find(nodes[4])] == 1
+
+
+def test_groups_by_name_type_and_links():
+    entries = [
+        entry('a', 'Tool', 'cmd', repository=['https://github.com/org/tool']),
+        entry('b', 'other', 'lib', repository=['https://gitlab.com/org/other']),
+        entry('c', 'tool', 'cmd'),
+        entry('d', 'tool-web', 'web', webpage=['http://github.com/org/tool/']),
+        # links "other" and "tool" groups through the last entry
+        entry('e', 'bridge', 'lib', repository=['https://gitlab.com/org/other', 'https://github.com/org/tool']),
+        entry('f', 'unrelated', None, webpage=['https://example.org/unrelated']),
+    ]
+
+    groups = group_by_key_with_links(entries)
+
+    assert list(groups) == ['tool/cmd', 'unrelated/*']
+    assert [inst['_id'] for inst in groups['tool/cmd']['instances']] == ['a', 'b', 'c', 'd', 'e']
+    assert groups['tool/cmd']['links'] == {'github.com/org/tool', 'gitlab.com/org/other'}
+    assert groups['tool/cmd']['instances'][3]['normalized_links'] == {'repository': [], 'webpage': ['github.com/org/tool']}
+    # non-repository webpages are not used to group
+    assert groups['unrelated/*']['links'] == set()
+
+
+def test_recovery_on_group_members_matches_full_documents():
+    entries = [
+        entry('1', 'tool', 'cmd', webpage=['https://tool.org/']),
+        entry('2', 'tool', 'lib', webpage=['http://tool.org']),
+        entry('3', 'tool', 'web', webpage=['https://tool.org/docs']),
+        entry('4', 'tool', None, repository=['https://github.com/org/tool'], webpage=['https://tool.org/docs']),
+        entry('5', 'other', 'cmd', webpage=['https://other.org']),
+        entry('6', 'other', 'lib', webpage=['https://other.org/']),
+    ]
+    engine = GroupingEngine()
+    engine.add_all(copy.deepcopy(entries))
+
+    members = recover_shared_name_link(engine.groups(), shared_links=engine.shared_links())
+    full = recover_shared_name_link(group_by_key_with_links(copy.deepcopy(entries)))
+
+    assert list(members) == list(full) == ['tool/*', 'other/*']
+    assert {key: group['instances'] for key, group in members.items()} == {
+        key: [instance['_id'] for instance in group['instances']] for key, group in full.items()
+    }
+
+
+def test_group_blocks_are_fetched_in_batches():
+    documents = {str(i): entry(str(i), f'tool{i}', 'cmd', repository=[f'https://github.com/org/tool{i}']) for i in range(5)}
+    groups = {'a/cmd': {'instances': ['0', '1']}, 'b/cmd': {'instances': ['2', 'missing']}, 'c/cmd': {'instances': ['3', '4']}}
+    queries = []
+
+    def fetch_documents(ids):
+        queries.append(ids)
+        return [documents[i] for i in ids if i in documents]
+
+    blocks = iter_group_blocks(groups, fetch_documents, batch_size=3)
+
+    assert next(blocks)[0] == 'a/cmd'
+    assert queries == [['0', '1', '2', 'missing']]
+    blocks = [('a/cmd', None)] + list(blocks)
+    assert [key for key, _ in blocks] == ['a/cmd', 'b/cmd', 'c/cmd']
+    assert queries == [['0', '1', '2', 'missing'], ['3', '4']]
+    assert [instance['_id'] for instance in blocks[1][1]['instances']] == ['2']
+    assert blocks[2][1]['instances'][0]['normalized_links'] == {'repository': ['github.com/org/tool3'], 'webpage': []}
@@ -0,0 +1,34 @@
+from src.application.services.integration.disambiguation.html_text import html_to_markdown
+
+PAGE = """<?xml version="1.0" encoding="utf-8"?>
+<html>
+<head><title>MyTool</title><style>p { color: red; }</style></head>
+<body>
+  <nav><a href="/">Home</a></nav>
+  <h1>MyTool</h1>
+  <div>
+    <p>MyTool <b>aligns</b> short reads
+       to a <em>reference</em>. See the <a href="https://mytool.org/docs">documentation</a>.</p>
+    <!-- a comment -->
+    <ul><li>Fast</li><li>Accurate <a href="/cite">cite</a></li></ul>
+    <p><a href="https://github.com/org/mytool"></a></p>
+    <script>var x = 1;</script>
+  </div>
+  <footer>Copyright</footer>
+</body>
+</html>"""
+
+
+def test_html_to_markdown():
+    assert html_to_markdown(PAGE) == "\n".join([
+        "# MyTool",
+        "MyTool **aligns** short reads to a _reference_. See the [documentation](https://mytool.org/docs).",
+        "* Fast",
+        "* Accurate cite",
+        "<https://github.com/org/mytool>",
+    ])
+
+
+def test_html_to_markdown_of_empty_or_deeply_nested_pages():
+    assert html_to_markdown("") == ""
+    assert html_to_markdown("<div>" * 250 + "deep" + "</div>" * 250) == "deep"
@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+from collections import Counter
+from src.application.services.integration.disambiguation import enrich_links
+from src.application.services.integration.disambiguation.link_enrichment import LinkEnricher, LinkCache
+
+
+@pytest.mark.asyncio
+async def test_links_are_enriched_once_with_per_host_limit(monkeypatch, tmp_path):
+    calls = Counter()
+    in_flight = Counter()
+    max_in_flight = Counter()
+
+    async def mock_enrich_link(link):
+        host = link.split('/')[2]
+        calls[link] += 1
+        in_flight[host] += 1
+        max_in_flight[host] = max(max_in_flight[host], in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return {'url': link, 'content': f'content of {link}'} if 'empty' not in link else {'url': link}
+
+    monkeypatch.setattr(enrich_links, "enrich_link", mock_enrich_link)
+
+    cache = LinkCache(str(tmp_path / "links.sqlite"))
+    enricher = LinkEnricher(cache, max_concurrent=8, max_per_host=2)
+    block_1 = [f"https://github.com/org/tool{i}" for i in range(5)] + ["https://example.org/empty", ""]
+    block_2 = ["https://github.com/org/tool0", "https://example.org/page"]
+
+    results_1, results_2 = await asyncio.gather(enricher.enrich_many(block_1), enricher.enrich_many(block_2))
+
+    assert list(results_1) == block_1[:-1]
+    assert results_2["https://github.com/org/tool0"]["content"] == "content of https://github.com/org/tool0"
+    assert all(count == 1 for count in calls.values())
+    assert max_in_flight["github.com"] == 2
+
+    # a later run reuses the cached links, except those without content
+    await LinkEnricher(LinkCache(str(tmp_path / "links.sqlite"))).enrich_many(block_1)
+    assert calls["https://github.com/org/tool0"] == 1
+    assert calls["https://example.org/empty"] == 2
+
+
+@pytest.mark.asyncio
+async def test_only_uncached_results_are_kept_and_failures_are_retried(monkeypatch, tmp_path):
+    calls = Counter()
+
+    async def mock_enrich_link(link):
+        calls[link] += 1
+        if "down" in link and calls[link] == 1:
+            raise ConnectionError(link)
+        return {"url": link, "content": "text"} if "empty" not in link else {"url": link}
+
+    monkeypatch.setattr(enrich_links, "enrich_link", mock_enrich_link)
+    enricher = LinkEnricher(LinkCache(str(tmp_path / "links.sqlite")), max_kept=2)
+
+    with pytest.raises(ConnectionError):
+        await enricher.enrich("https://example.org/down")
+    assert (await enricher.enrich("https://example.org/down"))["content"] == "text"
+
+    await enricher.enrich_many(["https://example.org/page", "https://example.org/empty1", "https://example.org/empty2"])
+    await enricher.enrich("https://example.org/empty3")
+
+    # cached results are read from the link cache, and at most 2 uncached results are kept
+    assert list(enricher.tasks) == ["https://example.org/empty2", "https://example.org/empty3"]
+    await enricher.enrich_many(["https://example.org/page", "https://example.org/empty3", "https://example.org/empty1"])
+    assert calls == {
+        "https://example.org/down": 2,
+        "https://example.org/page": 1,
+        "https://example.org/empty1": 2,
+        "https://example.org/empty2": 1,
+        "https://example.org/empty3": 1,
+    }
+
+
+def test_link_cache_ttl(tmp_path, monkeypatch):
+    cache = LinkCache(str(tmp_path / "links.sqlite"), ttl=60)
+    cache.set("https://example.org", {"content": "text"})
+    assert cache.get("https://example.org") == {"content": "text"}
+
+    now = __import__("time").time()
+    monkeypatch.setattr("time.time", lambda: now + 120)
+    assert cache.get("https://example.org") is None
+    assert cache.stats == {"hits": 1, "misses": 1}
@@ -0,0 +1,110 @@
+import os
+import json
+import pytest
+from src.application.services.integration.disambiguation import record_store
+from src.application.services.integration.disambiguation.utils import load_dict_from_jsonl, add_jsonl_record, update_jsonl_record, remove_jsonl_record, export_jsonl
+from src.application.services.integration.disambiguation.secondary_round import generate_secondary_conflicts, save_secondary_conflicts
+
+
+def write_lines(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_point_updates_append_to_the_file(tmp_path):
+    path = tmp_path / "blocks.jsonl"
+    write_lines(path, [{"a/cmd": 1}, {"b/cmd": 2}, {"c/cmd": 3}])
+    inode = os.stat(path).st_ino
+    assert load_dict_from_jsonl(str(path)) == {"a/cmd": 1, "b/cmd": 2, "c/cmd": 3}
+
+    update_jsonl_record(str(path), "b/cmd", {"resolution": "partial"})
+    add_jsonl_record(str(path), {"d/cmd": 4})
+    remove_jsonl_record(str(path), "a/cmd")
+    remove_jsonl_record(str(path), "missing/cmd")
+
+    expected = {"b/cmd": {"resolution": "partial"}, "c/cmd": 3, "d/cmd": 4}
+    assert load_dict_from_jsonl(str(path)) == expected
+    assert os.stat(path).st_ino == inode
+    assert len(path.read_text().splitlines()) == 6
+
+    # a fresh store (e.g. another process) reads the same records
+    assert record_store.JsonlRecordStore(str(path)).load() == expected
+
+    export_jsonl(str(path))
+    assert [json.loads(line) for line in path.read_text().splitlines()] == [{"b/cmd": {"resolution": "partial"}}, {"c/cmd": 3}, {"d/cmd": 4}]
+    assert load_dict_from_jsonl(str(path)) == expected
+
+
+def test_lines_appended_by_other_writers_are_read_incrementally(tmp_path):
+    path = tmp_path / "disambiguated_blocks.jsonl"
+    write_lines(path, [{"a/cmd": 1}])
+    store = record_store.JsonlRecordStore(str(path))
+    assert store.load() == {"a/cmd": 1}
+
+    with open(path, "a") as f:
+        f.write(json.dumps({"b/cmd": 2}) + '\n{"c/cm')
+    assert store.load() == {"a/cmd": 1, "b/cmd": 2}
+
+    # the incomplete line is dropped before appending
+    store.add({"c/cmd": 3})
+    assert store.load() == {"a/cmd": 1, "b/cmd": 2, "c/cmd": 3}
+    assert record_store.JsonlRecordStore(str(path)).load() == store.load()
+
+    # the file is replaced
+    write_lines(path, [{"z/cmd": 0}])
+    assert store.load() == {"z/cmd": 0}
+
+
+def test_stale_logs_are_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(record_store, "COMPACTION_MIN_STALE_RECORDS", 5)
+    path = tmp_path / "conflict_blocks.jsonl"
+    store = record_store.JsonlRecordStore(str(path))
+    store.add({"a/cmd": 0, "b/cmd": 0})
+    store.load()
+
+    for i in range(1, 7):
+        store.update("a/cmd", i)
+
+    assert store.load() == {"a/cmd": 6, "b/cmd": 0}
+    # the records are not copied on every load
+    assert store.load() is store.load()
+    assert len(path.read_text().splitlines()) < 7
+    assert record_store.JsonlRecordStore(str(path)).load() == {"a/cmd": 6, "b/cmd": 0}
+
+
+def test_load_of_a_missing_file_fails(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_dict_from_jsonl(str(tmp_path / "missing.jsonl"))
+
+
+def test_secondary_conflicts_are_saved_by_key(tmp_path):
+    conflict_blocks_path = tmp_path / "conflict_blocks.jsonl"
+    blocks_path = tmp_path / "blocks.jsonl"
+    write_lines(conflict_blocks_path, [{"ale/cmd": {"disconnected": [], "remaining": []}}])
+    write_lines(blocks_path, [{"ale/cmd": {"instances": []}}])
+
+    secondary_conflict, secondary_block = generate_secondary_conflicts({"ale/cmd": {"resolution": "partial", "unmerged_entries": ["x", "y"]}})
+    save_secondary_conflicts(secondary_conflict, secondary_block, str(conflict_blocks_path), str(blocks_path))
+
+    conflict_blocks = load_dict_from_jsonl(str(conflict_blocks_path))
+    assert conflict_blocks["ale/cmd_secondary_1"]["remaining"] == [{"id": "x"}]
+    assert conflict_blocks["ale/cmd_secondary_1"]["disconnected"] == [{"id": "y"}]
+    assert load_dict_from_jsonl(str(blocks_path))["ale/cmd_secondary_1"]["instances"] == [{"_id": "x"}, {"_id": "y"}]
+
+
+def test_tail_is_repaired_once_per_file(tmp_path, mocker):
+    path = tmp_path / "records.jsonl"
+    path.write_bytes(b'{"a/cmd": 1}\n{"b/cm')
+    repair = mocker.spy(record_store, "repair_jsonl_tail")
+    store = record_store.JsonlRecordStore(str(path))
+
+    for i in range(3):
+        store.update("c/cmd", i)
+    assert repair.call_count == 1
+    assert store.load() == {"a/cmd": 1, "c/cmd": 2}
+
+    # a replaced file is repaired again
+    os.replace(str(path), str(tmp_path / "old.jsonl"))
+    path.write_bytes(b'{"d/cmd": 1}')
+    store.update("c/cmd", 3)
+    assert repair.call_count == 2
+    assert store.load() == {"d/cmd": 1, "c/cmd": 3}
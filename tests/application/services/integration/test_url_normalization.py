@@ -0,0 +1,39 @@
+import pytest
+from src.application.services.integration.url_normalization import normalize_url, normalized_links, add_normalized_links, instance_links
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/Org/Tool/", "github.com/Org/Tool"),
+    ("https://github.com/org/tool.git", "github.com/org/tool"),
+    ("http://www.gitlab.com/org/tool", "gitlab.com/org/tool"),
+    ("https://github.com", "github.com"),
+    ("https://bioconductor.org/packages/release/bioc/html/limma.html", "bioconductor.org/packages/limma"),
+    ("https://pypi.org/project/tool/1.0/", "pypi.org/project/tool"),
+    ("https://pypi.python.org/pypi/tool", "pypi.org/project/tool"),
+    ("https://cran.r-project.org/web/packages/tool/index.html", "cran.r-project.org/package/tool"),
+    ("https://cran.r-project.org/package=tool", "cran.r-project.org/package/tool"),
+    ("https://Example.org/docs/index.html?x=1#top", "example.org/docs/index"),
+    ("", None),
+    (None, None),
+])
+def test_normalize_url(url, expected):
+    assert normalize_url(url) == expected
+
+
+def test_normalized_links_are_cached():
+    normalize_url.cache_clear()
+    instance = {'data': {'repository': [{'url': 'https://github.com/org/tool'}, {'kind': 'github'}], 'webpage': ['https://tool.org/', None]}}
+
+    assert normalized_links(instance) == ({'github.com/org/tool'}, {'tool.org'})
+    normalized_links(instance)
+    assert normalize_url.cache_info().hits == 2
+
+
+def test_stored_links_are_not_normalized_again():
+    instance = {'data': {'repository': [{'url': 'https://github.com/org/tool.git'}], 'webpage': ['https://tool.org/']}}
+    assert add_normalized_links(instance) == ({'github.com/org/tool'}, {'tool.org'})
+    assert instance['normalized_links'] == {'repository': ['github.com/org/tool'], 'webpage': ['tool.org']}
+
+    normalize_url.cache_clear()
+    assert instance_links(instance) == ({'github.com/org/tool'}, {'tool.org'})
+    assert normalize_url.cache_info().misses == 0
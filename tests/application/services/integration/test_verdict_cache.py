@@ -0,0 +1,35 @@
+from src.application.services.integration.disambiguation import verdict_cache
+from src.application.services.integration.disambiguation.verdict_cache import VerdictCache, cached_model_query, verdict_cache_key
+
+
+messages = [{"role": "user", "content": "Are these the same tool? "}]
+
+
+def test_key_depends_on_model_messages_and_parameters():
+    key = verdict_cache_key("model-a", messages, 0.2, provider="together")
+
+    assert key == verdict_cache_key("model-a", [{"role": "user", "content": "Are these the same tool?"}], 0.2, provider="together")
+    assert key != verdict_cache_key("model-b", messages, 0.2, provider="together")
+    assert key != verdict_cache_key("model-a", messages, 0.7, provider="together")
+    assert key != verdict_cache_key("model-a", messages, 0.2, provider="other")
+
+
+def test_cached_model_query(monkeypatch, tmp_path):
+    cache = VerdictCache(str(tmp_path / "verdicts.sqlite"))
+    monkeypatch.setattr(verdict_cache, "get_verdict_cache", lambda: cache)
+    calls = []
+
+    @cached_model_query(temperature=0.2)
+    def query(messages, model):
+        calls.append(model)
+        return ('{"verdict": "Same"}', {"provider": "test"}) if model != "empty" else ('', {})
+
+    assert query(messages, model="model-a") == ('{"verdict": "Same"}', {"provider": "test"})
+    assert query(messages, model="model-a") == ('{"verdict": "Same"}', {"provider": "test"})
+    # empty answers are not cached
+    query(messages, model="empty")
+    query(messages, model="empty")
+
+    assert calls == ["model-a", "empty", "empty"]
+    assert cache.stats == {"hits": 1, "misses": 3}
+    assert len(VerdictCache(str(tmp_path / "verdicts.sqlite"))) == 1
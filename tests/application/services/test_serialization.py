@@ -0,0 +1,58 @@
+import pytest
+from datetime import datetime
+from bson import ObjectId, json_util
+from src.application.services import serialization
+
+BACKENDS = ["json"] + (["orjson"] if serialization.orjson is not None else [])
+
+RECORD = {
+    "trimal/cmd": {
+        "_id": ObjectId("64a7f0c2e4b0a1a2b3c4d5e6"),
+        "updated": datetime(2024, 5, 1, 12, 30),
+        "name": "trimAl – alignment trimming",
+        "scores": [1, 2.5, None, True],
+    }
+}
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    monkeypatch.setattr(serialization, "BACKEND", request.param)
+    return request.param
+
+
+def test_bson_types_are_written_as_extended_json(backend):
+    data = serialization.loads(serialization.dumpb(RECORD))
+    assert data["trimal/cmd"]["_id"] == {"$oid": "64a7f0c2e4b0a1a2b3c4d5e6"}
+    assert data["trimal/cmd"]["updated"] == {"$date": "2024-05-01T12:30:00Z"}
+    assert data["trimal/cmd"]["name"] == "trimAl – alignment trimming"
+    # the same as what bson.json_util writes, read back with the stdlib
+    assert json_util.loads(serialization.dumps(RECORD)) == json_util.loads(json_util.dumps(RECORD))
+
+
+def test_backends_produce_the_same_output(monkeypatch):
+    outputs = set()
+    for name in BACKENDS:
+        monkeypatch.setattr(serialization, "BACKEND", name)
+        outputs.add((serialization.dumpb(RECORD), serialization.dumps(RECORD, indent=True, sort_keys=True)))
+    assert len(outputs) == 1
+
+
+def test_default_and_unsupported_values(backend):
+    assert serialization.loads(serialization.dumps({"path": {1, 2}}, default=sorted)) == {"path": [1, 2]}
+    with pytest.raises(TypeError):
+        serialization.dumps({"path": {1, 2}})
+    # integers over 64 bits are not supported by orjson
+    assert serialization.dumps({"n": 2 ** 70}) == '{"n":1180591620717411303424}'
+
+
+def test_files_in_text_and_binary_mode(backend, tmp_path):
+    with open(tmp_path / "binary.json", "wb") as binary, open(tmp_path / "text.json", "w", encoding="utf-8") as text:
+        serialization.dump({"a": 1}, binary)
+        serialization.dump({"a": 1}, text)
+    assert (tmp_path / "binary.json").read_text() == (tmp_path / "text.json").read_text() == '{"a":1}'
+    with open(tmp_path / "binary.json", "rb") as f:
+        assert serialization.load(f) == {"a": 1}
+
+    with pytest.raises(serialization.JSONDecodeError):
+        serialization.loads(b'{"a": ')
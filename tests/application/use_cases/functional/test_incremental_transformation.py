@@ -0,0 +1,79 @@
+from src.application.use_cases.transformation.incremental import IncrementalTransformation, compute_content_hash
+
+
+def raw_entry(name, description, last_updated_at):
+    return {
+        '_id': f'biotools/{name}/cmd/None',
+        '@data_source': 'biotools',
+        '@last_updated_at': last_updated_at,
+        'data': {'name': name, 'description': description}
+    }
+
+
+def pretools_entry(raw, content_hash):
+    return {
+        '_id': raw['_id'],
+        'source': [{
+            'collection': 'alambiqueDev',
+            'id': raw['_id'],
+            'data_source': 'biotools',
+            'content_hash': content_hash
+        }]
+    }
+
+
+def test_content_hash_ignores_importer_bookkeeping():
+    entry = raw_entry('trimal', 'Alignment trimming', '2025-01-01T00:00:00Z')
+    refreshed = {**entry, '@last_updated_at': '2025-02-01T00:00:00Z', '@updated_by': 'importer'}
+    changed = raw_entry('trimal', 'Alignment trimming tool', '2025-01-01T00:00:00Z')
+
+    assert compute_content_hash(entry) == compute_content_hash(refreshed)
+    assert compute_content_hash(entry) != compute_content_hash(changed)
+
+
+def test_incremental_transformation(mongo_adapter):
+    unchanged = raw_entry('trimal', 'Alignment trimming', '2025-01-01T00:00:00Z')
+    changed = raw_entry('mafft', 'Multiple alignment', '2025-01-03T00:00:00Z')
+    new = raw_entry('muscle', 'Multiple alignment', '2025-01-02T00:00:00Z')
+    deleted = raw_entry('clustal', 'Multiple alignment', '2024-01-01T00:00:00Z')
+
+    mongo_adapter.db['alambiqueDev'].insert_many([unchanged, changed, new])
+    mongo_adapter.db['pretoolsDev'].insert_many([
+        pretools_entry(unchanged, compute_content_hash(unchanged)),
+        pretools_entry(changed, 'outdated-hash'),
+        pretools_entry(deleted, compute_content_hash(deleted)),
+    ])
+
+    tracker = IncrementalTransformation('biotools', mongo_adapter)
+    assert tracker.watermark is None
+
+    to_transform = tracker.changed_entries([unchanged, changed, new])
+    assert [entry['_id'] for entry in to_transform] == [changed['_id'], new['_id']]
+
+    stats = tracker.finish()
+    assert stats == {'read': 3, 'changed': 1, 'new': 1, 'unchanged': 1, 'deleted': 1}
+
+    # The next run only reads entries updated after the latest '@last_updated_at' seen
+    next_tracker = IncrementalTransformation('biotools', mongo_adapter)
+    assert next_tracker.watermark == '2025-01-03T00:00:00Z'
+
+
+def test_finish_only_reads_raw_ids(mongo_adapter, monkeypatch):
+    entries = [raw_entry(f'tool{i}', 'A tool', '2025-01-01T00:00:00Z') for i in range(3)]
+    mongo_adapter.db['alambiqueDev'].insert_many(entries)
+    tracker = IncrementalTransformation('biotools', mongo_adapter)
+    tracker.changed_entries(entries)
+
+    read = []
+    fetch_page = mongo_adapter._fetch_page
+
+    def recording_fetch_page(collection_name, *args, **kwargs):
+        documents = fetch_page(collection_name, *args, **kwargs)
+        read.extend((collection_name, set(document)) for document in documents)
+        return documents
+
+    monkeypatch.setattr(mongo_adapter, '_fetch_page', recording_fetch_page)
+    tracker.finish()
+
+    raw_reads = [fields for collection_name, fields in read if collection_name == 'alambiqueDev']
+    assert raw_reads == [{'_id'}] * 3
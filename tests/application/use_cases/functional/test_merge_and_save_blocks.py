@@ -0,0 +1,102 @@
+import json
+import pytest
+from src.application.use_cases.integration import merge_entries
+from src.application.use_cases.integration.merge_entries import merge_and_save_blocks, tool_id
+
+
+def pretools_entry(name, type_, version):
+    return {
+        "_id": f"biotools/{name}/{type_}/{version}",
+        "data": {"name": name, "type": type_, "version": [version]},
+    }
+
+
+ENTRIES = [
+    pretools_entry("trimal", "cmd", "1.4"),
+    pretools_entry("trimal", "web", "1.4"),
+    pretools_entry("fastqc", "cmd", "0.11"),
+    pretools_entry("fastqc", "lib", "0.12"),
+    pretools_entry("fastqc", "web", "0.11"),
+    pretools_entry("blast", "cmd", "2.0"),
+]
+
+BLOCKS = {
+    "trimal/cmd": {"resolution": "merged", "merged_entries": [ENTRIES[0]["_id"], ENTRIES[1]["_id"]], "unmerged_entries": []},
+    "fastqc/cmd": {"resolution": "partial", "merged_entries": [ENTRIES[2]["_id"], ENTRIES[4]["_id"]], "unmerged_entries": [ENTRIES[3]["_id"]]},
+    "blast/cmd": {"resolution": "unclear", "merged_entries": [], "unmerged_entries": [ENTRIES[5]["_id"]]},
+}
+
+
+@pytest.fixture
+def adapter(mongo_adapter, monkeypatch):
+    # mongomock 4.3.0 bulk_write fails with recent pymongo versions (their UpdateOne passes a `sort`
+    # argument that mongomock does not accept), so upserts are emulated
+    adapter = mongo_adapter
+    adapter.db["pretoolsDev"].insert_many(ENTRIES)
+    adapter.bulk_writes = []
+
+    def bulk_upsert(collection_name, documents, insert_only_fields=()):
+        adapter.bulk_writes.append(len(documents))
+        summary = {"matched": 0, "modified": 0, "upserted": 0, "failed": 0}
+        for document in documents:
+            document = dict(document)
+            identifier = document.pop("_id")
+            result = adapter.db[collection_name].update_one(
+                {"_id": identifier},
+                {
+                    "$set": {k: v for k, v in document.items() if k not in insert_only_fields},
+                    "$setOnInsert": {k: v for k, v in document.items() if k in insert_only_fields},
+                },
+                upsert=True,
+            )
+            summary["matched"] += result.matched_count
+            summary["upserted"] += result.upserted_id is not None
+        return summary
+
+    monkeypatch.setattr(adapter, "bulk_upsert", bulk_upsert)
+    monkeypatch.setattr(merge_entries, "get_mongo_adapter", lambda: adapter)
+    return adapter
+
+
+@pytest.fixture
+def blocks_file(tmp_path):
+    path = tmp_path / "disambiguated_blocks.jsonl"
+    path.write_text("".join(json.dumps({key: block}) + "\n" for key, block in BLOCKS.items()))
+    return str(path)
+
+
+def test_tool_id_is_deterministic():
+    assert tool_id(["a", "b"]) == tool_id(["b", "a"])
+    assert tool_id(["a", "b"]) != tool_id(["a"])
+    assert len(tool_id(["a"])) == 24
+
+
+def test_blocks_are_merged_in_batches(adapter, blocks_file, mocker):
+    fetch = mocker.spy(adapter, "fetch_entries")
+
+    summary = merge_and_save_blocks(blocks_file, batch_size=2)
+
+    assert summary["N"] == 3
+    assert summary["n_processed"] == 2
+    assert summary["n_unclear"] == 1
+    assert summary["n_inserted_entries"] == 3
+    assert summary["n_new_tools"] == 3
+    # one query and one bulk write per batch (the second batch has no blocks to save)
+    assert fetch.call_count == 1
+    assert adapter.bulk_writes == [3]
+
+    tools = {tool["_id"]: tool for tool in adapter.db["toolsDev"].find()}
+    trimal = tools[tool_id(BLOCKS["trimal/cmd"]["merged_entries"])]
+    assert set(trimal["data"]["type"]) == {"cmd", "web"}
+    assert tools[tool_id([ENTRIES[3]["_id"]])]["data"]["type"] == ["lib"]
+
+
+def test_rerun_updates_tools_instead_of_duplicating_them(adapter, blocks_file):
+    merge_and_save_blocks(blocks_file, batch_size=2)
+    created = {tool["_id"]: tool["created_at"] for tool in adapter.db["toolsDev"].find()}
+
+    summary = merge_and_save_blocks(blocks_file, batch_size=10, workers=2)
+
+    assert summary["n_new_tools"] == 0
+    assert summary["n_updated_tools"] == 3
+    assert {tool["_id"]: tool["created_at"] for tool in adapter.db["toolsDev"].find()} == created
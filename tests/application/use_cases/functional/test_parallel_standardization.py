@@ -0,0 +1,44 @@
+from concurrent.futures import ProcessPoolExecutor
+from src.application.use_cases.transformation.standardization import standardize_page, standardize_pages
+
+
+def galaxy_metadata_entry(tool_id, version):
+    return {
+        '_id': f'galaxy_metadata/{tool_id}/cmd/{version}',
+        'data': {
+            '@data_source': 'galaxy_metadata',
+            'dependencies': ['R/3.2.1'],
+            'id': tool_id,
+            'name': tool_id.replace('_', ' ').title(),
+            'version': version
+        }
+    }
+
+
+pages = [
+    [galaxy_metadata_entry(f'tool_{page}_{i}', '1.0') for i in range(3)]
+    for page in range(5)
+]
+
+
+def test_standardize_page():
+    standardized = standardize_page(pages[0], 'galaxy_metadata')
+
+    assert len(standardized) == 3
+    assert [instances[0]['name'] for instances in standardized] == ['tool_0_0', 'tool_0_1', 'tool_0_2']
+    assert standardized[0][0]['source'] == ['galaxy_metadata']
+
+
+def test_standardize_page_without_identifier():
+    entry = galaxy_metadata_entry('tool', '1.0')
+    del entry['_id']
+    assert standardize_page([entry], 'galaxy_metadata') == [[]]
+
+
+def test_standardize_pages_in_pool_keeps_order():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = list(standardize_pages(executor, iter(pages), 'galaxy_metadata', max_pending=2))
+
+    assert [page for page, _ in results] == pages
+    for page, standardized in results:
+        assert standardized == standardize_page(page, 'galaxy_metadata')
@@ -0,0 +1,39 @@
+import pytest
+from src.infrastructure.db.mongo.publications_repository import PublicationsMetadataRepository
+from src.application.use_cases.transformation.publication_resolver import PublicationIdentityResolver
+
+
+@pytest.fixture
+def repo(mongo_adapter):
+    adapter = mongo_adapter
+    repo = PublicationsMetadataRepository(adapter)
+    adapter.db[repo.collection_name].insert_many([
+        {'_id': 'pub1', 'data': {'doi': '10.1093/Bioinformatics/btq123', 'title': 'A tool for things', 'pmid': '123'}},
+        {'_id': 'pub2', 'data': {'title': 'Another  tool.', 'url': 'https://example.org/paper'}},
+    ])
+    return repo
+
+
+def test_resolves_preloaded_publications(repo, mocker):
+    resolver = PublicationIdentityResolver(repo)
+    find = mocker.spy(repo, 'find_by_identifiers')
+
+    assert resolver.resolve({'doi': '10.1093/bioinformatics/btq123'}) == 'pub1'
+    assert resolver.resolve({'title': 'another tool'}) == 'pub2'
+    assert resolver.resolve({'pmid': '123', 'title': 'Unknown'}) == 'pub1'
+    assert find.call_count == 0
+    assert resolver.stats['hits'] == 3
+
+
+def test_fallback_and_register(repo):
+    resolver = PublicationIdentityResolver(repo)
+    resolver.load()
+
+    # inserted by someone else after the index was loaded
+    repo.db_adapter.db[repo.collection_name].insert_one({'_id': 'pub3', 'data': {'pmcid': 'PMC42'}})
+    assert resolver.resolve({'pmcid': 'PMC42'}) == 'pub3'
+    assert resolver.stats['fallback_hits'] == 1
+
+    assert resolver.resolve({'doi': '10.1000/new'}) is None
+    resolver.register({'doi': '10.1000/new'}, 'pub4')
+    assert resolver.resolve({'doi': '10.1000/NEW'}) == 'pub4'
@@ -0,0 +1,11 @@
+import mongomock
+import pytest
+from src.infrastructure.db.mongo.mongo_adapter import MongoDBAdapter
+
+
+@pytest.fixture
+def mongo_adapter():
+    # Adapter without a real connection, on an in-memory mongomock database
+    adapter = MongoDBAdapter.__new__(MongoDBAdapter)
+    adapter.db = mongomock.MongoClient()['test']
+    return adapter
@@ -0,0 +1,50 @@
+from src.domain.models.software_instance.edam_index import EDAMIndex, get_edam_index, edam_branch
+from src.domain.models.software_instance.topic_operation import vocabulary_operation
+from src.domain.models.software_instance.data_format import data_format
+
+
+def test_lookup_is_case_insensitive_and_first_match_wins():
+    index = EDAMIndex({
+        'Class ID': 'Preferred Label',
+        'http://edamontology.org/data_0863': 'Sequence alignment',
+        'http://edamontology.org/operation_0292': 'Sequence alignment',
+    }, synonyms={'http://edamontology.org/operation_0292': ['Sequence aligning']})
+
+    assert index.uri('  sequence ALIGNMENT') == 'http://edamontology.org/data_0863'
+    assert index.uri('Sequence alignment', 'operation') == 'http://edamontology.org/operation_0292'
+    assert index.uri('sequence aligning') == 'http://edamontology.org/operation_0292'
+    assert index.uri('Preferred Label') is None
+    assert index.label('http://edamontology.org/data_0863') == 'Sequence alignment'
+
+
+def test_edam_branch():
+    assert edam_branch('http://edamontology.org/format_1929') == 'format'
+    assert edam_branch('http://www.w3.org/2002/07/owl#DeprecatedClass') is None
+
+
+def test_models_use_the_shared_index():
+    assert get_edam_index() is get_edam_index()
+
+    operation = vocabulary_operation(term='sequence alignment')
+    assert str(operation.uri) == 'http://edamontology.org/operation_0292'
+
+    assert data_format.mapEDAMDict('fasta') == ('http://edamontology.org/format_1929', 'FASTA', 'EDAM')
+
+
+def test_refresh_from_release_csv(tmp_path):
+    from src.domain.models.software_instance.EDAM_forFE import refresh_EDAM_data, load_EDAM_data
+
+    release = tmp_path / 'EDAM_9.99.csv'
+    release.write_text(
+        'Class ID,Preferred Label,Synonyms\n'
+        'http://edamontology.org/topic_0121,Proteomics,Protein informatics|Proteome analysis\n'
+        'http://edamontology.org/format_1929,FASTA,\n'
+    )
+    path = tmp_path / 'EDAM.json.gz'
+    refresh_EDAM_data('9.99', str(release), path=path)
+
+    data = load_EDAM_data(path)
+    assert data['version'] == '9.99'
+    assert data['labels']['http://edamontology.org/format_1929'] == 'FASTA'
+    index = EDAMIndex(data['labels'], data['synonyms'])
+    assert index.uri('proteome analysis', 'topic') == 'http://edamontology.org/topic_0121'
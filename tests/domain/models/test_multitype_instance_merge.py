@@ -0,0 +1,66 @@
+import copy
+import random
+from src.domain.models.software_instance.multitype_instance import multitype_instance
+
+
+def random_instance(rng):
+    def pick(pool):
+        return rng.sample(pool, rng.randint(0, len(pool)))
+
+    return multitype_instance(
+        name=rng.choice(["trimal", "trimAl"]),
+        type=pick(["cmd", "web", "lib"]),
+        other_names=pick(["trimAl v1", "trimal"]),
+        version=pick(["1.4", "1.5"]),
+        webpage=pick(["https://trimal.cgenomics.org", "https://vicfero.github.io/trimal"]),
+        repository=[{"url": url} for url in pick(["https://github.com/inab/trimal", "https://github.com/scapella/trimal"])],
+        source=pick(["biotools", "bioconda", "galaxy"]),
+        description=pick(["alignment trimming", "Trims alignments."]),
+        https=rng.choice([True, False]),
+        input=[{"vocabulary": "", "term": rng.choice(["FASTA", "BAM"])} for _ in range(rng.randint(0, 2))],
+        documentation=[
+            {"type": rng.choice(["general", "manual"]), "url": "https://trimal.readthedocs.io", "content": rng.choice([None, "Usage"])}
+            for _ in range(rng.randint(0, 2))
+        ],
+        license=[{"name": rng.choice(["GPL-3.0", "MIT"])} for _ in range(rng.randint(0, 2))],
+        authors=[{"name": rng.choice(["Salvador Capella", "Toni Gabaldón"]), "maintainer": rng.choice([True, False])} for _ in range(rng.randint(0, 2))],
+        citation=[
+            {"title": rng.choice(["trimAl", ""]), "year": rng.choice(["2009", ""]), "authors": pick(["Capella", "Gabaldón"])}
+            for _ in range(rng.randint(0, 2))
+        ],
+    )
+
+
+def normalized(merged):
+    # list fields merged as sets have no particular order
+    data = merged.model_dump(mode="json")
+    for field in multitype_instance.UNION_FIELDS + ["other_names"]:
+        data[field] = sorted(map(str, data[field]))
+    for citation in data["citation"]:
+        citation["authors"] = sorted(citation.get("authors", []))
+    return data
+
+
+def test_merge_many_gives_the_same_result_as_pairwise_merges():
+    rng = random.Random(0)
+    for _ in range(100):
+        instances = [random_instance(rng) for _ in range(rng.randint(2, 6))]
+        folded_instances = copy.deepcopy(instances)
+
+        folded = folded_instances[0]
+        for other in folded_instances[1:]:
+            folded = folded.merge(other)
+
+        assert normalized(multitype_instance.merge_many(instances)) == normalized(folded)
+
+
+def test_merge_many_does_not_modify_the_instances():
+    rng = random.Random(1)
+    instances = [random_instance(rng) for _ in range(3)]
+    before = [instance.model_dump() for instance in instances]
+
+    merged = multitype_instance.merge_many(instances)
+
+    assert [instance.model_dump() for instance in instances] == before
+    assert merged.name == instances[0].name
+    assert multitype_instance.merge_many(instances[:1]) is instances[0]
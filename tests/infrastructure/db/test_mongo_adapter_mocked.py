@@ -0,0 +1,102 @@
+import pytest
+from unittest.mock import MagicMock
+from pymongo import UpdateOne
+from src.infrastructure.db.mongo.mongo_adapter import MongoDBAdapter, BulkUpsertWriter
+
+
+@pytest.fixture
+def adapter():
+    # Adapter without a real connection: the database is a mock
+    adapter = MongoDBAdapter.__new__(MongoDBAdapter)
+    adapter.db = MagicMock()
+    adapter.db.__getitem__.return_value.bulk_write.return_value.bulk_api_result = {
+        'nMatched': 1, 'nModified': 1, 'nUpserted': 1, 'writeErrors': []
+    }
+    return adapter
+
+
+def test_bulk_upsert_builds_unordered_upserts(adapter):
+    documents = [
+        {'id': 'biotools/trimal/cmd/1.4', 'created_at': '2025-01-01', 'last_updated_at': '2025-01-01', 'data': {'name': 'trimal'}},
+        {'_id': 'bioconda/trimal/cmd/1.4', 'created_at': '2025-01-01', 'last_updated_at': '2025-01-01', 'data': {'name': 'trimal'}},
+    ]
+    summary = adapter.bulk_upsert('pretoolsDev', documents, insert_only_fields=['created_at'])
+
+    collection = adapter.db.__getitem__.return_value
+    operations = collection.bulk_write.call_args.args[0]
+    assert collection.bulk_write.call_args.kwargs == {'ordered': False}
+    assert operations[0] == UpdateOne(
+        {'_id': 'biotools/trimal/cmd/1.4'},
+        {
+            '$set': {'last_updated_at': '2025-01-01', 'data': {'name': 'trimal'}},
+            '$setOnInsert': {'created_at': '2025-01-01'}
+        },
+        upsert=True
+    )
+    assert operations[1]._filter == {'_id': 'bioconda/trimal/cmd/1.4'}
+    assert summary == {'matched': 1, 'modified': 1, 'upserted': 1, 'failed': 0}
+    # input documents are not modified
+    assert 'id' in documents[0]
+
+
+def test_bulk_upsert_empty(adapter):
+    assert adapter.bulk_upsert('pretoolsDev', [])['upserted'] == 0
+    adapter.db.__getitem__.return_value.bulk_write.assert_not_called()
+
+
+def test_writer_flushes_by_batch_and_deduplicates(adapter):
+    writer = adapter.bulk_writer('pretoolsDev', batch_size=2)
+    assert isinstance(writer, BulkUpsertWriter)
+
+    writer.add({'_id': 'a', 'data': 1})
+    writer.add({'_id': 'a', 'data': 2})
+    assert len(writer) == 1
+
+    writer.add({'_id': 'b', 'data': 3})
+    collection = adapter.db.__getitem__.return_value
+    assert collection.bulk_write.call_count == 1
+    operations = collection.bulk_write.call_args.args[0]
+    assert [op._doc['$set']['data'] for op in operations] == [2, 3]
+    assert len(writer) == 0
+
+    writer.flush()
+    assert collection.bulk_write.call_count == 1
+    assert writer.totals['upserted'] == 1
+
+
+# ---------
+# Pagination
+# ---------
+
+@pytest.fixture
+def paginated_adapter(mongo_adapter):
+    adapter = mongo_adapter
+    adapter.db['alambiqueDev'].insert_many([
+        {'_id': f'biotools/tool_{i:02d}/cmd/1.0', '@data_source': 'biotools' if i % 3 else 'bioconda', 'data': {'name': f'tool_{i:02d}'}}
+        for i in range(25)
+    ])
+    return adapter
+
+
+@pytest.mark.parametrize("keyset", [True, False])
+def test_fetch_paginated_entries(paginated_adapter, keyset):
+    pages = list(paginated_adapter.fetch_paginated_entries('alambiqueDev', {'@data_source': 'biotools'}, page_size=4, keyset=keyset))
+
+    ids = [doc['_id'] for page in pages for doc in page]
+    assert all(len(page) <= 4 for page in pages)
+    assert sorted(ids) == [f'biotools/tool_{i:02d}/cmd/1.0' for i in range(25) if i % 3]
+    assert len(set(ids)) == len(ids)
+
+
+def test_fetch_paginated_entries_projection_keeps_id(paginated_adapter):
+    pages = paginated_adapter.fetch_paginated_entries('alambiqueDev', {}, page_size=10, projection={'_id': 0, 'data': 0})
+    documents = [doc for page in pages for doc in page]
+    assert len(documents) == 25
+    assert all('_id' in doc and 'data' not in doc for doc in documents)
+
+
+def test_fetch_paginated_entries_ids_only(paginated_adapter):
+    pages = paginated_adapter.fetch_paginated_entries('alambiqueDev', {}, page_size=10, projection={'_id': 1})
+    documents = [doc for page in pages for doc in page]
+    assert len(documents) == 25
+    assert all(set(doc) == {'_id'} for doc in documents)